@@ -0,0 +1,21 @@
+// Toplevel of ALU_TEST: the ALU at the width of the datapath, fed by the
+// vector driver. The fields are packed in the order ALU_TEST.py names them.
+module ALU_BENCH;
+
+wire [3:0] control;
+wire CI;
+wire [31:0] DATA_A, DATA_B;
+wire [31:0] OUT;
+wire CO, OVF, N, Z;
+
+Vector_driver #(.IN_WIDTH(69), .OUT_WIDTH(36)) driver(
+    .stimulus({control, CI, DATA_A, DATA_B}),
+    .response({OUT, CO, OVF, N, Z})
+);
+
+ALU #(.WIDTH(32)) uut(
+    .control(control), .CI(CI), .DATA_A(DATA_A), .DATA_B(DATA_B),
+    .OUT(OUT), .CO(CO), .OVF(OVF), .N(N), .Z(Z)
+);
+
+endmodule
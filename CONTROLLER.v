@@ -1,459 +1,463 @@
-module CONTROLLER 
-    (
-	  input clk,
-	  input [3:0] Cond,
-	  input [1:0] Op,
-	  input [5:0] Funct,
-	  input [3:0] Rd,
-	  
-	  input  Z,
-	  
-	  output reg Z_enable,
-	  output reg BLenable,
-	  output reg BXenable,
-	  
-	  output reg PCWrite,
-	  output reg AdrSrc,
-	  output reg MemWrite,
-	  output reg IRWrite,
-	  
-	  output reg RegWrite,
-	  output reg [1:0] ImmSrc,
-	  output reg [1:0] RegSrc,
-	  output reg ALUSrcA,
-	  output reg [1:0] ALUSrcB,
-	  output reg [3:0] ALUControl,
-	  output reg [1:0] ResultSrc,
-	  output reg [2:0] state
-	  
-    );
-	 
-reg CondEx;
-
-	
-	 
-always @(posedge clk) begin
-
-if(state == 4)
-	state = 0;
-	
-else
-	state = state + 1;
-	
-
-end
-
-
-//Conditional Logic (clock)
-always @(*) begin
-
-	case(Cond)
-	
-		4'b0000: // EQ
-					if(Z == 1)
-						CondEx = 1;
-					else
-						CondEx = 0;
-		
-		4'b0001:	// NE
-					if(Z == 0)
-						CondEx = 1;
-					else 
-						CondEx = 0;
-		
-		4'b1110:  // AL
-					CondEx = 1;
-		
-		default: CondEx = 1;
-					
-		
-endcase	
-
-end 
-
-
-always @(*) begin
-
-	
-if(state == 0) begin 
-
-	// Fetch Cycle (Cycle 1)
-
-	PCWrite 		= 1'b1;
-	AdrSrc   	= 1'b0;
-	MemWrite 	= 1'b0;
-	IRWrite  	= 1'b1;
-	
-	RegSrc 		= 2'b00; // don't care (not decoded yet)
-		  
-	RegWrite 	= 1'b0;
-	ImmSrc   	= 2'b00; // don't care
-	ALUSrcA  	= 1'b1;
-	ALUSrcB  	= 2'b10;
-	ALUControl 	= 4'b0100; // ADD
-	ResultSrc 	= 2'b10;
-	
-	Z_enable = 1'b0; // Don't change Z flag in FETCH
-	
-	BLenable = 1'b0;
-	BXenable = 1'b0;
-	
-	
-	end
-
-if(state == 1) begin 
-	
-	// Decode Cycle (Cycle 2)
-
-	PCWrite 		= 1'b0; // !
-	AdrSrc   	= 1'b0; // don't care
-	MemWrite 	= 1'b0;
-	IRWrite  	= 1'b0; // !
-	
-	case(Op)
-	
-		2'b00: RegSrc		= 2'b00;
-		
-		2'b01: RegSrc		= 2'b10; 
-			 // RegSrc		= {~Funct[0], 1'b0};
-
-		2'b10: RegSrc		= 2'b00;
-		
-		default: RegSrc		= 2'b00;
-
-	endcase  
-	
-	RegWrite 	= 1'b0;
-	ImmSrc   	= {Op}; // don't care
-	ALUSrcA  	= 1'b1;
-	ALUSrcB  	= 2'b10;
-	ALUControl 	= 4'b0100; // ADD
-	ResultSrc 	= 2'b10;
-	
-	Z_enable = 1'b0; // Don't change Z flag in DECODE
-	
-	if((Op == 2'b10) && ({Funct[5:4]} == 2'b10)) 
-		BLenable = 1'b1;
-	else
-		BLenable = 1'b0;
-	if((Op == 2'b10) && ({Funct[5:4]} == 2'b11)) 
-		BXenable = 1'b1;
-	else
-		BXenable = 1'b0;
-		
-	
-	end
-	
-else if(state == 2) begin 
-
-	case(Op)
-		
-		// Memory Instruction
-		2'b01: // MemAddr Cycle (Cycle 3)
-			begin
-				
-			PCWrite 		= 1'b0; 
-			AdrSrc   	= 1'b0; // don't care
-			MemWrite 	= 1'b0;
-			IRWrite  	= 1'b0;
-			
-			RegSrc		= 2'b10; 
-			
-			RegWrite 	= 1'b0;
-			ImmSrc   	= 2'b01; // don't care
-			ALUSrcA  	= 1'b0;
-			ALUSrcB  	= 2'b01;
-			ALUControl 	= 4'b0100; // ADD
-			ResultSrc 	= 2'b00;	// don't care
-			
-			Z_enable = 1'b1;
-			
-			BLenable = 1'b0;
-			BXenable = 1'b0;
-			
-			// REMARK: For both LDR and STR, Rn must be chosen (X0)
-			//			  For STR, Rd must be connected to RA2 (10)
-			//			  No need for Rm
-
-			end 
-			
-		// Data Processing Instruction
-		2'b00: // Execute ALU Cycle (Cycle 3)
-			begin
-			
-			PCWrite 		= 1'b0; // don't care
-			AdrSrc   	= 1'b0; // don't care
-			MemWrite 	= 1'b0; // don't care
-			IRWrite  	= 1'b0; // don't care
-			
-			RegSrc		= 2'b00; 
-				  
-			RegWrite 	= 1'b0;			// not yet
-			ImmSrc   	= 2'b00; 		// don't care
-			ALUSrcA  	= 1'b0;			// Choose Rn
-			ALUSrcB  	= 2'b00;			// Choose Rm
-			ALUControl 	= {Funct[4:1]};// Choose Operation
-			ResultSrc 	= 2'b00;			// don't care
-			
-			Z_enable = 1'b1;
-			
-			BLenable = 1'b0;
-			BXenable = 1'b0;
-			
-			end 
-			
-		2'b10: // Branch Cycle (Cycle 3)
-			begin
-			
-			PCWrite 		= CondEx ? 1'b1 : 1'b0 ; // !
-			AdrSrc   	= 1'b0; // don't care
-			MemWrite 	= 1'b0; // don't care
-			IRWrite  	= 1'b0; // don't care
-				  
-			RegSrc		= 2'b01; // X1
-			
-			RegWrite 	= 1'b0;
-			ImmSrc   	= 2'b10;   // Op
-			ALUSrcA  	= 1'b0; 	  // Choose Rn
-			ALUSrcB  	= 2'b01;   // Choose ExtImm
-			ALUControl 	= 4'b1101; // MOVE 
-			ResultSrc 	= 2'b10;	  // don't wait another cycle
-			
-			Z_enable = 1'b1;
-			
-			if({Funct[5:4]} == 2'b10) 
-				BLenable = 1'b1;
-			else
-				BLenable = 1'b0;
-			if({Funct[5:4]} == 2'b11) 
-				BXenable = 1'b1;
-			else
-				BXenable = 1'b0;
-			
-			end 
-			
-		default: begin
-		
-			PCWrite 		= 1'b0; 
-			AdrSrc   	= 1'b0; 
-			MemWrite 	= 1'b0;
-			IRWrite  	= 1'b0; 
-			
-			RegSrc 		= 2'b00;
-				  
-			RegWrite 	= 1'b0; 
-			ImmSrc   	= 2'b00; 
-			ALUSrcA  	= 1'b0;
-			ALUSrcB  	= 2'b00;
-			ALUControl 	= 4'b0000; 
-			ResultSrc 	= 2'b00;	
-			
-			Z_enable = 1'b1;
-			
-			BLenable = 1'b0;
-			BXenable = 1'b0;
-		
-		
-		end
-			
-			
-		endcase
-
-end
-
-else if(state == 3) begin 
-
-	case(Op)
-		
-		2'b01: 
-			begin
-			
-			// MemRead/MemWrite Cycle (Cycle 4)
-				
-
-			PCWrite 		= 1'b0; 
-			AdrSrc   	= 1'b1; 
-			MemWrite 	= ~Funct[0]; 
-			IRWrite  	= 1'b0; 
-				  
-			RegSrc 		= 2'b00;
-			
-			RegWrite 	= 1'b0; // RegWrite is at Writeback
-			ImmSrc   	= 2'b01; 
-			ALUSrcA  	= 1'b0;
-			ALUSrcB  	= 2'b01;
-			ALUControl 	= 4'b0100; // ADD
-			ResultSrc 	= 2'b00;	
-			
-			Z_enable = 1'b1;
-			
-			BLenable = 1'b0;
-			BXenable = 1'b0;
-			
-			// REMARK: 	Funct[0] = 0 (STR), Funct[0] = 1 (LDR)
-			//				MemWritre = 1		, MemWritre = 0
-			end 
-			
-		2'b00: 
-			begin
-			
-			// ALUWB Cycle (Cycle 4)
-			
-			PCWrite 		= 1'b0; // don't care
-			AdrSrc   	= 1'b0; // don't care
-			MemWrite 	= 1'b0; // don't care
-			IRWrite  	= 1'b0; // don't care
-			
-			RegSrc 		= 2'b00; // don't care (not decoded yet)
-				  
-			
-			ImmSrc   	= 2'b00; 		// don't care
-			ALUSrcA  	= 1'b0;			// don't care
-			ALUSrcB  	= 2'b00;			// don't care
-			
-			
-			case(Funct[4:1])
-			
-				4'b1010: // FOR CMP, DO SUB BUT DO NOT WRITE TO REGISTER
-					begin
-					ALUControl = 4'b0010;
-					RegWrite 	= 1'b0;	
-					end
-				
-				default: 
-					begin
-					ALUControl = {Funct[4:1]};
-					RegWrite 	= 1'b1;	
-					end
-			endcase
-			
-			ResultSrc 	= 2'b00;			// !
-			
-			Z_enable = 1'b1;
-			
-			BLenable = 1'b0;
-			BXenable = 1'b0;
-			
-			
-			end 
-			
-		2'b10: // Hold the previous Branch Cycle (Cycle 3)
-			begin
-			
-			PCWrite 		= CondEx ? 1'b1 : 1'b0 ; // !
-			AdrSrc   	= 1'b0; // don't care
-			MemWrite 	= 1'b0; // don't care
-			IRWrite  	= 1'b0; // don't care
-				  
-			RegSrc		= 2'b01; // X1
-			
-			RegWrite 	= 1'b0;
-			ImmSrc   	= 2'b10;   // Op
-			ALUSrcA  	= 1'b0; 	  // Choose Rn
-			ALUSrcB  	= 2'b01;   // Choose ExtImm
-			ALUControl 	= 4'b1101; // ADD  
-			ResultSrc 	= 2'b10;	  // don't wait another cycle
-			
-			Z_enable = 1'b1;
-			
-			if({Funct[5:4]} == 2'b10) 
-				BLenable = 1'b1;
-			else
-				BLenable = 1'b0;
-			if({Funct[5:4]} == 2'b11) 
-				BXenable = 1'b1;
-			else
-				BXenable = 1'b0;
-			
-			
-			end 
-			
-		default: begin
-		
-			PCWrite 		= 1'b0; 
-			AdrSrc   	= 1'b0; 
-			MemWrite 	= 1'b0;
-			IRWrite  	= 1'b0; 
-			
-			RegSrc 		= 2'b00;
-				  
-			RegWrite 	= 1'b0; 
-			ImmSrc   	= 2'b00; 
-			ALUSrcA  	= 1'b0;
-			ALUSrcB  	= 2'b00;
-			ALUControl 	= 4'b0000; 
-			ResultSrc 	= 2'b00;
-			
-			Z_enable = 1'b1;
-			
-			BLenable = 1'b0;
-			BXenable = 1'b0;
-		
-		
-		
-		end
-			
-		endcase
-
-end
-
-else if(state == 4) begin 
-
-	// If LDR
-	if((Op == 2'b01) && (Funct[0] == 1)) begin
-	
-		// Writeback (Cycle 5)
-
-		PCWrite 		= 1'b0; 
-		AdrSrc   	= 1'b1; 
-		MemWrite 	= 1'b0;
-		IRWrite  	= 1'b0; 
-		
-		RegSrc 		= 2'b00;
-			  
-		RegWrite 	= 1'b1; // !
-		ImmSrc   	= 2'b01; 
-		ALUSrcA  	= 1'b0;
-		ALUSrcB  	= 2'b01;
-		ALUControl 	= 4'b0100; // ADD
-		ResultSrc 	= 2'b01;	// Data to WD3
-		
-		Z_enable = 1'b0;
-		
-		BLenable = 1'b0;
-		BXenable = 1'b0;
-		
-	end
-	
-	else begin
-	
-		PCWrite 		= 1'b0; 
-		AdrSrc   	= 1'b0; 
-		MemWrite 	= 1'b0;
-		IRWrite  	= 1'b0; 
-		
-		RegSrc 		= 2'b00;
-			  
-		RegWrite 	= 1'b0; 
-		ImmSrc   	= 2'b00; 
-		ALUSrcA  	= 1'b0;
-		ALUSrcB  	= 2'b00;
-		ALUControl 	= 4'b0000; 
-		ResultSrc 	= 2'b00;	
-		
-		Z_enable = 1'b0;
-		
-		BLenable = 1'b0;
-		BXenable = 1'b0;
-	
-	end
-
-end
-
-
-
-end
-
-
-endmodule
-
+module CONTROLLER 
+    (
+	  input clk, reset,
+	  input [3:0] Cond,
+	  input [1:0] Op,
+	  input [5:0] Funct,
+	  /* verilator lint_off UNUSEDSIGNAL */
+	  input [3:0] Rd, // unused, R15 destinations need no special case
+	  /* verilator lint_on UNUSEDSIGNAL */
+	  
+	  input  [3:0] Flags, // {N, Z, C, V}
+	  
+	  output reg Z_enable, // writes all four flags
+	  output reg BLenable,
+	  output reg BXenable,
+	  
+	  output reg PCWrite,
+	  output reg AdrSrc,
+	  output reg MemWrite,
+	  output reg IRWrite,
+	  
+	  output reg RegWrite,
+	  output reg [1:0] ImmSrc,
+	  output reg [1:0] RegSrc,
+	  output reg ALUSrcA,
+	  output reg [1:0] ALUSrcB,
+	  output reg [3:0] ALUControl,
+	  output reg [1:0] ResultSrc,
+	  output reg [2:0] state,
+	  output reg InstrDone
+	  
+    );
+	 
+reg CondEx;
+
+// High during the last state of the current instruction, i.e. the instruction
+// retires on the clock edge that ends this state:
+//   Branch, Op = 11 : state 2 (Branch Cycle)
+//   DP, STR         : state 3 (ALUWB / MemWrite Cycle)
+//   LDR             : state 4 (Writeback)
+always @(*) begin
+
+	case(state)
+	
+		3'd2: InstrDone = (Op == 2'b10) || (Op == 2'b11);
+		
+		3'd3: InstrDone = (Op == 2'b00) || ((Op == 2'b01) && (Funct[0] == 0));
+		
+		3'd4: InstrDone = 1'b1;
+		
+		default: InstrDone = 1'b0;
+		
+	endcase
+
+end
+	 
+always @(posedge clk) begin
+
+if(reset)
+	state <= 0;
+
+else if(InstrDone)
+	state <= 0;
+	
+else
+	state <= state + 1;
+	
+
+end
+
+
+//Conditional Logic (clock)
+wire N, Z, C, V;
+
+assign {N, Z, C, V} = Flags;
+
+always @(*) begin
+
+	case(Cond)
+	
+		4'b0000: CondEx = Z;					// EQ
+		4'b0001: CondEx = ~Z;				// NE
+		4'b0010: CondEx = C;					// CS/HS
+		4'b0011: CondEx = ~C;				// CC/LO
+		4'b0100: CondEx = N;					// MI
+		4'b0101: CondEx = ~N;				// PL
+		4'b0110: CondEx = V;					// VS
+		4'b0111: CondEx = ~V;				// VC
+		4'b1000: CondEx = C & ~Z;			// HI
+		4'b1001: CondEx = ~C | Z;			// LS
+		4'b1010: CondEx = (N == V);		// GE
+		4'b1011: CondEx = (N != V);		// LT
+		4'b1100: CondEx = ~Z & (N == V);	// GT
+		4'b1101: CondEx = Z | (N != V);	// LE
+		4'b1110: CondEx = 1;					// AL
+		
+		default: CondEx = 1;
+		
+endcase	
+
+end 
+
+
+always @(*) begin
+
+	
+if(state == 0) begin 
+
+	// Fetch Cycle (Cycle 1)
+
+	PCWrite 		= 1'b1;
+	AdrSrc   	= 1'b0;
+	MemWrite 	= 1'b0;
+	IRWrite  	= 1'b1;
+	
+	RegSrc 		= 2'b00; // don't care (not decoded yet)
+		  
+	RegWrite 	= 1'b0;
+	ImmSrc   	= 2'b00; // don't care
+	ALUSrcA  	= 1'b1;
+	ALUSrcB  	= 2'b10;
+	ALUControl 	= 4'b0100; // ADD
+	ResultSrc 	= 2'b10;
+	
+	Z_enable = 1'b0; // Don't change the flags in FETCH
+	
+	BLenable = 1'b0;
+	BXenable = 1'b0;
+	
+	
+	end
+
+if(state == 1) begin 
+	
+	// Decode Cycle (Cycle 2)
+
+	PCWrite 		= 1'b0; // !
+	AdrSrc   	= 1'b0; // don't care
+	MemWrite 	= 1'b0;
+	IRWrite  	= 1'b0; // !
+	
+	case(Op)
+	
+		2'b00: RegSrc		= 2'b00;
+		
+		2'b01: RegSrc		= 2'b10; 
+			 // RegSrc		= {~Funct[0], 1'b0};
+
+		2'b10: RegSrc		= 2'b00;
+		
+		default: RegSrc		= 2'b00;
+
+	endcase  
+	
+	RegWrite 	= 1'b0;
+	ImmSrc   	= {Op}; // don't care
+	ALUSrcA  	= 1'b1;
+	ALUSrcB  	= 2'b10;
+	ALUControl 	= 4'b0100; // ADD
+	ResultSrc 	= 2'b10;
+	
+	Z_enable = 1'b0; // Don't change the flags in DECODE
+	
+	if((Op == 2'b10) && ({Funct[5:4]} == 2'b10)) 
+		BLenable = 1'b1;
+	else
+		BLenable = 1'b0;
+	if((Op == 2'b10) && ({Funct[5:4]} == 2'b11)) 
+		BXenable = 1'b1;
+	else
+		BXenable = 1'b0;
+		
+	
+	end
+	
+else if(state == 2) begin 
+
+	case(Op)
+		
+		// Memory Instruction
+		2'b01: // MemAddr Cycle (Cycle 3)
+			begin
+				
+			PCWrite 		= 1'b0; 
+			AdrSrc   	= 1'b0; // don't care
+			MemWrite 	= 1'b0;
+			IRWrite  	= 1'b0;
+			
+			RegSrc		= 2'b10; 
+			
+			RegWrite 	= 1'b0;
+			ImmSrc   	= 2'b01; // don't care
+			ALUSrcA  	= 1'b0;
+			ALUSrcB  	= 2'b01;
+			ALUControl 	= 4'b0100; // ADD
+			ResultSrc 	= 2'b00;	// don't care
+			
+			Z_enable = 1'b0;
+			
+			BLenable = 1'b0;
+			BXenable = 1'b0;
+			
+			// REMARK: For both LDR and STR, Rn must be chosen (X0)
+			//			  For STR, Rd must be connected to RA2 (10)
+			//			  No need for Rm
+
+			end 
+			
+		// Data Processing Instruction
+		2'b00: // Execute ALU Cycle (Cycle 3)
+			begin
+			
+			PCWrite 		= 1'b0; // don't care
+			AdrSrc   	= 1'b0; // don't care
+			MemWrite 	= 1'b0; // don't care
+			IRWrite  	= 1'b0; // don't care
+			
+			RegSrc		= 2'b00; 
+				  
+			RegWrite 	= 1'b0;			// not yet
+			ImmSrc   	= 2'b00; 		// don't care
+			ALUSrcA  	= 1'b0;			// Choose Rn
+			ALUSrcB  	= 2'b00;			// Choose Rm
+			
+			// CMP subtracts already here, so that the flags and ALU_OUT are
+			// valid when the instruction retires after ALUWB
+			if(Funct[4:1] == 4'b1010)
+				ALUControl = 4'b0010;
+			else
+				ALUControl = {Funct[4:1]};// Choose Operation
+			ResultSrc 	= 2'b00;			// don't care
+			
+			Z_enable = 1'b1; // NZCV of the result, CMP included
+			
+			BLenable = 1'b0;
+			BXenable = 1'b0;
+			
+			end 
+			
+		2'b10: // Branch Cycle (Cycle 3)
+			begin
+			
+			PCWrite 		= CondEx ? 1'b1 : 1'b0 ; // !
+			AdrSrc   	= 1'b0; // don't care
+			MemWrite 	= 1'b0; // don't care
+			IRWrite  	= 1'b0; // don't care
+				  
+			RegSrc		= 2'b01; // X1
+			
+			RegWrite 	= 1'b0;
+			ImmSrc   	= 2'b10;   // Op
+			ALUSrcA  	= 1'b0; 	  // Choose Rn
+			ALUSrcB  	= 2'b01;   // Choose ExtImm
+			ALUControl 	= 4'b1101; // MOVE 
+			ResultSrc 	= 2'b10;	  // don't wait another cycle
+			
+			Z_enable = 1'b0;
+			
+			if({Funct[5:4]} == 2'b10) 
+				BLenable = 1'b1;
+			else
+				BLenable = 1'b0;
+			if({Funct[5:4]} == 2'b11) 
+				BXenable = 1'b1;
+			else
+				BXenable = 1'b0;
+			
+			end 
+			
+		default: begin
+		
+			PCWrite 		= 1'b0; 
+			AdrSrc   	= 1'b0; 
+			MemWrite 	= 1'b0;
+			IRWrite  	= 1'b0; 
+			
+			RegSrc 		= 2'b00;
+				  
+			RegWrite 	= 1'b0; 
+			ImmSrc   	= 2'b00; 
+			ALUSrcA  	= 1'b0;
+			ALUSrcB  	= 2'b00;
+			ALUControl 	= 4'b0000; 
+			ResultSrc 	= 2'b00;	
+			
+			Z_enable = 1'b0;
+			
+			BLenable = 1'b0;
+			BXenable = 1'b0;
+		
+		
+		end
+			
+			
+		endcase
+
+end
+
+else if(state == 3) begin 
+
+	case(Op)
+		
+		2'b01: 
+			begin
+			
+			// MemRead/MemWrite Cycle (Cycle 4)
+				
+
+			PCWrite 		= 1'b0; 
+			AdrSrc   	= 1'b1; 
+			MemWrite 	= ~Funct[0]; 
+			IRWrite  	= 1'b0; 
+				  
+			RegSrc 		= 2'b00;
+			
+			RegWrite 	= 1'b0; // RegWrite is at Writeback
+			ImmSrc   	= 2'b01; 
+			ALUSrcA  	= 1'b0;
+			ALUSrcB  	= 2'b01;
+			ALUControl 	= 4'b0100; // ADD
+			ResultSrc 	= 2'b00;	
+			
+			Z_enable = 1'b0;
+			
+			BLenable = 1'b0;
+			BXenable = 1'b0;
+			
+			// REMARK: 	Funct[0] = 0 (STR), Funct[0] = 1 (LDR)
+			//				MemWritre = 1		, MemWritre = 0
+			end 
+			
+		2'b00: 
+			begin
+			
+			// ALUWB Cycle (Cycle 4)
+			
+			PCWrite 		= 1'b0; // don't care
+			AdrSrc   	= 1'b0; // don't care
+			MemWrite 	= 1'b0; // don't care
+			IRWrite  	= 1'b0; // don't care
+			
+			RegSrc 		= 2'b00; // don't care (not decoded yet)
+				  
+			
+			ImmSrc   	= 2'b00; 		// don't care
+			ALUSrcA  	= 1'b0;			// don't care
+			ALUSrcB  	= 2'b00;			// don't care
+			
+			
+			case(Funct[4:1])
+			
+				4'b1010: // FOR CMP, DO SUB BUT DO NOT WRITE TO REGISTER
+					begin
+					ALUControl = 4'b0010;
+					RegWrite 	= 1'b0;	
+					end
+				
+				default: 
+					begin
+					ALUControl = {Funct[4:1]};
+					RegWrite 	= 1'b1;	
+					end
+			endcase
+			
+			ResultSrc 	= 2'b00;			// !
+			
+			Z_enable = 1'b0; // already written in Execute, ADC/SBC/RSC would see the new C here
+			
+			BLenable = 1'b0;
+			BXenable = 1'b0;
+			
+			
+			end 
+			
+		default: begin
+		
+			PCWrite 		= 1'b0; 
+			AdrSrc   	= 1'b0; 
+			MemWrite 	= 1'b0;
+			IRWrite  	= 1'b0; 
+			
+			RegSrc 		= 2'b00;
+				  
+			RegWrite 	= 1'b0; 
+			ImmSrc   	= 2'b00; 
+			ALUSrcA  	= 1'b0;
+			ALUSrcB  	= 2'b00;
+			ALUControl 	= 4'b0000; 
+			ResultSrc 	= 2'b00;
+			
+			Z_enable = 1'b0;
+			
+			BLenable = 1'b0;
+			BXenable = 1'b0;
+		
+		
+		
+		end
+			
+		endcase
+
+end
+
+else if(state == 4) begin 
+
+	// If LDR
+	if((Op == 2'b01) && (Funct[0] == 1)) begin
+	
+		// Writeback (Cycle 5)
+
+		PCWrite 		= 1'b0; 
+		AdrSrc   	= 1'b0; // the loaded word is on RESULT, keep it off the memory address
+		MemWrite 	= 1'b0;
+		IRWrite  	= 1'b0; 
+		
+		RegSrc 		= 2'b00;
+			  
+		RegWrite 	= 1'b1; // !
+		ImmSrc   	= 2'b01; 
+		ALUSrcA  	= 1'b0;
+		ALUSrcB  	= 2'b01;
+		ALUControl 	= 4'b0100; // ADD
+		ResultSrc 	= 2'b01;	// Data to WD3
+		
+		Z_enable = 1'b0;
+		
+		BLenable = 1'b0;
+		BXenable = 1'b0;
+		
+	end
+	
+	else begin
+	
+		PCWrite 		= 1'b0; 
+		AdrSrc   	= 1'b0; 
+		MemWrite 	= 1'b0;
+		IRWrite  	= 1'b0; 
+		
+		RegSrc 		= 2'b00;
+			  
+		RegWrite 	= 1'b0; 
+		ImmSrc   	= 2'b00; 
+		ALUSrcA  	= 1'b0;
+		ALUSrcB  	= 2'b00;
+		ALUControl 	= 4'b0000; 
+		ResultSrc 	= 2'b00;	
+		
+		Z_enable = 1'b0;
+		
+		BLenable = 1'b0;
+		BXenable = 1'b0;
+	
+	end
+
+end
+
+
+
+end
+
+
+endmodule
+
@@ -0,0 +1,120 @@
+module CONTROLLER_PIPELINED
+    (
+	  // Fields of the instruction in ID
+	  input [1:0] Op,
+	  /* verilator lint_off UNUSEDSIGNAL */
+	  input [5:0] Funct, // the I bit, Funct[5], is ignored as in CONTROLLER
+	  /* verilator lint_on UNUSEDSIGNAL */
+	  input [3:0] Rd,
+
+	  output reg RegWrite,
+	  output reg MemWrite,
+	  output reg MemtoReg,
+	  output reg Branch,
+	  output reg FlagWrite,
+	  output reg [1:0] ImmSrc,
+	  output reg [1:0] RegSrc,
+	  output reg [1:0] ALUSrcB,
+	  output reg [3:0] ALUControl,
+
+	  // Registers the instruction reads in EX, for the hazard unit
+	  output reg UseRn,
+	  output reg UseRm
+    );
+
+// Decodes each instruction once in ID into the controls it carries down the
+// pipeline. The ALU operations are those of the multi-cycle CONTROLLER, so
+// both cores execute the same instruction set. Writes to R15 are dropped, as
+// there is no R15 in the register file.
+
+always @(*) begin
+
+	case(Op)
+
+		// Data Processing Instruction
+		2'b00: begin
+
+			MemWrite 	= 1'b0;
+			MemtoReg 	= 1'b0;
+			Branch 		= 1'b0;
+			FlagWrite 	= 1'b1; // NZCV of the result, CMP included
+			ImmSrc   	= 2'b00; // don't care
+			RegSrc		= 2'b00; // Rn, Rm
+			ALUSrcB  	= 2'b00; // Choose shifted Rm
+			UseRn 		= 1'b1;
+			UseRm 		= 1'b1;
+
+			case(Funct[4:1])
+
+				4'b1010: // FOR CMP, DO SUB BUT DO NOT WRITE TO REGISTER
+					begin
+					ALUControl = 4'b0010;
+					RegWrite 	= 1'b0;
+					end
+
+				default:
+					begin
+					ALUControl = {Funct[4:1]};
+					RegWrite 	= (Rd != 4'd15);
+					end
+			endcase
+
+			end
+
+		// Memory Instruction
+		2'b01: begin
+
+			// REMARK: 	Funct[0] = 0 (STR), Funct[0] = 1 (LDR)
+			RegWrite 	= Funct[0] && (Rd != 4'd15);
+			MemWrite 	= ~Funct[0];
+			MemtoReg 	= Funct[0];
+			Branch 		= 1'b0;
+			FlagWrite 	= 1'b0;
+			ImmSrc   	= 2'b01;
+			RegSrc		= 2'b10; // Rn, Rd
+			ALUSrcB  	= 2'b01; // Choose ExtImm
+			ALUControl 	= 4'b0100; // ADD
+			UseRn 		= 1'b1;
+			UseRm 		= ~Funct[0]; // STR data
+
+			end
+
+		// Branch Instruction
+		2'b10: begin
+
+			RegWrite 	= 1'b0;
+			MemWrite 	= 1'b0;
+			MemtoReg 	= 1'b0;
+			Branch 		= 1'b1;
+			FlagWrite 	= 1'b0;
+			ImmSrc   	= 2'b10;
+			RegSrc		= 2'b01; // X1
+			ALUSrcB  	= 2'b01;   // Choose ExtImm
+			ALUControl 	= 4'b1101; // MOVE
+			UseRn 		= 1'b0;
+			UseRm 		= 1'b0;
+
+			end
+
+		// Op = 11 writes nothing, as in the multi-cycle FSM
+		default: begin
+
+			RegWrite 	= 1'b0;
+			MemWrite 	= 1'b0;
+			MemtoReg 	= 1'b0;
+			Branch 		= 1'b0;
+			FlagWrite 	= 1'b0;
+			ImmSrc   	= 2'b00;
+			RegSrc		= 2'b00;
+			ALUSrcB  	= 2'b00;
+			ALUControl 	= 4'b0000;
+			UseRn 		= 1'b1;
+			UseRm 		= 1'b1;
+
+			end
+
+	endcase
+
+end
+
+endmodule
@@ -0,0 +1,315 @@
+module DATAPATH_PIPELINED #(parameter WIDTH=32)
+    (
+	  input clk, reset,
+
+	  // Control Signals decoded in ID
+	  input RegWriteD, MemWriteD, MemtoRegD, BranchD, FlagWriteD, UseRnD, UseRmD,
+	  input [1:0] RegSrcD, ImmSrcD, ALUSrcBD,
+	  input [3:0] ALUControlD,
+
+	  // Fields of the instruction in ID, for the controller
+	  output [3:0] CondD,
+	  output [1:0] OpD,
+	  output [5:0] FunctD,
+	  output [3:0] RdD,
+
+	  // The instruction retiring in WB, seen like the last state of the
+	  // multi-cycle core: its PC update, register write and flag update
+	  output InstrDone, PCWrite, RegWrite, Z_enable,
+	  output [1:0] OpW,
+	  output [5:0] FunctW,
+	  output [3:0] A3,
+	  output [WIDTH-1:0] RESULT, INSTR,
+	  output [WIDTH-1:0] PC, // address of the next instruction in program order
+	  output [3:0] Flags,    // NZCV after the retiring (or last retired) instruction
+
+	  // Stage signals for traces: RA*/RD*/ExtImm in ID, SrcA/SrcB in EX,
+	  // ALU_OUT/Adr/WriteData in MEM
+	  output [3:0] RA1, RA2,
+	  output [WIDTH-1:0] RD1, RD2, ExtImm, SrcA, SrcB, ALU_OUT
+    );
+
+// Five stages IF/ID/EX/MEM/WB. Data-processing instructions write the flags
+// in EX, branches test them there against the flags of the instructions
+// ahead of them, and taken branches redirect the fetch from EX.
+
+// Pipeline registers, named after the stage that uses them
+reg  [WIDTH-1:0] PCF;
+
+reg ValidD;
+reg [WIDTH-1:0] InstrD, PCD;
+
+reg ValidE, RegWriteE, MemWriteE, MemtoRegE, BranchE, FlagWriteE;
+reg [1:0] ALUSrcBE;
+reg [3:0] ALUControlE, CondE, RA1E, RA2E, RdE;
+reg [WIDTH-1:0] RD1E, RD2E, ExtImmE, PCE, InstrE;
+
+reg ValidM, RegWriteM, MemWriteM, MemtoRegM, PCSrcM, FlagWriteM;
+reg [3:0] FlagsM;
+reg [3:0] RdM;
+reg [WIDTH-1:0] ALUOutM, WriteDataM, PCM, InstrM;
+
+reg ValidW, RegWriteW, MemtoRegW, PCSrcW, FlagWriteW;
+reg [3:0] FlagsW;
+reg [3:0] RdW;
+reg [WIDTH-1:0] ALUOutW, ReadDataW, PCW, InstrW;
+
+// NZCV after the instruction ahead of the one in EX, see EX
+reg [3:0] FlagsSpec;
+reg CondExE;
+
+wire StallF, StallD, FlushD, FlushE;
+wire [1:0] ForwardAE, ForwardBE;
+wire BranchTakenE;
+
+wire [WIDTH-1:0] InstrF, RF1, RF2, PCPlus8D;
+wire [WIDTH-1:0] WriteDataE, ShiftOutE, ALUResultE;
+wire NE, ZE, COE, OVFE;
+wire [3:0] FlagsAfterE;
+wire [WIDTH-1:0] Adr, DataAdr, WriteData, ReadData;
+/* verilator lint_off UNUSEDSIGNAL */
+wire [3:0] FlagRegInput; // for the checker
+/* verilator lint_on UNUSEDSIGNAL */
+
+
+// ---------------------------------------------------------------- IF
+
+Data_memory InstrMem (.clk(clk), .WE(1'b0), .ADDR(PCF), .WD({WIDTH{1'b0}}), .RD(InstrF));
+
+always @(posedge clk) begin
+	if(reset == 1'b1)
+		PCF <= {WIDTH{1'b0}};
+	else if(BranchTakenE == 1'b1)
+		PCF <= ALUResultE; // branch target, MOVE of ExtImm
+	else if(StallF == 1'b0)
+		PCF <= PCF + 4;
+end
+
+
+// ---------------------------------------------------------------- ID
+
+always @(posedge clk) begin
+	if(reset == 1'b1 || FlushD == 1'b1)
+		ValidD <= 1'b0;
+	else if(StallD == 1'b0) begin
+		ValidD <= 1'b1;
+		InstrD <= InstrF;
+		PCD    <= PCF;
+	end
+end
+
+assign CondD  = InstrD[31:28];
+assign OpD    = InstrD[27:26];
+assign FunctD = InstrD[25:20];
+assign RdD    = InstrD[15:12];
+
+assign PCPlus8D = PCD + 8;
+
+Mux_2to1 regsrc0 (.select(RegSrcD[0]), .input_0(InstrD[19:16]), .input_1(4'd15), .output_value(RA1));
+
+Mux_2to1 regsrc1 (.select(RegSrcD[1]), .input_0(InstrD[3:0]), .input_1(InstrD[15:12]), .output_value(RA2));
+
+Register_file #(.WIDTH(WIDTH)) RegF (.clk(clk), .write_enable(RegWriteW), .reset(reset),
+												.Source_select_0(RA1), .Source_select_1(RA2), .Destination_select(RdW),
+												.DATA(RESULT), .Reg_15(PCPlus8D),
+												.out_0(RF1), .out_1(RF2));
+
+// WB writes the register file on the clock edge that ends this cycle, so a
+// read of the same register in ID takes RESULT directly
+assign RD1 = (RegWriteW && (RdW == RA1)) ? RESULT : RF1;
+assign RD2 = (RegWriteW && (RdW == RA2)) ? RESULT : RF2;
+
+Extender Ext (.A(InstrD[23:0]), .select(ImmSrcD), .Q(ExtImm));
+
+
+// ---------------------------------------------------------------- EX
+
+always @(posedge clk) begin
+	if(reset == 1'b1 || FlushE == 1'b1) begin
+		ValidE    <= 1'b0;
+		RegWriteE <= 1'b0;
+		MemWriteE <= 1'b0;
+		MemtoRegE <= 1'b0;
+		BranchE   <= 1'b0;
+		FlagWriteE <= 1'b0;
+	end
+	else begin
+		ValidE    <= ValidD;
+		RegWriteE <= ValidD && RegWriteD;
+		MemWriteE <= ValidD && MemWriteD;
+		MemtoRegE <= ValidD && MemtoRegD;
+		BranchE   <= ValidD && BranchD;
+		FlagWriteE <= ValidD && FlagWriteD;
+	end
+
+	ALUSrcBE    <= ALUSrcBD;
+	ALUControlE <= ALUControlD;
+	CondE       <= CondD;
+	RA1E        <= RA1;
+	RA2E        <= RA2;
+	RdE         <= RdD;
+	RD1E        <= RD1;
+	RD2E        <= RD2;
+	ExtImmE     <= ExtImm;
+	PCE         <= PCD;
+	InstrE      <= InstrD;
+end
+
+Mux_4to1 #(.WIDTH(WIDTH)) ForwardA (.select(ForwardAE), .input_0(RD1E), .input_1(RESULT), .input_2(ALUOutM), .input_3(RD1E), .output_value(SrcA));
+
+Mux_4to1 #(.WIDTH(WIDTH)) ForwardB (.select(ForwardBE), .input_0(RD2E), .input_1(RESULT), .input_2(ALUOutM), .input_3(RD2E), .output_value(WriteDataE));
+
+shifter #(.WIDTH(WIDTH)) SHIFT (.control(InstrE[6:5]), .shamt(InstrE[11:7]), .DATA(WriteDataE), .OUT(ShiftOutE));
+
+Mux_4to1 #(.WIDTH(WIDTH)) SrcB_reg (.select(ALUSrcBE), .input_0(ShiftOutE), .input_1(ExtImmE), .input_2(4), .input_3(0), .output_value(SrcB));
+
+ALU #(.WIDTH(WIDTH)) ALU (.control(ALUControlE), .CI(FlagsSpec[1]), .DATA_A(SrcA), .DATA_B(SrcB), .OUT(ALUResultE), .CO(COE), .OVF(OVFE), .N(NE), .Z(ZE));
+
+assign FlagsAfterE = FlagWriteE ? {NE, ZE, COE, OVFE} : FlagsSpec;
+
+// FlagsSpec: the flags are written in EX, so the branch condition needs no
+// forwarding
+always @(posedge clk) begin
+	if(reset == 1'b1)
+		FlagsSpec <= 4'b0000;
+	else if(ValidE == 1'b1)
+		FlagsSpec <= FlagsAfterE;
+end
+
+//Conditional Logic, as in CONTROLLER
+wire NSpec, ZSpec, CSpec, VSpec;
+
+assign {NSpec, ZSpec, CSpec, VSpec} = FlagsSpec;
+
+always @(*) begin
+
+	case(CondE)
+
+		4'b0000: CondExE = ZSpec;							// EQ
+		4'b0001: CondExE = ~ZSpec;							// NE
+		4'b0010: CondExE = CSpec;							// CS/HS
+		4'b0011: CondExE = ~CSpec;							// CC/LO
+		4'b0100: CondExE = NSpec;							// MI
+		4'b0101: CondExE = ~NSpec;							// PL
+		4'b0110: CondExE = VSpec;							// VS
+		4'b0111: CondExE = ~VSpec;							// VC
+		4'b1000: CondExE = CSpec & ~ZSpec;				// HI
+		4'b1001: CondExE = ~CSpec | ZSpec;				// LS
+		4'b1010: CondExE = (NSpec == VSpec);			// GE
+		4'b1011: CondExE = (NSpec != VSpec);			// LT
+		4'b1100: CondExE = ~ZSpec & (NSpec == VSpec);	// GT
+		4'b1101: CondExE = ZSpec | (NSpec != VSpec);	// LE
+
+		default: CondExE = 1'b1;
+
+	endcase
+
+end
+
+assign BranchTakenE = BranchE && CondExE;
+
+HAZARD_UNIT HZ
+    (
+	  .ValidD(ValidD), .UseRnD(UseRnD), .UseRmD(UseRmD), .RA1D(RA1), .RA2D(RA2),
+	  .ValidE(ValidE), .RegWriteE(RegWriteE), .MemtoRegE(MemtoRegE), .BranchTakenE(BranchTakenE),
+	  .RA1E(RA1E), .RA2E(RA2E), .RdE(RdE),
+	  .RegWriteM(RegWriteM), .RegWriteW(RegWriteW), .RdM(RdM), .RdW(RdW),
+	  .ForwardAE(ForwardAE), .ForwardBE(ForwardBE),
+	  .StallF(StallF), .StallD(StallD), .FlushD(FlushD), .FlushE(FlushE)
+    );
+
+
+// ---------------------------------------------------------------- MEM
+
+always @(posedge clk) begin
+	if(reset == 1'b1) begin
+		ValidM    <= 1'b0;
+		RegWriteM <= 1'b0;
+		MemWriteM <= 1'b0;
+		MemtoRegM <= 1'b0;
+		PCSrcM    <= 1'b0;
+		FlagWriteM <= 1'b0;
+	end
+	else begin
+		ValidM    <= ValidE;
+		RegWriteM <= RegWriteE;
+		MemWriteM <= MemWriteE;
+		MemtoRegM <= MemtoRegE;
+		PCSrcM    <= BranchTakenE;
+		FlagWriteM <= FlagWriteE;
+	end
+
+	FlagsM     <= FlagsAfterE;
+	RdM        <= RdE;
+	ALUOutM    <= ALUResultE;
+	WriteDataM <= WriteDataE;
+	PCM        <= PCE;
+	InstrM     <= InstrE;
+end
+
+assign Adr = ALUOutM;
+assign WriteData = WriteDataM;
+assign ALU_OUT = ALUOutM;
+
+// only loads and stores address the memory, other results may be out of its range
+assign DataAdr = (MemWriteM || MemtoRegM) ? Adr : {WIDTH{1'b0}};
+
+Data_memory DataMem (.clk(clk), .WE(MemWriteM), .ADDR(DataAdr), .WD(WriteData), .RD(ReadData));
+
+
+// ---------------------------------------------------------------- WB
+
+always @(posedge clk) begin
+	if(reset == 1'b1) begin
+		ValidW      <= 1'b0;
+		RegWriteW   <= 1'b0;
+		MemtoRegW   <= 1'b0;
+		PCSrcW      <= 1'b0;
+		FlagWriteW  <= 1'b0;
+	end
+	else begin
+		ValidW      <= ValidM;
+		RegWriteW   <= RegWriteM;
+		MemtoRegW   <= MemtoRegM;
+		PCSrcW      <= PCSrcM;
+		FlagWriteW  <= FlagWriteM;
+	end
+
+	FlagsW    <= FlagsM;
+	RdW       <= RdM;
+	ALUOutW   <= ALUOutM;
+	ReadDataW <= ReadData;
+	PCW       <= PCM;
+	InstrW    <= InstrM;
+end
+
+Mux_2to1 #(.WIDTH(WIDTH)) Result_reg (.select(MemtoRegW), .input_0(ALUOutW), .input_1(ReadDataW), .output_value(RESULT));
+
+// Architectural PC and flags after the last retired instruction
+reg [WIDTH-1:0] PCArch;
+reg [3:0] FlagsArch;
+
+always @(posedge clk) begin
+	if(reset == 1'b1) begin
+		PCArch <= {WIDTH{1'b0}};
+		FlagsArch <= 4'b0000;
+	end
+	else if(ValidW == 1'b1) begin
+		PCArch <= PCSrcW ? ALUOutW : PCW + 4;
+		FlagsArch <= FlagsW;
+	end
+end
+
+assign InstrDone = ValidW;
+assign PCWrite   = ValidW && PCSrcW;
+assign RegWrite  = RegWriteW;
+assign Z_enable  = ValidW && FlagWriteW;
+assign FlagRegInput = FlagsW;
+assign A3        = RdW;
+assign INSTR     = InstrW;
+assign OpW       = InstrW[27:26];
+assign FunctW    = InstrW[25:20];
+assign PC        = ValidW ? PCW + 4 : PCArch;
+assign Flags     = ValidW ? FlagsW : FlagsArch;
+
+endmodule
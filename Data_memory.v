@@ -1,32 +1,52 @@
-module Data_memory#(BYTE_SIZE=4, ADDR_WIDTH=32)(
-input clk,WE,
-input [ADDR_WIDTH-1:0] ADDR,
-input [(BYTE_SIZE*8)-1:0] WD,
-output [(BYTE_SIZE*8)-1:0] RD 
-);
-
-reg [31:0] mem [199:0];
-
-initial begin
-$readmemh("mem_data.txt",mem);
-end
-
-genvar i;
-generate
-	for (i = 0; i < BYTE_SIZE; i = i + 1) begin: read_generate
-		assign RD[8*i+:8] = mem[ADDR+i];
-	end
-endgenerate	
-
-integer k;
-
-always @(posedge clk) begin
-    if(WE == 1'b1) begin	
-        for (k = 0; k < BYTE_SIZE; k = k + 1) begin
-            mem[ADDR+k] <= WD[8*k+:8];
-        end
-    end
-end
-
-endmodule
-
+module Data_memory#(BYTE_SIZE=4, ADDR_WIDTH=32, DEPTH=65536, MEM_FILE="mem_data.txt")(
+input clk,WE,
+input [ADDR_WIDTH-1:0] ADDR,
+input [(BYTE_SIZE*8)-1:0] WD,
+output [(BYTE_SIZE*8)-1:0] RD
+);
+
+// DEPTH bytes, little-endian words at any byte address
+reg [7:0] mem [0:DEPTH-1];
+
+reg [8*256-1:0] mem_file;
+
+integer n;
+
+initial begin
+// bytes past the end of the image read as 0
+for (n = 0; n < DEPTH; n = n + 1)
+    mem[n] = 8'h00;
+// +MEM_FILE=<path> selects the image at simulation start
+if(!$value$plusargs("MEM_FILE=%s", mem_file))
+    /* verilator lint_off WIDTHEXPAND */
+    mem_file = MEM_FILE;
+    /* verilator lint_on WIDTHEXPAND */
+$readmemh(mem_file,mem);
+end
+
+`ifdef FAST_SIM
+// the 32-bit word in a single expression, for simulation
+assign RD = {mem[ADDR+3], mem[ADDR+2], mem[ADDR+1], mem[ADDR]};
+`else
+genvar i;
+generate
+	for (i = 0; i < BYTE_SIZE; i = i + 1) begin: read_generate
+		assign RD[8*i+:8] = mem[ADDR+i];
+	end
+endgenerate
+`endif
+
+integer k;
+
+always @(posedge clk) begin
+    // the address is sampled at the edge that ends the access, once it has settled
+    if(ADDR > DEPTH - BYTE_SIZE)
+        $fatal(1, "Data_memory: %0d-byte access at %h is outside the %0d-byte memory", BYTE_SIZE, ADDR, DEPTH);
+    if(WE == 1'b1) begin
+        for (k = 0; k < BYTE_SIZE; k = k + 1) begin
+            mem[ADDR+k] <= WD[8*k+:8];
+        end
+    end
+end
+
+endmodule
@@ -0,0 +1,16 @@
+// Toplevel of EXTENDER_TEST: the Extender fed by the vector driver. The
+// fields are packed in the order EXTENDER_TEST.py names them.
+module EXTENDER_BENCH;
+
+wire [1:0] select;
+wire [23:0] A;
+wire [31:0] Q;
+
+Vector_driver #(.IN_WIDTH(26), .OUT_WIDTH(32)) driver(
+    .stimulus({select, A}),
+    .response(Q)
+);
+
+Extender uut(.A(A), .select(select), .Q(Q));
+
+endmodule
@@ -0,0 +1,53 @@
+module HAZARD_UNIT
+    (
+	  // Instruction in ID
+	  input ValidD, UseRnD, UseRmD,
+	  input [3:0] RA1D, RA2D,
+
+	  // Instruction in EX
+	  input ValidE, RegWriteE, MemtoRegE, BranchTakenE,
+	  input [3:0] RA1E, RA2E, RdE,
+
+	  // Instructions in MEM and WB, RegWrite already qualified by their valid bit
+	  input RegWriteM, RegWriteW,
+	  input [3:0] RdM, RdW,
+
+	  output reg [1:0] ForwardAE, ForwardBE,
+	  output StallF, StallD, FlushD, FlushE
+    );
+
+// Forwarding to the EX operands: 2'b10 from MEM (ALU result), 2'b01 from WB
+// (RESULT), 2'b00 the value read in ID. R15 never matches, as no instruction
+// writes it.
+always @(*) begin
+
+	if(RegWriteM && (RdM == RA1E))
+		ForwardAE = 2'b10;
+	else if(RegWriteW && (RdW == RA1E))
+		ForwardAE = 2'b01;
+	else
+		ForwardAE = 2'b00;
+
+	if(RegWriteM && (RdM == RA2E))
+		ForwardBE = 2'b10;
+	else if(RegWriteW && (RdW == RA2E))
+		ForwardBE = 2'b01;
+	else
+		ForwardBE = 2'b00;
+
+end
+
+// Load-use: the loaded value only exists in WB, so an instruction that needs
+// it in EX waits one cycle in ID while a bubble enters EX
+wire LoadUse;
+assign LoadUse = ValidD && ValidE && MemtoRegE && RegWriteE &&
+				 ((UseRnD && (RA1D == RdE)) || (UseRmD && (RA2D == RdE)));
+
+assign StallF = LoadUse;
+assign StallD = LoadUse;
+
+// A taken branch resolves in EX and discards the two younger instructions
+assign FlushD = BranchTakenE;
+assign FlushE = BranchTakenE || LoadUse;
+
+endmodule
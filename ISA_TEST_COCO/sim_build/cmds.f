@@ -1 +0,0 @@
-+timescale+1us/1us
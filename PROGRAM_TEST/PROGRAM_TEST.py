@@ -0,0 +1,60 @@
+import json
+import os
+
+import cocotb
+from cocotb.clock import Clock
+from cocotb.triggers import RisingEdge, Timer
+
+from testbench import harness, perf
+from testbench.checker import image_path, pipelined
+from testbench.iss import ISS
+
+
+@cocotb.test()
+async def PROGRAM_TEST(dut):
+
+    """Run the +MEM_FILE image until its halt loop, checking every instruction against the ISS.
+
+    With TB_FREE_RUN set nothing is checked until the halt, only the performance counters at the end.
+    """
+
+    # programs that never reach a branch to itself fail after this many instructions
+    limit = int(os.environ.get("MAX_INSTRUCTIONS", "100000"))
+
+    await cocotb.start(Clock(dut.clk, 10, 'us').start(start_high=False))
+
+    clkedge = RisingEdge(dut.clk)
+
+    dut.reset.value = 1
+    await clkedge
+
+    dut.reset.value = 0
+
+    if os.environ.get("TB_FREE_RUN"):
+        # only the simulator is timed: the ISS gives the length of the run and
+        # the clock runs through it without waking any monitor
+        iss = ISS.from_file(image_path(), pipelined=pipelined(dut))
+        iss.run(limit)
+        assert iss.halted, f"no halt loop reached within {limit} instructions"
+        # to the falling edge of the last cycle, where the stepper would return
+        await Timer(iss.cycles * 10 - 5, 'us')
+    else:
+        # trace, waves, ISS lockstep, control table and coverage, see testbench/harness.py
+        with harness.start(dut) as bench:
+            stepper, iss = bench.stepper, bench.checker.iss
+            while not iss.halted:
+                assert stepper.retired < limit, f"no halt loop reached within {limit} instructions"
+                await stepper.step()
+
+    counters = await perf.sample(dut)
+    assert counters.instret == iss.retired, f"perf_instret {counters.instret} != {iss.retired} (ISS)"
+    assert counters.cycles == iss.cycles, f"perf_cycles {counters.cycles} != {iss.cycles} (ISS)"
+
+    print(f"halted at PC {iss.pc:#x}")
+    print(counters.report())
+
+    # testbench/bench.py reads the counters of each benchmark from here
+    perf_file = cocotb.plusargs.get("PERF_FILE")
+    if perf_file:
+        with open(perf_file, "w") as f:
+            json.dump(counters._asdict(), f)
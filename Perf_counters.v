@@ -0,0 +1,66 @@
+module Perf_counters #(
+     parameter WIDTH=32)
+    (
+	  input  clk, reset,
+	  
+	  // Control signals of the current state
+	  input  InstrDone, PCWrite, Z_enable,
+	  input  [1:0] Op,
+	  /* verilator lint_off UNUSEDSIGNAL */
+	  input  [5:0] Funct, // only the L bit, Funct[0]
+	  /* verilator lint_on UNUSEDSIGNAL */
+	  
+	  output reg [63:0] cycles,
+	  output reg [WIDTH-1:0] instret,
+	  output reg [WIDTH-1:0] branch_taken, branch_not_taken,
+	  output reg [WIDTH-1:0] loads, stores,
+	  output reg [WIDTH-1:0] flag_writes
+    );
+
+// Free-running event counters, cleared by reset. Instructions are counted on
+// the clock edge that retires them, from the control signals of the retiring
+// instruction, which both the multi-cycle core and the pipeline provide.
+
+// the flags were written in an earlier state of the current instruction
+reg flag_written;
+
+always@(posedge clk) begin
+	if (reset == 1'b1) begin
+		cycles           <= 64'd0;
+		instret          <= {WIDTH{1'b0}};
+		branch_taken     <= {WIDTH{1'b0}};
+		branch_not_taken <= {WIDTH{1'b0}};
+		loads            <= {WIDTH{1'b0}};
+		stores           <= {WIDTH{1'b0}};
+		flag_writes      <= {WIDTH{1'b0}};
+		flag_written     <= 1'b0;
+	end
+	else begin
+		cycles <= cycles + 1;
+		
+		if (InstrDone == 1'b1) begin
+			instret <= instret + 1;
+			
+			// Branches retire in the Branch Cycle, where PCWrite is CondEx
+			if ((Op == 2'b10) && (PCWrite == 1'b1))
+				branch_taken <= branch_taken + 1;
+			if ((Op == 2'b10) && (PCWrite == 1'b0))
+				branch_not_taken <= branch_not_taken + 1;
+			
+			if ((Op == 2'b01) && (Funct[0] == 1'b1))
+				loads <= loads + 1;
+			if ((Op == 2'b01) && (Funct[0] == 1'b0))
+				stores <= stores + 1;
+			
+			// one count per instruction that writes the flags
+			if (flag_written || Z_enable)
+				flag_writes <= flag_writes + 1;
+			
+			flag_written <= 1'b0;
+		end
+		else if (Z_enable == 1'b1)
+			flag_written <= 1'b1;
+	end
+end
+	 
+endmodule
@@ -0,0 +1,17 @@
+// Toplevel of SHIFTER_TEST: the shifter at the width of the datapath, fed by
+// the vector driver. The fields are packed in the order SHIFTER_TEST.py names them.
+module SHIFTER_BENCH;
+
+wire [1:0] control;
+wire [4:0] shamt;
+wire [31:0] DATA;
+wire [31:0] OUT;
+
+Vector_driver #(.IN_WIDTH(39), .OUT_WIDTH(32)) driver(
+    .stimulus({control, shamt, DATA}),
+    .response(OUT)
+);
+
+shifter #(.WIDTH(32)) uut(.control(control), .shamt(shamt), .DATA(DATA), .OUT(OUT));
+
+endmodule
@@ -0,0 +1,40 @@
+import cocotb
+import numpy as np
+
+from testbench.vectors import run_unit
+
+WIDTH = 32
+MASK = np.uint64((1 << WIDTH) - 1)
+
+# control codes of shifter.v
+LSL, LSR, ASR, RR = range(4)
+
+# data around the sign bit and the ends of the word
+CORNERS = (0x00000000, 0x00000001, 0x7FFFFFFF, 0x80000000, 0x80000001, 0xFFFFFFFF,
+           0x55555555, 0xAAAAAAAA, 0x12345678, 0xF0000000)
+
+
+def model(control, shamt, data):
+    """Expected OUT of shifter.v for arrays of inputs.
+
+    RR with ``shamt`` 0 shifts left by ``WIDTH``, which clears that half,
+    so it returns DATA unrotated.
+    """
+    width = np.uint64(WIDTH)
+    signed = data.astype(np.uint32).view(np.int32).astype(np.int64)
+    lsl = (data << shamt) & MASK
+    lsr = data >> shamt
+    asr = (signed >> shamt.astype(np.int64)).astype(np.uint64) & MASK
+    # the left half of RR is 0 where WIDTH - shamt reaches WIDTH
+    left = np.where(shamt == 0, np.uint64(0), (data << (width - shamt) % width) & MASK)
+    rr = lsr | left
+    return {"OUT": np.select([control == LSL, control == LSR, control == ASR], [lsl, lsr, asr], rr)}
+
+
+@cocotb.test()
+async def SHIFTER_TEST(dut):
+
+    """Check shifter.v against the NumPy model."""
+
+    # every control code and shift amount over CORNERS
+    await run_unit(dut, {"control": range(4), "shamt": range(32), "DATA": CORNERS}, ("OUT",), model)
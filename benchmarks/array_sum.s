@@ -0,0 +1,51 @@
+; array_sum: R0 <- sum of the COUNT words of array.
+; R12 is never written and stays 0, the base of the constant loads.
+;
+; expect R0 = 148550
+; expect R3 = 0
+
+        LDR   R1, [R12, #array_p]   ; R1 <- &array[0]
+        LDR   R3, [R12, #count]     ; R3 <- words left
+        LDR   R4, [R12, #four]      ; R4 <- 4
+        LDR   R11, [R12, #one]      ; R11 <- 1
+loop:   LDR   R5, [R1]
+        ADD   R0, R0, R5
+        ADD   R1, R1, R4
+        SUBS  R3, R3, R11
+        BNE   loop
+halt:   B     halt
+
+one:    .word 1
+four:   .word 4
+count:  .word 300
+array_p: .word array
+array:  .word 748, 467,  38, 565, 232, 247, 586, 721, 908, 835
+        .word 462, 701,  80, 695, 386, 329, 916, 595, 366, 509
+        .word 856,  87, 898, 169, 588, 243,  14, 493,  48, 255
+        .word 994, 273, 756, 331, 518, 709,   0, 815, 906, 921
+        .word 572, 683, 694, 997, 992, 175, 794, 193,  52, 179
+        .word 438, 501,   8, 815, 874, 105, 196, 699, 142, 405
+        .word 488, 951, 882, 889, 316,   3, 630, 181, 952, 319
+        .word 130, 265, 236, 515, 726, 125, 424, 639, 346, 297
+        .word 956, 299, 678, 925, 208, 607, 106,  97, 820, 235
+        .word 766, 997, 280, 791,  10, 593, 556, 539, 694, 485
+        .word  32, 831, 786,  33, 892, 851, 166, 397, 520, 727
+        .word 434, 889, 564, 739, 430, 405, 360, 583,   2, 457
+        .word 196, 331, 934, 525, 464, 287, 474, 969, 868, 211
+        .word  22,  13, 976, 759, 106, 809, 260, 963, 742, 845
+        .word 568, 175,  98,  57, 780, 611, 918, 341, 680, 903
+        .word 378, 393, 676, 923, 222, 261, 224, 935, 426, 961
+        .word 316, 803, 102, 525, 608, 663, 546, 185, 676, 507
+        .word 822,  37, 112, 295, 546, 545, 180, 723, 542, 909
+        .word 768, 655, 754, 121, 932, 515, 734, 605, 704, 623
+        .word 370, 761, 636,  19,   6, 261, 360, 327, 154, 241
+        .word 204, 891, 710, 261, 728, 495, 338, 345, 308, 915
+        .word 398, 765, 128, 783, 466, 753, 956, 475, 510, 381
+        .word 376, 631, 274, 217, 236, 371,  94, 237, 456, 983
+        .word  90, 769, 820, 683, 830, 229, 248, 871, 794, 105
+        .word 380, 131, 758, 229, 648, 159, 554,   1, 468,  35
+        .word 526, 949, 264, 223, 458, 129, 788, 587, 198, 541
+        .word 208, 903, 626, 865, 820, 131, 654, 189, 240, 911
+        .word 290, 721, 580, 531, 774, 213, 120, 399, 466, 585
+        .word 100, 291, 694, 389, 944, 351, 706, 137, 636, 611
+        .word 142, 149, 832, 991, 738, 113, 932, 827, 182, 109
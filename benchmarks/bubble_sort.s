@@ -0,0 +1,36 @@
+; bubble_sort: sort the COUNT words of array in ascending order.
+; Words are compared unsigned.
+; R12 is never written and stays 0, the base of the constant loads.
+;
+; expect [array] = 3233, 3480, 4507, 6025, 7078, 7999, 11721, 15648
+; expect [array+32] = 23469, 23657, 23754, 27399, 29612, 29804, 29905, 31071
+; expect [array+64] = 31556, 34816, 35903, 39651, 40140, 49095, 50948, 51105
+; expect [array+96] = 54670, 55846, 56084, 59866, 60750, 63753, 64340, 64483
+
+        LDR   R11, [R12, #one]      ; R11 <- 1
+        LDR   R4, [R12, #four]      ; R4 <- 4
+        LDR   R9, [R12, #count]
+        SUBS  R9, R9, R11           ; R9 <- passes left, COUNT - 1
+outer:  LDR   R1, [R12, #array_p]   ; R1 <- &array[0]
+        MOV   R8, R9                ; R8 <- compares in this pass
+inner:  LDR   R5, [R1]              ; R5 <- array[i]
+        LDR   R6, [R1, #4]          ; R6 <- array[i + 1]
+        CMP   R6, R5
+        BHS   next                  ; in order, array[i + 1] >= array[i]
+        STR   R6, [R1]              ; swap
+        STR   R5, [R1, #4]
+next:   ADD   R1, R1, R4
+        SUBS  R8, R8, R11
+        BNE   inner
+        SUBS  R9, R9, R11
+        BNE   outer
+halt:   B     halt
+
+one:    .word 1
+four:   .word 4
+count:  .word 32
+array_p: .word array
+array:  .word 15648, 59866, 40140, 60750,  3233, 56084, 23657,  3480
+        .word  4507, 64483, 63753, 34816, 29612, 35903, 39651, 50948
+        .word 51105, 27399, 31071, 55846, 23754, 31556,  6025, 49095
+        .word 54670, 23469, 11721, 64340,  7999, 29804, 29905,  7078
@@ -0,0 +1,54 @@
+; checksum: rotate-and-xor checksum of the COUNT words of data,
+; R0 <- (R0 ROL 5) ^ word for every word.
+; R12 is never written and stays 0, the base of the constant loads.
+;
+; expect R0 = 0xFE670B4B
+; expect R3 = 0
+
+        LDR   R1, [R12, #data_p]    ; R1 <- &data[0]
+        LDR   R3, [R12, #count]     ; R3 <- words left
+        LDR   R4, [R12, #four]      ; R4 <- 4
+        LDR   R11, [R12, #one]      ; R11 <- 1
+loop:   LDR   R5, [R1]
+        EOR   R0, R5, R0, ROR #27
+        ADD   R1, R1, R4
+        SUBS  R3, R3, R11
+        BNE   loop
+halt:   B     halt
+
+one:    .word 1
+four:   .word 4
+count:  .word 256
+data_p: .word data
+data:   .word 0x3CBB2586, 0x8CF93F2D, 0xDFA816A8, 0xC76709E7, 0x622B7E1A, 0xDD6CB6B1, 0xA307C05C, 0x6374600B
+        .word 0x08AF35EE, 0xC10F8475, 0x286C4B50, 0xCAC0A66F, 0x8B5EA102, 0xBD95EC79, 0xB1152B84, 0xE9BCC113
+        .word 0x2ACD5356, 0x5B7672BD, 0x479F14F8, 0x4E15D3F7, 0x991E20EA, 0x3AEDDB41, 0x6937FBAC, 0x7659431B
+        .word 0x5D571DBE, 0x97432A05, 0xC81313A0, 0xE9D8B27F, 0xE1F59DD2, 0xFC4BA309, 0x1B1CD0D4, 0x7CCE0623
+        .word 0x42C23526, 0x322ECA4D, 0x2EEEE748, 0x64BF6207, 0x2DE4B7BA, 0xA36A63D1, 0xAC044AFC, 0x01232A2B
+        .word 0x6C38398E, 0xC1167395, 0x462D2FF0, 0x7C44028F, 0xE4DF0EA2, 0x29693D99, 0x49430A24, 0xA864CF33
+        .word 0x3016CAF6, 0x947B45DD, 0xB71C8D98, 0xBD24B417, 0x0D4C428A, 0xCB4B5061, 0x6AC1AE4C, 0xD923153B
+        .word 0x506F895E, 0x2D026125, 0xF4DFA040, 0x6BE3969F, 0x1A87F372, 0x8677BC29, 0x257CD774, 0xEBF21C43
+        .word 0x718814C6, 0x3FF4E56D, 0x76ED07E8, 0x7D46CA27, 0x8B61C15A, 0x2539A0F1, 0xCE05259C, 0x6BEA044B
+        .word 0x605A0D2E, 0x4BBFF2B5, 0x438F6490, 0x9ED86EAF, 0x589D4C42, 0xDB401EB9, 0xEAFF38C4, 0x6726ED53
+        .word 0x29131296, 0xBC74A8FD, 0xCA655638, 0x4F66A437, 0x3372342A, 0x721E5581, 0x77A3B0EC, 0xCF48F75B
+        .word 0xFD94C4FE, 0xA0482845, 0x0EE17CE0, 0x07838ABF, 0x940C1912, 0x05CB6549, 0x763F2E14, 0xE9F44263
+        .word 0xEBF4C466, 0xEC13908D, 0x22CA7888, 0x72054247, 0x980A9AFA, 0x51226E11, 0xD2B2503C, 0xD150EE6B
+        .word 0x64FCB0CE, 0x4FD401D5, 0xF0BAE930, 0xB485EACF, 0xB10159E2, 0x8A628FD9, 0x94F1B764, 0x048B1B73
+        .word 0x92AA2A36, 0x9B2A9C1D, 0x56A16ED8, 0xC7E3A457, 0x22F7F5CA, 0xCFAEEAA1, 0x6386038C, 0x0852E97B
+        .word 0x7EAED09E, 0xB1DC7F65, 0x9040A980, 0xE0C08EDF, 0x52EA0EB2, 0x238E9E69, 0x560BD4B4, 0x175C7883
+        .word 0x08F04406, 0x1052CBAD, 0xF1AF3928, 0xE802CA67, 0xE547449A, 0xF96CCB31, 0x17B3CADC, 0xE2DFE88B
+        .word 0xAE08246E, 0xE01AA0F5, 0xF1D7BDD0, 0x035476EF, 0xAC733782, 0x521890F9, 0x59C28604, 0x63195993
+        .word 0x1DC411D6, 0x9C651F3D, 0x84F8D778, 0x2DA3B477, 0x6745876A, 0x68450FC1, 0x9610A62C, 0xB7C8EB9B
+        .word 0xA1A5AC3E, 0x46876685, 0xC7252620, 0xDFA2A2FF, 0x4F89D452, 0xED096789, 0x218ACB54, 0x18B2BEA3
+        .word 0x536293A6, 0x2A7A96CD, 0xF6C349C8, 0xC8476287, 0x787FBE3A, 0xD460B851, 0x8EB1957C, 0xD61EF2AB
+        .word 0x2364680E, 0x335BD015, 0xBF0DE270, 0x954C130F, 0xFD5AE522, 0xB1AA2219, 0x6019A4A4, 0x6959A7B3
+        .word 0xAF48C976, 0xCFEC325D, 0xD2939018, 0xCBAED497, 0xFFC2E90A, 0xA428C4E1, 0x0AEB98CC, 0x9532FDBB
+        .word 0xE86157DE, 0x6710DDA5, 0xD5B6F2C0, 0xB031C71F, 0x765369F2, 0xD383C0A9, 0x496411F4, 0x967F14C3
+        .word 0x8A33B346, 0x5C52F1ED, 0x992EAA68, 0x3FDB0AA7, 0xCB1C07DA, 0x7C463571, 0xBD53B01C, 0x64960CCB
+        .word 0x60F97BAE, 0xA45F8F35, 0xA4855710, 0x3874BF2F, 0x4A2062C2, 0x8C5F4339, 0xE29F1344, 0x01D405D3
+        .word 0x60205116, 0xE987D57D, 0x109998B8, 0x310D04B7, 0x5FD81AAA, 0xCFA20A01, 0x51BEDB6C, 0xDC191FDB
+        .word 0x88C9D37E, 0x4040E4C5, 0xB21E0F60, 0xC275FB3F, 0xA7AECF92, 0xAC45A9C9, 0x523FA894, 0x3D497AE3
+        .word 0xA04BA2E6, 0x6BA3DD0D, 0x94195B08, 0xBFC5C2C7, 0xCA84217A, 0x6F654291, 0xBD421ABC, 0xCBCD36EB
+        .word 0xB6AF5F4E, 0xB1EDDE55, 0xC2661BB0, 0x7ED67B4F, 0x2D2BB062, 0x297FF459, 0x2FFAD1E4, 0x1B1073F3
+        .word 0x7D32A8B6, 0x4100089D, 0x6432F158, 0x30C644D7, 0x6EED1C4A, 0x1AF8DF21, 0x8E326E0C, 0x4C0351FB
+        .word 0x6CC71F1E, 0x22DF7BE5, 0x26827C00, 0x4A773F5F, 0xB8040532, 0xB09722E9, 0xD4C58F34, 0xBD99F103
@@ -0,0 +1,18 @@
+; fib: R0 <- fib(N), iteratively with fib(0) = 0 and fib(1) = 1.
+; R12 is never written and stays 0, the base of the constant loads.
+;
+; expect R0 = 102334155
+; expect R1 = 165580141
+
+        LDR   R11, [R12, #one]      ; R11 <- 1
+        LDR   R3, [R12, #n]         ; R3 <- iterations left
+        MOV   R1, R11               ; R0, R1 <- fib(0), fib(1)
+loop:   ADD   R2, R0, R1
+        MOV   R0, R1
+        MOV   R1, R2
+        SUBS  R3, R3, R11
+        BNE   loop
+halt:   B     halt
+
+one:    .word 1
+n:      .word 40
@@ -0,0 +1,58 @@
+; memcpy: copy COUNT words from src to dst, one LDR/STR pair per word.
+; R12 is never written and stays 0, the base of the constant loads.
+;
+; expect [dst] = 0x00000000, 0x9E3779B9, 0x3C6EF372, 0xDAA66D2B
+; expect [dst+1008] = 0xBE9BD21C, 0x5CD34BD5, 0xFB0AC58E, 0x99423F47
+; expect R3 = 0
+
+        LDR   R1, [R12, #src_p]     ; R1 <- source
+        LDR   R2, [R12, #dst_p]     ; R2 <- destination
+        LDR   R3, [R12, #count]     ; R3 <- words left
+        LDR   R4, [R12, #four]      ; R4 <- 4
+        LDR   R11, [R12, #one]      ; R11 <- 1
+loop:   LDR   R5, [R1]
+        STR   R5, [R2]
+        ADD   R1, R1, R4
+        ADD   R2, R2, R4
+        SUBS  R3, R3, R11
+        BNE   loop
+halt:   B     halt
+
+one:    .word 1
+four:   .word 4
+count:  .word 256
+src_p:  .word src
+dst_p:  .word dst
+src:    .word 0x00000000, 0x9E3779B9, 0x3C6EF372, 0xDAA66D2B, 0x78DDE6E4, 0x1715609D, 0xB54CDA56, 0x5384540F
+        .word 0xF1BBCDC8, 0x8FF34781, 0x2E2AC13A, 0xCC623AF3, 0x6A99B4AC, 0x08D12E65, 0xA708A81E, 0x454021D7
+        .word 0xE3779B90, 0x81AF1549, 0x1FE68F02, 0xBE1E08BB, 0x5C558274, 0xFA8CFC2D, 0x98C475E6, 0x36FBEF9F
+        .word 0xD5336958, 0x736AE311, 0x11A25CCA, 0xAFD9D683, 0x4E11503C, 0xEC48C9F5, 0x8A8043AE, 0x28B7BD67
+        .word 0xC6EF3720, 0x6526B0D9, 0x035E2A92, 0xA195A44B, 0x3FCD1E04, 0xDE0497BD, 0x7C3C1176, 0x1A738B2F
+        .word 0xB8AB04E8, 0x56E27EA1, 0xF519F85A, 0x93517213, 0x3188EBCC, 0xCFC06585, 0x6DF7DF3E, 0x0C2F58F7
+        .word 0xAA66D2B0, 0x489E4C69, 0xE6D5C622, 0x850D3FDB, 0x2344B994, 0xC17C334D, 0x5FB3AD06, 0xFDEB26BF
+        .word 0x9C22A078, 0x3A5A1A31, 0xD89193EA, 0x76C90DA3, 0x1500875C, 0xB3380115, 0x516F7ACE, 0xEFA6F487
+        .word 0x8DDE6E40, 0x2C15E7F9, 0xCA4D61B2, 0x6884DB6B, 0x06BC5524, 0xA4F3CEDD, 0x432B4896, 0xE162C24F
+        .word 0x7F9A3C08, 0x1DD1B5C1, 0xBC092F7A, 0x5A40A933, 0xF87822EC, 0x96AF9CA5, 0x34E7165E, 0xD31E9017
+        .word 0x715609D0, 0x0F8D8389, 0xADC4FD42, 0x4BFC76FB, 0xEA33F0B4, 0x886B6A6D, 0x26A2E426, 0xC4DA5DDF
+        .word 0x6311D798, 0x01495151, 0x9F80CB0A, 0x3DB844C3, 0xDBEFBE7C, 0x7A273835, 0x185EB1EE, 0xB6962BA7
+        .word 0x54CDA560, 0xF3051F19, 0x913C98D2, 0x2F74128B, 0xCDAB8C44, 0x6BE305FD, 0x0A1A7FB6, 0xA851F96F
+        .word 0x46897328, 0xE4C0ECE1, 0x82F8669A, 0x212FE053, 0xBF675A0C, 0x5D9ED3C5, 0xFBD64D7E, 0x9A0DC737
+        .word 0x384540F0, 0xD67CBAA9, 0x74B43462, 0x12EBAE1B, 0xB12327D4, 0x4F5AA18D, 0xED921B46, 0x8BC994FF
+        .word 0x2A010EB8, 0xC8388871, 0x6670022A, 0x04A77BE3, 0xA2DEF59C, 0x41166F55, 0xDF4DE90E, 0x7D8562C7
+        .word 0x1BBCDC80, 0xB9F45639, 0x582BCFF2, 0xF66349AB, 0x949AC364, 0x32D23D1D, 0xD109B6D6, 0x6F41308F
+        .word 0x0D78AA48, 0xABB02401, 0x49E79DBA, 0xE81F1773, 0x8656912C, 0x248E0AE5, 0xC2C5849E, 0x60FCFE57
+        .word 0xFF347810, 0x9D6BF1C9, 0x3BA36B82, 0xD9DAE53B, 0x78125EF4, 0x1649D8AD, 0xB4815266, 0x52B8CC1F
+        .word 0xF0F045D8, 0x8F27BF91, 0x2D5F394A, 0xCB96B303, 0x69CE2CBC, 0x0805A675, 0xA63D202E, 0x447499E7
+        .word 0xE2AC13A0, 0x80E38D59, 0x1F1B0712, 0xBD5280CB, 0x5B89FA84, 0xF9C1743D, 0x97F8EDF6, 0x363067AF
+        .word 0xD467E168, 0x729F5B21, 0x10D6D4DA, 0xAF0E4E93, 0x4D45C84C, 0xEB7D4205, 0x89B4BBBE, 0x27EC3577
+        .word 0xC623AF30, 0x645B28E9, 0x0292A2A2, 0xA0CA1C5B, 0x3F019614, 0xDD390FCD, 0x7B708986, 0x19A8033F
+        .word 0xB7DF7CF8, 0x5616F6B1, 0xF44E706A, 0x9285EA23, 0x30BD63DC, 0xCEF4DD95, 0x6D2C574E, 0x0B63D107
+        .word 0xA99B4AC0, 0x47D2C479, 0xE60A3E32, 0x8441B7EB, 0x227931A4, 0xC0B0AB5D, 0x5EE82516, 0xFD1F9ECF
+        .word 0x9B571888, 0x398E9241, 0xD7C60BFA, 0x75FD85B3, 0x1434FF6C, 0xB26C7925, 0x50A3F2DE, 0xEEDB6C97
+        .word 0x8D12E650, 0x2B4A6009, 0xC981D9C2, 0x67B9537B, 0x05F0CD34, 0xA42846ED, 0x425FC0A6, 0xE0973A5F
+        .word 0x7ECEB418, 0x1D062DD1, 0xBB3DA78A, 0x59752143, 0xF7AC9AFC, 0x95E414B5, 0x341B8E6E, 0xD2530827
+        .word 0x708A81E0, 0x0EC1FB99, 0xACF97552, 0x4B30EF0B, 0xE96868C4, 0x879FE27D, 0x25D75C36, 0xC40ED5EF
+        .word 0x62464FA8, 0x007DC961, 0x9EB5431A, 0x3CECBCD3, 0xDB24368C, 0x795BB045, 0x179329FE, 0xB5CAA3B7
+        .word 0x54021D70, 0xF2399729, 0x907110E2, 0x2EA88A9B, 0xCCE00454, 0x6B177E0D, 0x094EF7C6, 0xA786717F
+        .word 0x45BDEB38, 0xE3F564F1, 0x822CDEAA, 0x20645863, 0xBE9BD21C, 0x5CD34BD5, 0xFB0AC58E, 0x99423F47
+dst:                            ; COUNT words past the end of the image, which read as 0
@@ -0,0 +1,22 @@
+; nested_loop: OUTER x INNER iterations of a two-instruction body,
+; R0 <- OUTER * INNER and R2 <- INNER * (OUTER + (OUTER - 1) + ... + 1).
+; R12 is never written and stays 0, the base of the constant loads.
+;
+; expect R0 = 1200
+; expect R2 = 18600
+; expect R9 = 0
+
+        LDR   R11, [R12, #one]      ; R11 <- 1
+        LDR   R9, [R12, #outer_n]   ; R9 <- outer iterations left
+outer:  LDR   R8, [R12, #inner_n]   ; R8 <- inner iterations left
+inner:  ADD   R0, R0, R11
+        ADD   R2, R2, R9
+        SUBS  R8, R8, R11
+        BNE   inner
+        SUBS  R9, R9, R11
+        BNE   outer
+halt:   B     halt
+
+one:    .word 1
+outer_n: .word 30
+inner_n: .word 40
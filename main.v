@@ -1,89 +1,219 @@
-module main( input clk, 
-				 input reset,
-				 output [2:0] state_out,
-				 output [31:0] RESULT, PC
-				);
-
-wire [3:0] cond_out;
-wire [1:0] op_out;
-wire [5:0] funct_out;
-wire [3:0] rd_out;
-
-wire z_out;
-
-wire PCWrite_out;
-wire AdrSrc_out;
-wire MemWrite_out;
-wire IRWrite_out;
-
-wire Z_enable_out;
-wire BLenable_out;
-wire Bxenable_out;
-  
-wire RegWrite_out;
-wire [1:0] ImmSrc_out;
-wire [1:0] RegSrc_out;
-wire ALUSrcA_out;
-wire [1:0] ALUSrcB_out;
-wire [3:0] ALUControl_out;
-wire [1:0] ResultSrc_out;
-
-
-
-wire [3:0] RA1, RA2, A3;
-wire [31:0] RD1, RD2, SrcA, SrcB, ExtImm;
-wire [31:0] ALU_OUT, A, Data, INSTR;
-
-DATAPATH #(.WIDTH(32)) DP
-    (
-	  .clk(clk), .reset(reset),
-	  
-	  // Control Signals
-	  .PCWrite(PCWrite_out), .AdrSrc(AdrSrc_out), .MemWrite(MemWrite_out), .IRWrite(IRWrite_out), .RegWrite(RegWrite_out), .ALUSrcA(ALUSrcA_out),
-	  .RegSrc(RegSrc_out), .ImmSrc(ImmSrc_out), .ALUSrcB(ALUSrcB_out), .ResultSrc(ResultSrc_out), .Z_enable(Z_enable_out), .BLenable(BLenable_out), .BXenable(Bxenable_out),
-	  .ALUControl(ALUControl_out),
-	  
-	  // Output signals
-	  .Cond(cond_out),
-	  .Op(op_out),
-	  .Funct(funct_out),
-	  .Rd(rd_out),
-	  
-	  .RA1(RA1), .RA2(RA2), .A3(A3),
-	  .RD1(RD1), .RD2(RD2), .PC(PC), .RESULT(RESULT),
-	  .ALU_OUT(ALU_OUT), .A(A), .Data(Data), .INSTR(INSTR), .SrcA(SrcA), .SrcB(SrcB), .ExtImm(ExtImm),
-	  
-	  .Z(z_out)
-	  
-    );
-	 
-CONTROLLER CTRL 
-    (
-	  .clk(clk),
-	  .Cond(cond_out),
-	  .Op(op_out),
-	  .Funct(funct_out),
-	  .Rd(rd_out),
-	  
-	  .Z(z_out),
-	  .Z_enable(Z_enable_out),
-	  .PCWrite(PCWrite_out),
-	  .AdrSrc(AdrSrc_out),
-	  .MemWrite(MemWrite_out),
-	  .IRWrite(IRWrite_out),
-	  
-	  .BLenable(BLenable_out),
-	  .BXenable(Bxenable_out),
-	  
-	  .RegWrite(RegWrite_out),
-	  .ImmSrc(ImmSrc_out),
-	  .RegSrc(RegSrc_out),
-	  .ALUSrcA(ALUSrcA_out),
-	  .ALUSrcB(ALUSrcB_out),
-	  .ALUControl(ALUControl_out),
-	  .ResultSrc(ResultSrc_out),
-	  .state(state_out)
-	  
-    );
-
-endmodule 
\ No newline at end of file
+module main #(parameter PIPELINED = 0)
+			( input clk, 
+				 input reset,
+				 output [2:0] state_out,
+				 output [31:0] RESULT, PC,
+				 
+				 // Performance counters, cleared by reset
+				 output [63:0] perf_cycles,
+				 output [31:0] perf_instret,
+				 output [31:0] perf_branch_taken, perf_branch_not_taken,
+				 output [31:0] perf_loads, perf_stores,
+				 output [31:0] perf_flag_writes
+				);
+
+// Controls between the datapath and the controller. The pipelined core
+// leaves some of them to the testbenches only.
+/* verilator lint_off UNUSEDSIGNAL */
+wire [3:0] cond_out;
+wire [1:0] op_out;
+wire [5:0] funct_out;
+wire [3:0] rd_out;
+
+wire [3:0] flags_out; // {N, Z, C, V}
+
+wire PCWrite_out;
+wire AdrSrc_out;
+wire MemWrite_out;
+wire IRWrite_out;
+
+wire Z_enable_out;
+wire InstrDone_out;
+wire BLenable_out;
+wire Bxenable_out;
+  
+wire RegWrite_out;
+wire [1:0] ImmSrc_out;
+wire [1:0] RegSrc_out;
+wire ALUSrcA_out;
+wire [1:0] ALUSrcB_out;
+wire [3:0] ALUControl_out;
+wire [1:0] ResultSrc_out;
+/* verilator lint_on UNUSEDSIGNAL */
+
+
+
+// Datapath taps, only read by the testbenches
+/* verilator lint_off UNUSEDSIGNAL */
+wire [3:0] RA1, RA2, A3;
+wire [31:0] RD1, RD2, SrcA, SrcB, ExtImm;
+wire [31:0] ALU_OUT, A, Data, INSTR;
+/* verilator lint_on UNUSEDSIGNAL */
+
+// PIPELINED = 0: multi-cycle DATAPATH/CONTROLLER (3-5 cycles per instruction)
+// PIPELINED = 1: five-stage DATAPATH_PIPELINED/CONTROLLER_PIPELINED
+//
+// Either way the signals below describe the instruction being retired, so the
+// testbenches observe both cores alike. In the pipeline the retiring
+// instruction is the one in WB; the *_out controls that only exist in ID
+// show the decode of the instruction in ID.
+generate
+if (PIPELINED) begin : pipeline
+
+	wire RegWrite_id, MemWrite_id, MemtoReg_id, Branch_id, FlagWrite_id, UseRn_id, UseRm_id;
+	wire [1:0] RegSrc_id, ImmSrc_id, ALUSrcB_id;
+	wire [3:0] ALUControl_id;
+	wire [3:0] cond_id, rd_id;
+	wire [1:0] op_id;
+	wire [5:0] funct_id;
+
+	DATAPATH_PIPELINED #(.WIDTH(32)) DP
+	    (
+		  .clk(clk), .reset(reset),
+		  
+		  // Control Signals
+		  .RegWriteD(RegWrite_id), .MemWriteD(MemWrite_id), .MemtoRegD(MemtoReg_id), .BranchD(Branch_id), .FlagWriteD(FlagWrite_id),
+		  .UseRnD(UseRn_id), .UseRmD(UseRm_id),
+		  .RegSrcD(RegSrc_id), .ImmSrcD(ImmSrc_id), .ALUSrcBD(ALUSrcB_id), .ALUControlD(ALUControl_id),
+		  
+		  // Output signals
+		  .CondD(cond_id), .OpD(op_id), .FunctD(funct_id), .RdD(rd_id),
+		  
+		  .InstrDone(InstrDone_out), .PCWrite(PCWrite_out), .RegWrite(RegWrite_out), .Z_enable(Z_enable_out),
+		  .OpW(op_out), .FunctW(funct_out), .A3(A3),
+		  .RESULT(RESULT), .INSTR(INSTR), .PC(PC), .Flags(flags_out),
+		  
+		  .RA1(RA1), .RA2(RA2),
+		  .RD1(RD1), .RD2(RD2), .ExtImm(ExtImm), .SrcA(SrcA), .SrcB(SrcB), .ALU_OUT(ALU_OUT)
+	    );
+	
+	CONTROLLER_PIPELINED CTRL
+	    (
+		  .Op(op_id), .Funct(funct_id), .Rd(rd_id),
+		  
+		  .RegWrite(RegWrite_id),
+		  .MemWrite(MemWrite_id),
+		  .MemtoReg(MemtoReg_id),
+		  .Branch(Branch_id),
+		  .FlagWrite(FlagWrite_id),
+		  .ImmSrc(ImmSrc_id),
+		  .RegSrc(RegSrc_id),
+		  .ALUSrcB(ALUSrcB_id),
+		  .ALUControl(ALUControl_id),
+		  .UseRn(UseRn_id),
+		  .UseRm(UseRm_id)
+	    );
+	
+	assign cond_out = cond_id;
+	assign rd_out = rd_id;
+	assign state_out = 3'd0;
+	
+	// stores have happened in MEM by the time an instruction retires
+	assign MemWrite_out = 1'b0;
+	assign AdrSrc_out = 1'b0;
+	assign IRWrite_out = 1'b1;
+	assign BLenable_out = 1'b0;
+	assign Bxenable_out = 1'b0;
+	
+	assign ImmSrc_out = ImmSrc_id;
+	assign RegSrc_out = RegSrc_id;
+	assign ALUSrcA_out = 1'b0;
+	assign ALUSrcB_out = ALUSrcB_id;
+	assign ALUControl_out = ALUControl_id;
+	assign ResultSrc_out = {1'b0, MemtoReg_id};
+	
+	assign A = SrcA;
+	assign Data = RESULT;
+
+end
+else begin : multicycle
+
+	DATAPATH #(.WIDTH(32)) DP
+	    (
+		  .clk(clk), .reset(reset),
+	  
+		  // Control Signals
+		  .PCWrite(PCWrite_out), .AdrSrc(AdrSrc_out), .MemWrite(MemWrite_out), .IRWrite(IRWrite_out), .RegWrite(RegWrite_out), .ALUSrcA(ALUSrcA_out),
+		  .RegSrc(RegSrc_out), .ImmSrc(ImmSrc_out), .ALUSrcB(ALUSrcB_out), .ResultSrc(ResultSrc_out), .Z_enable(Z_enable_out), .BLenable(BLenable_out), .BXenable(Bxenable_out),
+		  .ALUControl(ALUControl_out),
+	  
+		  // Output signals
+		  .Cond(cond_out),
+		  .Op(op_out),
+		  .Funct(funct_out),
+		  .Rd(rd_out),
+	  
+		  .RA1(RA1), .RA2(RA2), .A3(A3),
+		  .RD1(RD1), .RD2(RD2), .PC(PC), .RESULT(RESULT),
+		  .ALU_OUT(ALU_OUT), .A(A), .Data(Data), .INSTR(INSTR), .SrcA(SrcA), .SrcB(SrcB), .ExtImm(ExtImm),
+	  
+		  .Flags(flags_out)
+	  
+	    );
+	 
+	CONTROLLER CTRL 
+	    (
+		  .clk(clk), .reset(reset),
+		  .Cond(cond_out),
+		  .Op(op_out),
+		  .Funct(funct_out),
+		  .Rd(rd_out),
+	  
+		  .Flags(flags_out),
+		  .Z_enable(Z_enable_out),
+		  .PCWrite(PCWrite_out),
+		  .AdrSrc(AdrSrc_out),
+		  .MemWrite(MemWrite_out),
+		  .IRWrite(IRWrite_out),
+	  
+		  .BLenable(BLenable_out),
+		  .BXenable(Bxenable_out),
+	  
+		  .RegWrite(RegWrite_out),
+		  .ImmSrc(ImmSrc_out),
+		  .RegSrc(RegSrc_out),
+		  .ALUSrcA(ALUSrcA_out),
+		  .ALUSrcB(ALUSrcB_out),
+		  .ALUControl(ALUControl_out),
+		  .ResultSrc(ResultSrc_out),
+		  .state(state_out),
+		  .InstrDone(InstrDone_out)
+	  
+	    );
+
+end
+endgenerate
+
+Perf_counters #(.WIDTH(32)) PERF
+    (
+	  .clk(clk), .reset(reset),
+	  
+	  .InstrDone(InstrDone_out), .PCWrite(PCWrite_out), .Z_enable(Z_enable_out),
+	  .Op(op_out), .Funct(funct_out),
+	  
+	  .cycles(perf_cycles), .instret(perf_instret),
+	  .branch_taken(perf_branch_taken), .branch_not_taken(perf_branch_not_taken),
+	  .loads(perf_loads), .stores(perf_stores),
+	  .flag_writes(perf_flag_writes)
+    );
+
+// Testbench strobe: rises at the falling clock edge of the last state of each
+// instruction, so waiting on it wakes the testbench once per retired instruction
+// while every signal of that state is stable
+/* verilator lint_off UNUSEDSIGNAL */
+wire retire;
+/* verilator lint_on UNUSEDSIGNAL */
+assign retire = InstrDone_out & ~clk;
+
+// Testbench tap: the inputs and outputs of the controller in one vector, so
+// testbench/control.py checks a cycle with a single read. Keep the order of
+// control.FIELDS after {state, Op, Funct, Cond, Flags}.
+/* verilator lint_off UNUSEDSIGNAL */
+wire [40:0] ctrl_vector;
+/* verilator lint_on UNUSEDSIGNAL */
+assign ctrl_vector = {state_out, op_out, funct_out, cond_out, flags_out,
+                      PCWrite_out, AdrSrc_out, MemWrite_out, IRWrite_out, RegWrite_out,
+                      ImmSrc_out, RegSrc_out, ALUSrcA_out, ALUSrcB_out, ALUControl_out, ResultSrc_out,
+                      Z_enable_out, BLenable_out, Bxenable_out, InstrDone_out};
+
+endmodule 
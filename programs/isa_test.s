@@ -0,0 +1,23 @@
+; Program of ISA_TEST_COCO/mem_data.txt, checked by ISA_TEST.py
+; (the image there stops before the final halt loop)
+
+        LDR   R2, [R1, #100]    ; R2 <- 9
+        LDR   R3, [R0, #104]    ; R3 <- 10
+        ADD   R4, R2, R3        ; R4 <- 19
+        SUB   R1, R3, R2        ; R1 <- 1
+        ORR   R6, R2, R3        ; R6 <- 11
+        AND   R5, R2, R3        ; R5 <- 8
+        MOV   R7, R1, LSL #2    ; R7 <- 4
+        STR   R7, [R0, #96]
+        LDR   R8, [R0, #96]     ; R8 <- 4
+        CMP   R2, R6, R5        ; 11 - 8, Z = 0
+        BEQ   target            ; not taken
+        CMP   R7, R8, R7        ; 4 - 4, Z = 1
+        BEQ   target            ; taken
+
+        .org  80
+target: ADD   R8, R8, R1        ; R8 <- 5
+halt:   B     halt
+
+        .org  100
+        .word 9, 10
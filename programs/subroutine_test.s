@@ -0,0 +1,36 @@
+; Program of SUBROUTINE_TEST/mem_data.txt, checked by SR_TEST.py
+; (the image there ends with B main instead of the halt loop)
+
+main:   LDR   R2, [R1, #100]    ; R2 <- 9
+        B     twos              ; R2 <- -R2
+back1:  LDR   R3, [R1, #104]    ; R3 <- 3 (number of loops)
+        LDR   R4, [R1, #108]    ; R4 <- 4 (address step)
+        LDR   R1, [R0, #112]    ; R1 <- 1
+        LDR   R5, [R0, #116]    ; R5 <- 120 (array base)
+        B     sum               ; R10 <- sum of the array
+back2:  LDR   R9, [R3, #120]    ; R9 <- 26
+        B     parity            ; R0 <- parity of R9
+
+        .org  40
+twos:   SUB   R2, R1, R2
+        B     back1
+
+        .org  64
+sum:    LDR   R6, [R5]
+        ADD   R10, R10, R6
+        ADD   R5, R5, R4
+        SUB   R3, R3, R1        ; one loop less to go
+        BGT   sum               ; signed count still above 0
+        B     back2
+
+        .org  100
+        .word 9, 3, 4, 1, 120
+array:  .word 0x1A, 0x2B, 0x3C
+
+parity: AND   R0, R9, R1        ; R8 counts the ones of R9
+        ADD   R8, R8, R0
+        MOV   R9, R9, LSR #1    ; Z once no ones are left
+        BNE   parity
+
+done:   AND   R0, R8, R1
+halt:   B     halt
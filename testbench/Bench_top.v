@@ -0,0 +1,55 @@
+// Standalone toplevel for timing the simulator without cocotb, see
+// testbench/bench.py --native. The clock runs in the simulator: main is held
+// in reset for one rising edge, as PROGRAM_TEST does, and then clocked for
+// +CYCLES=<n> cycles. This repeats +REPEAT=<n> times; the data memory is not
+// reloaded, so only the counters of the first run are printed for checking.
+module Bench_top #(parameter PIPELINED = 0);
+
+reg clk;
+reg reset;
+
+/* verilator lint_off UNUSEDSIGNAL */
+wire [2:0] state_out;
+wire [31:0] RESULT, PC;
+wire [63:0] perf_cycles;
+wire [31:0] perf_instret;
+wire [31:0] perf_branch_taken, perf_branch_not_taken;
+wire [31:0] perf_loads, perf_stores;
+wire [31:0] perf_flag_writes;
+/* verilator lint_on UNUSEDSIGNAL */
+
+main #(.PIPELINED(PIPELINED)) cpu(
+    .clk(clk), .reset(reset), .state_out(state_out), .RESULT(RESULT), .PC(PC),
+    .perf_cycles(perf_cycles), .perf_instret(perf_instret),
+    .perf_branch_taken(perf_branch_taken), .perf_branch_not_taken(perf_branch_not_taken),
+    .perf_loads(perf_loads), .perf_stores(perf_stores),
+    .perf_flag_writes(perf_flag_writes)
+);
+
+integer cycles;
+integer repeats;
+integer run;
+
+initial begin
+if (!$value$plusargs("CYCLES=%d", cycles))
+    cycles = 0;
+if (!$value$plusargs("REPEAT=%d", repeats))
+    repeats = 1;
+clk = 1'b0;
+for (run = 0; run < repeats; run = run + 1) begin
+    reset = 1'b1;
+    #5 clk = 1'b1;
+    #5 clk = 1'b0;
+    reset = 1'b0;
+    repeat (cycles) begin
+        #5 clk = 1'b1;
+        #5 clk = 1'b0;
+    end
+    // read by testbench/bench.py
+    if (run == 0)
+        $display("perf cycles=%0d instret=%0d", perf_cycles, perf_instret);
+end
+$finish;
+end
+
+endmodule
@@ -0,0 +1,41 @@
+// Batch stimulus for the unit tests of the combinational blocks, see
+// testbench/vectors.py. The testbench writes up to DEPTH packed input vectors
+// to IN_FILE, sets count and raises start. The driver then applies one vector
+// per time unit, collects the packed outputs into OUT_FILE and toggles done,
+// so a whole batch costs the testbench a single wake-up.
+module Vector_driver #(IN_WIDTH=1, OUT_WIDTH=1, DEPTH=1048576,
+                       IN_FILE="vectors_in.hex", OUT_FILE="vectors_out.hex")(
+output reg [IN_WIDTH-1:0] stimulus,
+input [OUT_WIDTH-1:0] response
+);
+
+// written by the testbench
+reg start;
+integer count;
+
+reg done;
+
+reg [IN_WIDTH-1:0] stimuli [0:DEPTH-1];
+reg [OUT_WIDTH-1:0] responses [0:DEPTH-1];
+
+integer i;
+
+initial begin
+start = 1'b0;
+count = 0;
+done = 1'b0;
+stimulus = {IN_WIDTH{1'b0}};
+forever begin
+    @(posedge start);
+    $readmemh(IN_FILE, stimuli, 0, count - 1);
+    for (i = 0; i < count; i = i + 1) begin
+        stimulus = stimuli[i];
+        #1 responses[i] = response;
+    end
+    $writememh(OUT_FILE, responses, 0, count - 1);
+    start = 1'b0;
+    done = ~done;
+end
+end
+
+endmodule
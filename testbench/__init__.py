@@ -0,0 +1,5 @@
+"""Shared cocotb helpers for the multi-cycle processor testbenches.
+
+The test directories put the repository root on PYTHONPATH (see their
+Makefiles), so tests import these modules as ``testbench.<module>``.
+"""
@@ -0,0 +1,302 @@
+"""Assembler for the ARM subset executed by the processor.
+
+Produces the byte-per-line little-endian image that ``$readmemh`` loads into
+``Data_memory``. Supported syntax::
+
+    label:                      ; labels may share a line with an instruction
+        LDR   R2, [R1, #100]    ; LDR/STR Rd, [Rn{, #imm12}]
+        ADD   R4, R2, R3        ; OP Rd, Rn, Rm{, LSL|LSR|ASR|ROR #n}
+        MOV   R7, R1, LSL #2    ; MOV/MVN Rd, Rm{, shift}
+        CMP   R2, R6            ; CMP Rn, Rm{, shift} or CMP Rd, Rn, Rm
+        BEQ   label             ; B/BL/BX{cond} label-or-address
+        .org  100               ; continue at this byte address
+        .word 9, 10, label      ; 32-bit data
+
+Comments start with ``;`` or ``//``. Mnemonics take the ARM condition
+suffixes and an optional S. Data-processing immediates are rejected because
+the datapath always uses the shifted register operand.
+
+Branches encode the absolute target address: the datapath moves
+``SignExtend(imm24) << 2`` (``Extender`` with ImmSrc = 10) into the PC.
+"""
+
+import hashlib
+import os
+import re
+import threading
+
+ASSEMBLER_VERSION = "1"
+
+CACHE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "build", "asm")
+
+CONDITIONS = {
+    "EQ": 0x0, "NE": 0x1, "CS": 0x2, "HS": 0x2, "CC": 0x3, "LO": 0x3,
+    "MI": 0x4, "PL": 0x5, "VS": 0x6, "VC": 0x7, "HI": 0x8, "LS": 0x9,
+    "GE": 0xA, "LT": 0xB, "GT": 0xC, "LE": 0xD, "AL": 0xE,
+}
+
+# Funct[4:1] of the data-processing instructions
+DP_OPCODES = {
+    "AND": 0x0, "EOR": 0x1, "SUB": 0x2, "RSB": 0x3, "ADD": 0x4, "ADC": 0x5,
+    "SBC": 0x6, "RSC": 0x7, "CMP": 0xA, "ORR": 0xC, "MOV": 0xD, "BIC": 0xE,
+    "MVN": 0xF,
+}
+
+SHIFTS = {"LSL": 0, "LSR": 1, "ASR": 2, "ROR": 3}
+
+# INSTR[25:24] of the branch instructions
+BRANCH_KINDS = {"B": 0b00, "BL": 0b10, "BX": 0b11}
+
+# INSTR[27:20] of LDR/STR as the existing programs encode them
+MEM_FUNCT = {"LDR": 0x41, "STR": 0x40}
+
+REGISTER_ALIASES = {"SP": 13, "LR": 14, "PC": 15}
+
+_MEM_OPERAND = re.compile(r"^\[\s*(\w+)\s*(?:,\s*#?\s*([^\]]+?))?\s*\]$")
+
+
+class AsmError(Exception):
+    """Syntax or range error, reported with its source line."""
+
+    def __init__(self, message, line=None):
+        if line is not None:
+            message = f"line {line}: {message}"
+        super().__init__(message)
+
+
+def _split_mnemonic(mnemonic):
+    """Return (base, cond, s_bit) for a mnemonic such as ADDEQS or BLNE."""
+    if mnemonic[:3] in MEM_FUNCT:
+        base, rest = mnemonic[:3], mnemonic[3:]
+        if rest in CONDITIONS or rest == "":
+            return base, CONDITIONS.get(rest, 0xE), 0
+    if mnemonic.startswith("B"):
+        # B followed by a condition wins over BL/BX, so BLS is "branch if LS"
+        for base in ("B", "BL", "BX"):
+            rest = mnemonic[len(base):]
+            if mnemonic.startswith(base) and (rest == "" or rest in CONDITIONS):
+                return base, CONDITIONS.get(rest, 0xE), 0
+    base, rest = mnemonic[:3], mnemonic[3:]
+    if base in DP_OPCODES:
+        s_bit = 0
+        if rest.startswith("S") and rest[1:] in CONDITIONS:
+            s_bit, rest = 1, rest[1:]
+        elif rest.endswith("S") and rest[:-1] in CONDITIONS:
+            s_bit, rest = 1, rest[:-1]
+        elif rest == "S":
+            s_bit, rest = 1, ""
+        if rest == "" or rest in CONDITIONS:
+            return base, CONDITIONS.get(rest, 0xE), s_bit
+    raise AsmError(f"unknown mnemonic {mnemonic}")
+
+
+def _split_operands(text):
+    operands, depth, current = [], 0, ""
+    for char in text:
+        if char == "[":
+            depth += 1
+        elif char == "]":
+            depth -= 1
+        if char == "," and depth == 0:
+            operands.append(current.strip())
+            current = ""
+        else:
+            current += char
+    if current.strip():
+        operands.append(current.strip())
+    return operands
+
+
+def _register(text):
+    name = text.strip().upper()
+    if name in REGISTER_ALIASES:
+        return REGISTER_ALIASES[name]
+    if re.fullmatch(r"R(1[0-5]|[0-9])", name):
+        return int(name[1:])
+    raise AsmError(f"expected a register, got {text!r}")
+
+
+class Assembler:
+    """Two-pass assembler: collect labels, then encode."""
+
+    def __init__(self):
+        self.labels = {}
+
+    def value(self, text):
+        text = text.strip().lstrip("#").strip()
+        if text in self.labels:
+            return self.labels[text]
+        try:
+            return int(text, 0)
+        except ValueError:
+            raise AsmError(f"undefined symbol or bad number {text!r}") from None
+
+    def _shift(self, operands):
+        if not operands:
+            return 0
+        if len(operands) != 1:
+            raise AsmError("too many operands")
+        parts = operands[0].split(None, 1)
+        kind = parts[0].upper()
+        if kind not in SHIFTS or len(parts) != 2:
+            raise AsmError(f"expected LSL/LSR/ASR/ROR #n, got {operands[0]!r}")
+        amount = self.value(parts[1])
+        if not 0 <= amount <= 31:
+            raise AsmError(f"shift amount {amount} out of range 0-31")
+        return (amount << 7) | (SHIFTS[kind] << 5)
+
+    def encode(self, mnemonic, operands):
+        base, cond, s_bit = _split_mnemonic(mnemonic.upper())
+        word = cond << 28
+
+        if base in BRANCH_KINDS:
+            if len(operands) != 1:
+                raise AsmError(f"{base} takes one target")
+            target = self.value(operands[0])
+            if target % 4:
+                raise AsmError(f"branch target {target:#x} is not word aligned")
+            imm24 = target >> 2
+            if not -(1 << 23) <= imm24 < (1 << 23):
+                raise AsmError(f"branch target {target:#x} out of range")
+            return word | (0b10 << 26) | (BRANCH_KINDS[base] << 24) | (imm24 & 0xFFFFFF)
+
+        if base in MEM_FUNCT:
+            if len(operands) != 2:
+                raise AsmError(f"{base} takes Rd, [Rn{{, #imm}}]")
+            match = _MEM_OPERAND.match(operands[1])
+            if not match:
+                raise AsmError(f"bad address operand {operands[1]!r}")
+            offset = self.value(match.group(2)) if match.group(2) else 0
+            if not 0 <= offset <= 0xFFF:
+                raise AsmError(f"offset {offset} out of range 0-4095")
+            return (word | (MEM_FUNCT[base] << 20) | (_register(match.group(1)) << 16)
+                    | (_register(operands[0]) << 12) | offset)
+
+        if any(operand.startswith("#") for operand in operands):
+            raise AsmError("the datapath has no data-processing immediates")
+        opcode = DP_OPCODES[base]
+        if base in ("MOV", "MVN"):
+            if len(operands) < 2:
+                raise AsmError(f"{base} takes Rd, Rm{{, shift}}")
+            rd, rn, rm, rest = operands[0], "R0", operands[1], operands[2:]
+        elif base == "CMP":
+            if len(operands) >= 3 and operands[2].split()[0].upper() not in SHIFTS:
+                # the existing programs write CMP Rd, Rn, Rm; Rd is ignored
+                rd, rn, rm, rest = operands[0], operands[1], operands[2], operands[3:]
+            elif len(operands) >= 2:
+                rd, rn, rm, rest = "R0", operands[0], operands[1], operands[2:]
+            else:
+                raise AsmError("CMP takes Rn, Rm{, shift}")
+        else:
+            if len(operands) < 3:
+                raise AsmError(f"{base} takes Rd, Rn, Rm{{, shift}}")
+            rd, rn, rm, rest = operands[0], operands[1], operands[2], operands[3:]
+        return (word | (opcode << 21) | (s_bit << 20) | (_register(rn) << 16)
+                | (_register(rd) << 12) | self._shift(rest) | _register(rm))
+
+    def assemble(self, source):
+        """Assemble ``source`` text and return the memory image as bytes."""
+        items = []
+        address = 0
+        for number, raw in enumerate(source.splitlines(), 1):
+            line = raw.split(";", 1)[0].split("//", 1)[0].strip()
+            while True:
+                match = re.match(r"^([A-Za-z_.$][\w.$]*)\s*:", line)
+                if not match:
+                    break
+                label = match.group(1)
+                if label in self.labels:
+                    raise AsmError(f"label {label} defined twice", number)
+                self.labels[label] = address
+                line = line[match.end():].strip()
+            if not line:
+                continue
+            parts = line.split(None, 1)
+            mnemonic = parts[0]
+            operands = _split_operands(parts[1]) if len(parts) > 1 else []
+            directive = mnemonic.lower()
+            try:
+                if directive == ".org":
+                    address = self.value(operands[0])
+                elif directive == ".word":
+                    for operand in operands:
+                        items.append((number, address, None, [operand]))
+                        address += 4
+                elif directive.startswith("."):
+                    raise AsmError(f"unknown directive {mnemonic}")
+                else:
+                    if address % 4:
+                        raise AsmError(f"instruction at unaligned address {address:#x}")
+                    items.append((number, address, mnemonic, operands))
+                    address += 4
+            except AsmError as error:
+                raise AsmError(str(error), number) from None
+
+        image = bytearray()
+        for number, address, mnemonic, operands in items:
+            try:
+                if mnemonic is None:
+                    word = self.value(operands[0]) & 0xFFFFFFFF
+                else:
+                    word = self.encode(mnemonic, operands)
+            except AsmError as error:
+                raise AsmError(str(error), number) from None
+            if address + 4 > len(image):
+                image.extend(bytes(address + 4 - len(image)))
+            image[address:address + 4] = word.to_bytes(4, "little")
+        return bytes(image)
+
+
+def assemble(source):
+    """Assemble ``source`` text into a memory image."""
+    return Assembler().assemble(source)
+
+
+def format_image(image):
+    """One upper-case hex byte per line, as ``$readmemh`` reads it."""
+    return "".join(f"{byte:02X}\n" for byte in image)
+
+
+def write_image(image, path):
+    with open(path, "w") as f:
+        f.write(format_image(image))
+
+
+def assemble_file(path, cache_dir=CACHE_DIR):
+    """Assemble ``path`` and return the path of its ``$readmemh`` image.
+
+    Images are cached under ``cache_dir`` by the hash of the source text, so
+    unchanged programs are only assembled once across a whole regression.
+    """
+    with open(path) as f:
+        source = f.read()
+    digest = hashlib.sha256((ASSEMBLER_VERSION + "\0" + source).encode()).hexdigest()
+    image_path = os.path.join(cache_dir, digest[:32] + ".txt")
+    if not os.path.exists(image_path):
+        try:
+            image = assemble(source)
+        except AsmError as error:
+            raise AsmError(f"{path}: {error}") from None
+        os.makedirs(cache_dir, exist_ok=True)
+        # write under a name unique to this process and thread first, so parallel
+        # workers never read a partial file nor replace each other's
+        partial = f"{image_path}.{os.getpid()}.{threading.get_ident()}"
+        write_image(image, partial)
+        os.replace(partial, image_path)
+    return image_path
+
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Assemble a program into a mem_data.txt image.")
+    parser.add_argument("source")
+    parser.add_argument("-o", "--output", default="mem_data.txt")
+    args = parser.parse_args(argv)
+
+    with open(args.source) as f:
+        write_image(assemble(f.read()), args.output)
+
+
+if __name__ == "__main__":
+    main()
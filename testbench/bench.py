@@ -0,0 +1,308 @@
+"""Benchmark kernels on the RTL, checked against a cycle-count baseline.
+
+Usage::
+
+    python -m testbench.bench [-j JOBS] [-t PERCENT] [-u] [-s | -n [-r N]] [NAME ...] [VAR=value ...]
+
+Every ``benchmarks/<name>.s`` is a kernel that ends in its halt loop and
+states its result in ``; expect`` comments, a register or consecutive words
+from an address (a label, a number or ``label+offset``)::
+
+    ; expect R0 = 4650
+    ; expect [dst+16] = 5, 6, 7, 8
+
+The expectations are checked on the ISS first. Each kernel then runs on the
+RTL as a ``PROGRAM_TEST`` job of ``testbench/regress.py``; its lockstep
+checker holds the RTL to the ISS at every instruction, and it leaves the
+performance counters of the run in the job's ``perf.json``. The table shows
+cycles, CPI, the wall time of the simulation itself (without make and
+compilation) and the simulated cycles per second.
+
+Under the checkers that rate measures the Python monitors more than the
+simulator. ``--speed`` runs the kernels with ``TB_FREE_RUN=1`` instead: the
+clock runs to the cycle count of the ISS with the trace and every per-cycle
+and per-instruction monitor off, and only the counters are checked at the
+end. Use it with ``-j 1`` to compare builds, e.g. ``FAST_SIM=1`` against
+the default::
+
+    python -m testbench.bench -j 1 --speed SIM=verilator
+    python -m testbench.bench -j 1 --speed SIM=verilator FAST_SIM=1
+
+Even so the rate is that of cocotb's clock, a Python coroutine woken twice
+per cycle. ``--native`` leaves cocotb out. Under Icarus it runs ``main``
+in ``testbench/Bench_top.v``, whose clock runs in ``vvp``; under Verilator
+the C++ driver ``testbench/bench_main.cpp`` clocks the model. Each kernel
+runs for its ISS cycle count ``--repeat`` times, and the simulator process
+is timed. The counters of the first run are checked against the ISS. Only ``SIM``,
+``FAST_SIM`` and ``PIPELINED`` apply to it::
+
+    python -m testbench.bench --native SIM=icarus
+    python -m testbench.bench --native SIM=icarus FAST_SIM=1
+
+The run fails when a kernel takes more cycles than
+``benchmarks/baseline.json`` records for the core plus ``--tolerance``
+percent; ``PIPELINED=1`` selects the pipelined core and its baseline, and
+``--update`` rewrites the baseline of the core from this run.
+"""
+
+import glob
+import json
+import os
+import re
+import subprocess
+import sys
+import time
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
+
+from testbench import build, regress
+from testbench.asm import Assembler, AsmError, assemble_file
+from testbench.iss import ISS, ISSError
+
+BENCH_DIR = os.path.join(regress.ROOT, "benchmarks")
+BASELINE = os.path.join(BENCH_DIR, "baseline.json")
+OUT_DIR = os.path.join(regress.ROOT, "build", "bench")
+NATIVE_TOP = os.path.join(regress.ROOT, "testbench", "Bench_top.v")
+NATIVE_MAIN = os.path.join(regress.ROOT, "testbench", "bench_main.cpp")
+NATIVE_DIR = os.path.join(OUT_DIR, "native")
+
+_EXPECT = re.compile(r";\s*expect\s+(R\d+|\[[^\]]+\])\s*=\s*(.+)$", re.IGNORECASE)
+# printed by Bench_top.v after the first run
+_PERF = re.compile(r"perf cycles=(\d+) instret=(\d+)")
+
+
+class BenchError(Exception):
+    """A kernel that does not assemble, halt or produce its expected result."""
+
+
+def discover(root=BENCH_DIR):
+    """PROGRAM_TEST jobs of the kernels in ``root``, by name."""
+    jobs = []
+    for name in sorted(os.listdir(root)):
+        stem, ext = os.path.splitext(name)
+        if ext == ".s":
+            jobs.append(regress.Job(stem, os.path.join(regress.ROOT, regress.PROGRAM_TEST), os.path.join(root, name)))
+    return jobs
+
+
+def _address(assembler, text):
+    label, _, offset = text.strip("[] ").partition("+")
+    return assembler.value(label) + (assembler.value(offset) if offset else 0)
+
+
+def check(path, max_instructions=1_000_000, pipelined=False):
+    """Run the kernel at ``path`` on the ISS, check its expectations and return the ISS."""
+    with open(path) as f:
+        source = f.read()
+    assembler = Assembler()
+    try:
+        iss = ISS(assembler.assemble(source), pipelined=pipelined)
+        iss.run(max_instructions)
+    except (AsmError, ISSError) as error:
+        raise BenchError(f"{path}: {error}") from None
+    if not iss.halted:
+        raise BenchError(f"{path}: no halt loop reached within {max_instructions} instructions")
+
+    for number, line in enumerate(source.splitlines(), 1):
+        match = _EXPECT.search(line)
+        if not match:
+            continue
+        where, values = match.groups()
+        try:
+            expected = [assembler.value(value) & 0xFFFFFFFF for value in values.split(",")]
+            if where[0] in "Rr":
+                actual = [iss.regs[int(where[1:])]]
+            else:
+                start = _address(assembler, where)
+                actual = [iss.load_word(start + 4 * i) for i in range(len(expected))]
+        except (AsmError, ISSError, IndexError) as error:
+            raise BenchError(f"{path}:{number}: {error}") from None
+        if actual != expected:
+            got = ", ".join(f"{value:#x}" for value in actual)
+            raise BenchError(f"{path}:{number}: {where} = {got}, expected {values.strip()}")
+    return iss
+
+
+def _wall_time(result):
+    """Wall time of the test itself from cocotb's results, None if it did not run."""
+    if not os.path.exists(result.results):
+        return None
+    case = ET.parse(result.results).getroot().find(".//testcase")
+    return None if case is None else float(case.get("time", 0))
+
+
+def _counters(result, out_dir):
+    path = os.path.join(out_dir, result.job.name, "perf.json")
+    if result.returncode != 0 or not os.path.exists(path):
+        return None
+    with open(path) as f:
+        return json.load(f)
+
+
+def native_build(sim, fast_sim=False, pipelined=False, out_dir=NATIVE_DIR):
+    """Compile ``main`` with ``sim`` outside cocotb; return the command that runs it.
+
+    Icarus runs ``Bench_top.v`` and its clock; Verilator compiles ``main``
+    with the C++ driver ``bench_main.cpp``, which evaluates the model directly.
+    """
+    sources = sorted(glob.glob(os.path.join(regress.ROOT, "*.v")))
+    defines = ["-DFAST_SIM"] if fast_sim else []
+    key = " ".join(["native", f"PIPELINED={int(pipelined)}", *defines])
+    directory = build.sim_build(sim, key, sources + [NATIVE_TOP, NATIVE_MAIN], out_dir)
+    if sim == "icarus":
+        image = os.path.join(directory, "bench.vvp")
+        command = ["iverilog", "-g2012", "-s", "Bench_top", f"-PBench_top.PIPELINED={int(pipelined)}",
+                   *defines, "-o", image, *sources, NATIVE_TOP]
+        run = ["vvp", "-n", image]
+    elif sim == "verilator":
+        image = os.path.join(directory, "Vbench")
+        command = ["verilator", "--cc", "--exe", "--build", "-j", "0", "--top-module", "main",
+                   f"-GPIPELINED={int(pipelined)}", *defines, "--Mdir", directory, "-o", "Vbench",
+                   *sources, NATIVE_MAIN]
+        run = [image]
+    else:
+        raise BenchError(f"--native runs SIM=icarus or SIM=verilator, not {sim}")
+    if not os.path.exists(image):
+        os.makedirs(directory, exist_ok=True)
+        log = os.path.join(directory, "compile.log")
+        with open(log, "w") as f:
+            if subprocess.call(command, stdout=f, stderr=subprocess.STDOUT) != 0:
+                raise BenchError(f"{sim} could not compile main, see {log}")
+    return run
+
+
+def run_native(command, image, cycles, repeat=1):
+    """Clock ``image`` for ``cycles`` cycles ``repeat`` times; return the wall time and the first counters."""
+    start = time.monotonic()
+    process = subprocess.run([*command, "+MEM_FILE=" + image, f"+CYCLES={cycles}", f"+REPEAT={repeat}"],
+                             stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
+    wall = time.monotonic() - start
+    match = _PERF.search(process.stdout)
+    if process.returncode != 0 or not match:
+        raise BenchError(f"{image}: simulator exited with {process.returncode}:\n{process.stdout}")
+    return wall, {"cycles": int(match[1]), "instret": int(match[2])}
+
+
+def load_baseline(path=BASELINE):
+    if not os.path.exists(path):
+        return {}
+    with open(path) as f:
+        return json.load(f)
+
+
+def save_baseline(baseline, path=BASELINE):
+    with open(path, "w") as f:
+        json.dump(baseline, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Run the benchmark kernels on the RTL.")
+    parser.add_argument("args", nargs="*", metavar="NAME|VAR=value")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count())
+    parser.add_argument("-t", "--tolerance", type=float, default=0.0, metavar="PERCENT",
+                        help="cycles allowed above the baseline")
+    parser.add_argument("-u", "--update", action="store_true", help="store this run as the baseline")
+    parser.add_argument("-b", "--baseline", default=BASELINE)
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument("-s", "--speed", action="store_true",
+                      help="time the simulator alone, without the trace and the checkers")
+    mode.add_argument("-n", "--native", action="store_true",
+                      help="time the simulator outside cocotb, with its own clock")
+    parser.add_argument("-r", "--repeat", type=int, default=100, metavar="N",
+                        help="runs of each kernel with --native")
+    args = parser.parse_intermixed_args(argv)
+
+    make_vars = [arg for arg in args.args if "=" in arg]
+    if args.speed:
+        make_vars += ["TB_FREE_RUN=1", "TB_VERBOSITY=0"]
+    names = [arg for arg in args.args if "=" not in arg]
+    jobs = discover()
+    if names:
+        unknown = set(names) - {job.name for job in jobs}
+        if unknown:
+            parser.error("unknown benchmark(s): " + ", ".join(sorted(unknown)))
+        jobs = [job for job in jobs if job.name in names]
+    core = "pipeline" if "PIPELINED=1" in make_vars else "multicycle"
+
+    try:
+        iss_runs = {job.name: check(job.program, pipelined=core == "pipeline") for job in jobs}
+    except BenchError as error:
+        print(f"FAIL {error}")
+        return 1
+
+    start = time.monotonic()
+    # name: (counters or None, wall time of the simulation, simulated cycles, failure)
+    runs = {}
+    if args.native:
+        settings = dict(var.split("=", 1) for var in make_vars)
+        try:
+            command = native_build(settings.get("SIM", "icarus"), settings.get("FAST_SIM") == "1",
+                                   core == "pipeline")
+        except BenchError as error:
+            print(f"FAIL {error}")
+            return 1
+        for job in jobs:
+            iss = iss_runs[job.name]
+            try:
+                wall, counters = run_native(command, assemble_file(job.program), iss.cycles, args.repeat)
+            except BenchError as error:
+                runs[job.name] = (None, None, 0, str(error))
+                continue
+            failure = None
+            if (counters["cycles"], counters["instret"]) != (iss.cycles, iss.retired):
+                failure = (f"{job.name}: {counters['cycles']} cycles and {counters['instret']} instructions, "
+                           f"{iss.cycles} and {iss.retired} on the ISS")
+            runs[job.name] = (counters, wall, iss.cycles * args.repeat, failure)
+    else:
+        regress.compile_images(jobs, out_dir=OUT_DIR, make_vars=make_vars)
+        with ThreadPoolExecutor(max_workers=max(1, args.jobs)) as pool:
+            results = list(pool.map(lambda job: regress.run_job(job, out_dir=OUT_DIR, make_vars=make_vars), jobs))
+        for result in results:
+            counters = _counters(result, OUT_DIR)
+            failure = None if counters else f"{result.job.name}: make exited with {result.returncode}, see {result.log}"
+            runs[result.job.name] = (counters, _wall_time(result), counters["cycles"] if counters else 0, failure)
+
+    baseline = load_baseline(args.baseline)
+    reference = baseline.get(core, {})
+    measured = {}
+    failures = []
+    regressions = []
+    print(f"{'benchmark':<16} {'instret':>8} {'cycles':>8} {'CPI':>5} {'wall':>7} {'cycles/s':>9}  baseline")
+    for job in jobs:
+        name = job.name
+        counters, wall, simulated, failure = runs[name]
+        if failure:
+            failures.append(failure)
+        if counters is None:
+            print(f"{name:<16} {'-':>8} {'-':>8} {'-':>5} {'-':>7} {'-':>9}  failed")
+            continue
+        cycles, instret = counters["cycles"], counters["instret"]
+        measured[name] = cycles
+        if name not in reference:
+            status = "new"
+        else:
+            limit = reference[name] * (1 + args.tolerance / 100)
+            status = f"{reference[name]} ({cycles - reference[name]:+d})"
+            if cycles > limit:
+                regressions.append(f"{name}: {cycles} cycles, baseline {reference[name]}")
+        print(f"{name:<16} {instret:>8} {cycles:>8} {cycles / instret:>5.2f} "
+              f"{'-' if wall is None else f'{wall:.2f}s':>7} "
+              f"{'-' if not wall else f'{simulated / wall:.0f}':>9}  {status}")
+
+    if args.update:
+        baseline[core] = {**reference, **measured}
+        save_baseline(baseline, args.baseline)
+        print(f"baseline of the {core} core written to {args.baseline}")
+    else:
+        failures += regressions
+    for failure in failures:
+        print(f"FAIL {failure}")
+    print(f"{len(jobs)} benchmarks on the {core} core, {len(failures)} failures in {time.monotonic() - start:.1f}s")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
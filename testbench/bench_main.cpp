@@ -0,0 +1,50 @@
+// Verilator counterpart of Bench_top.v for testbench/bench.py --native: clocks
+// main from C++, so the rate is that of the model alone. Takes the same
+// +MEM_FILE, +CYCLES and +REPEAT plusargs and prints the same counter line.
+#include <cstdio>
+#include <cstdlib>
+#include <memory>
+#include <string>
+
+#include "Vmain.h"
+#include "verilated.h"
+
+static long plusarg(VerilatedContext& context, const char* name, long fallback) {
+    const std::string prefix = std::string("+") + name + "=";
+    const char* match = context.commandArgsPlusMatch(prefix.c_str() + 1);
+    if (match[0] == '\0') return fallback;
+    return std::strtol(match + prefix.size(), nullptr, 10);
+}
+
+int main(int argc, char** argv) {
+    auto context = std::make_unique<VerilatedContext>();
+    context->commandArgs(argc, argv);
+    auto cpu = std::make_unique<Vmain>(context.get());
+
+    const long cycles = plusarg(*context, "CYCLES", 0);
+    const long repeats = plusarg(*context, "REPEAT", 1);
+
+    cpu->clk = 0;
+    for (long run = 0; run < repeats; run++) {
+        // one rising edge in reset, as PROGRAM_TEST does
+        cpu->reset = 1;
+        cpu->eval();
+        cpu->clk = 1;
+        cpu->eval();
+        cpu->clk = 0;
+        cpu->reset = 0;
+        cpu->eval();
+        for (long i = 0; i < cycles; i++) {
+            cpu->clk = 1;
+            cpu->eval();
+            cpu->clk = 0;
+            cpu->eval();
+        }
+        // read by testbench/bench.py
+        if (run == 0)
+            std::printf("perf cycles=%llu instret=%u\n",
+                        static_cast<unsigned long long>(cpu->perf_cycles), cpu->perf_instret);
+    }
+    cpu->final();
+    return 0;
+}
@@ -0,0 +1,60 @@
+"""Location of the compiled simulation image shared by all tests.
+
+Usage (from ``testbench/sim.mk``)::
+
+    python3 testbench/build.py SIM KEY SOURCE...
+
+prints the ``SIM_BUILD`` directory for these sources. The directory name is a
+hash of the source contents and of ``KEY`` (the compile settings), so every
+test compiled the same way shares one image under ``build/sim/``, and a new
+image is only elaborated when a source really changes. Only the standard
+library is used: the Makefiles run this before cocotb is set up.
+"""
+
+import hashlib
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BUILD_DIR = os.path.join(ROOT, "build", "sim")
+
+# files cocotb's compile rules produce, in dependency order, per simulator
+IMAGES = {
+    "icarus": ("sim.vvp",),
+    "verilator": ("Vtop.mk", "Vtop"),
+}
+
+
+def sim_build(sim, key, sources, build_dir=BUILD_DIR):
+    """Return the build directory for ``sources`` compiled by ``sim`` with ``key``."""
+    digest = hashlib.sha256(f"{sim}\0{key}\0".encode())
+    for path in sorted(sources, key=os.path.basename):
+        digest.update(os.path.basename(path).encode() + b"\0")
+        with open(path, "rb") as f:
+            digest.update(f.read())
+    directory = os.path.join(build_dir, f"{sim}-{digest.hexdigest()[:16]}")
+
+    # the name already guarantees the image matches the sources, so keep make
+    # from rebuilding it only because a checkout touched a source file
+    for name in IMAGES.get(sim, ()):
+        path = os.path.join(directory, name)
+        if os.path.exists(path):
+            os.utime(path)
+    return directory
+
+
+def image(directory, sim):
+    """Path of the make target that compiles the image in ``directory``."""
+    return os.path.join(directory, IMAGES[sim][-1])
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if len(argv) < 3:
+        sys.exit("usage: build.py SIM KEY SOURCE...")
+    sim, key, *sources = argv
+    print(sim_build(sim, key, sources))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""Lockstep comparison of the RTL against the instruction-set simulator."""
+
+import cocotb
+
+from testbench.disasm import disassemble
+from testbench.iss import ISS
+
+
+def _value(handle):
+    """Integer value of ``handle``, or None while it is X/Z."""
+    try:
+        return int(handle.value)
+    except ValueError:
+        return None
+
+
+# generate block of main and data memory instance of each core, by main.PIPELINED
+CORES = {0: ("multicycle", "InstrData"), 1: ("pipeline", "DataMem")}
+
+
+def pipelined(dut):
+    """True when ``dut`` was elaborated with the pipelined core."""
+    return bool(int(dut.PIPELINED.value))
+
+
+def image_path(default="mem_data.txt"):
+    """Image the memories were loaded from: ``+MEM_FILE`` or ``default``."""
+    return cocotb.plusargs.get("MEM_FILE", default)
+
+
+def _hex(value):
+    return "x" if value is None else f"{value:#x}"
+
+
+class LockstepChecker:
+    """Check the architectural state after every retired instruction.
+
+    Attached to an ``InstructionStepper``, it executes the same instruction on
+    the ISS at each retirement and compares the next PC, the register written
+    through ``A3``/``RESULT``, memory stores, the NZCV flags and the cycle count
+    against the ISS timing model. It runs in the last FSM state of the
+    instruction (WB in the pipeline), so writes that the retiring clock edge
+    commits are taken from the write ports (``PCWrite_out``, ``RegWrite_out``,
+    ``MemWrite_out``, ``Z_enable_out``) and everything else from the state
+    elements themselves.
+    """
+
+    def __init__(self, dut, iss):
+        self.dut = dut
+        self.iss = iss
+        block, memory = CORES[int(iss.pipelined)]
+        datapath = getattr(dut, block).DP
+        self._regs = datapath.RegF.Reg_Out
+        self._mem = getattr(datapath, memory).mem
+        self._adr = datapath.Adr
+        self._write_data = datapath.WriteData
+        self._flags_next = datapath.FlagRegInput
+
+    @classmethod
+    def from_image(cls, dut, path=None):
+        return cls(dut, ISS.from_file(path or image_path(), pipelined=pipelined(dut)))
+
+    def attach(self, stepper):
+        stepper.monitors.append(self.check)
+        return self
+
+    def check(self, stepper):
+        dut = self.dut
+        expected = self.iss.step()
+        diffs = []
+
+        word = _value(dut.INSTR)
+        if word != expected.word:
+            diffs.append(f"INSTR rtl={_hex(word)} iss={expected.word:#010x}")
+
+        pc = _value(dut.RESULT) if dut.PCWrite_out.value else _value(dut.PC)
+        if pc != self.iss.pc:
+            diffs.append(f"next PC rtl={_hex(pc)} iss={self.iss.pc:#x}")
+
+        if expected.reg_write is not None:
+            rd, value = expected.reg_write
+            if dut.RegWrite_out.value and _value(dut.A3) == rd:
+                observed = _value(dut.RESULT)
+            else:
+                observed = _value(self._regs[rd])
+            if observed != value:
+                diffs.append(f"R{rd} rtl={_hex(observed)} iss={value:#x}")
+
+        if expected.store is not None:
+            address, value = expected.store
+            if dut.MemWrite_out.value and _value(self._adr) == address:
+                observed = _value(self._write_data)
+            else:
+                observed = self._load_word(address)
+            if observed != value:
+                diffs.append(f"mem[{address:#x}] rtl={_hex(observed)} iss={value:#x}")
+
+        flags = _value(self._flags_next) if dut.Z_enable_out.value else _value(dut.flags_out)
+        if flags != self.iss.flags:
+            diffs.append(f"NZCV rtl={'x' if flags is None else f'{flags:04b}'} iss={self.iss.flags:04b}")
+
+        if stepper.cycles != self.iss.cycles:
+            diffs.append(f"cycles rtl={stepper.cycles} iss={self.iss.cycles}")
+
+        if diffs:
+            raise AssertionError(
+                f"RTL diverged from the ISS at instruction #{stepper.retired} "
+                f"(PC {expected.pc:#x}, {disassemble(expected.word)}): " + "; ".join(diffs)
+            )
+
+    def _load_word(self, address):
+        value = 0
+        for i in range(4):
+            byte = _value(self._mem[address + i])
+            if byte is None:
+                return None
+            value |= (byte & 0xFF) << (8 * i)
+        return value
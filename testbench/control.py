@@ -0,0 +1,193 @@
+"""Cycle-by-cycle check of the multi-cycle ``CONTROLLER`` against a table.
+
+``TABLE`` holds the outputs ``CONTROLLER.v`` drives in every state for every
+``Op``/``Funct`` and condition outcome ``CondEx``, packed into one integer
+in the order of ``FIELDS``. ``main.ctrl_vector`` concatenates the inputs of
+the controller (``state``, ``Op``, ``Funct``, ``Cond``, ``Flags``) and these
+outputs, so a cycle costs one signal read, two list lookups and an integer
+compare::
+
+    ControlChecker(dut).attach(stepper, sampler)
+
+The controls are checked in the per-cycle callback of a ``CycleSampler``,
+which reads ``ctrl_vector`` once at every falling clock edge for all its
+consumers; a mismatch fails the test at the next retirement, with the
+differing signals named. The pipelined core has no FSM and is not checked.
+"""
+
+from testbench.checker import pipelined
+from testbench.iss import cond_passed
+from testbench.sampler import CycleSampler
+
+# (output of CONTROLLER, width in bits), most significant first as in main.ctrl_vector
+FIELDS = (
+    ("PCWrite", 1),
+    ("AdrSrc", 1),
+    ("MemWrite", 1),
+    ("IRWrite", 1),
+    ("RegWrite", 1),
+    ("ImmSrc", 2),
+    ("RegSrc", 2),
+    ("ALUSrcA", 1),
+    ("ALUSrcB", 2),
+    ("ALUControl", 4),
+    ("ResultSrc", 2),
+    ("Z_enable", 1),
+    ("BLenable", 1),
+    ("BXenable", 1),
+    ("InstrDone", 1),
+)
+
+CTRL_BITS = sum(width for _, width in FIELDS)
+CTRL_MASK = (1 << CTRL_BITS) - 1
+
+# signals of main in main.ctrl_vector, most significant first; main names BXenable Bxenable_out
+_VECTOR_LAYOUT = (("state_out", 3), ("op_out", 2), ("funct_out", 6), ("cond_out", 4), ("flags_out", 4)) + tuple(
+    ("Bxenable_out" if name == "BXenable" else name + "_out", width) for name, width in FIELDS)
+
+
+def _locate(layout):
+    located = {}
+    shift = sum(width for _, width in layout)
+    for name, width in layout:
+        shift -= width
+        located[name] = (shift, (1 << width) - 1)
+    return located
+
+
+# signal of main -> (shift, mask) of its bits in main.ctrl_vector
+VECTOR_SIGNALS = _locate(_VECTOR_LAYOUT)
+
+_IDLE = dict.fromkeys((name for name, _ in FIELDS), 0)
+
+_ALU_ADD = 0b0100
+_ALU_SUB = 0b0010
+_ALU_MOV = 0b1101
+_CMP = 0b1010
+
+
+def controls(state, op, funct, cond_ex):
+    """Outputs of ``CONTROLLER`` as a dict, None for the unused states 5-7."""
+    link = (funct >> 4) & 0b11
+    opcode = (funct >> 1) & 0xF
+    load = funct & 1
+    c = dict(_IDLE)
+    if state == 0:
+        # Fetch
+        c.update(PCWrite=1, IRWrite=1, ALUSrcA=1, ALUSrcB=0b10, ALUControl=_ALU_ADD, ResultSrc=0b10)
+    elif state == 1:
+        # Decode
+        c.update(RegSrc=0b10 if op == 0b01 else 0b00, ImmSrc=op, ALUSrcA=1, ALUSrcB=0b10,
+                 ALUControl=_ALU_ADD, ResultSrc=0b10,
+                 BLenable=int(op == 0b10 and link == 0b10), BXenable=int(op == 0b10 and link == 0b11))
+    elif state == 2:
+        if op == 0b01:
+            # MemAddr
+            c.update(RegSrc=0b10, ImmSrc=0b01, ALUSrcB=0b01, ALUControl=_ALU_ADD)
+        elif op == 0b00:
+            # Execute, CMP already subtracts, the flags are written here
+            c.update(ALUControl=_ALU_SUB if opcode == _CMP else opcode, Z_enable=1)
+        elif op == 0b10:
+            # Branch
+            c.update(PCWrite=int(cond_ex), RegSrc=0b01, ImmSrc=0b10, ALUSrcB=0b01, ALUControl=_ALU_MOV,
+                     ResultSrc=0b10, BLenable=int(link == 0b10), BXenable=int(link == 0b11), InstrDone=1)
+        else:
+            c.update(InstrDone=1)
+    elif state == 3:
+        if op == 0b01:
+            # MemRead/MemWrite, STR retires here
+            c.update(AdrSrc=1, MemWrite=1 - load, ImmSrc=0b01, ALUSrcB=0b01, ALUControl=_ALU_ADD,
+                     InstrDone=1 - load)
+        elif op == 0b00:
+            # ALUWB, CMP writes no register
+            c.update(ALUControl=_ALU_SUB if opcode == _CMP else opcode, RegWrite=int(opcode != _CMP),
+                     InstrDone=1)
+    elif state == 4:
+        c.update(InstrDone=1)
+        if op == 0b01 and load:
+            # LDR writeback
+            c.update(RegWrite=1, ImmSrc=0b01, ALUSrcB=0b01, ALUControl=_ALU_ADD, ResultSrc=0b01)
+    else:
+        return None
+    return c
+
+
+def pack(values):
+    """``controls`` dict as the packed integer of ``main.ctrl_vector``."""
+    packed = 0
+    for name, width in FIELDS:
+        packed = (packed << width) | values[name]
+    return packed
+
+
+def unpack(packed):
+    values = {}
+    for name, width in reversed(FIELDS):
+        values[name] = packed & ((1 << width) - 1)
+        packed >>= width
+    return values
+
+
+def _build_table():
+    table = []
+    for state in range(8):
+        for op in range(4):
+            for funct in range(64):
+                for cond_ex in (False, True):
+                    values = controls(state, op, funct, cond_ex)
+                    table.append(None if values is None else pack(values))
+    return table
+
+
+# indexed by {state, Op, Funct, CondEx}
+TABLE = _build_table()
+
+# CondEx indexed by {Cond, Flags}
+COND_EX = [int(cond_passed(cond, flags)) for cond in range(16) for flags in range(16)]
+
+
+def describe(vector):
+    """Mismatch report of one ``main.ctrl_vector`` value."""
+    key = vector >> CTRL_BITS
+    state, op, funct = key >> 16, (key >> 14) & 0b11, (key >> 8) & 0x3F
+    cond, flags = (key >> 4) & 0xF, key & 0xF
+    expected = TABLE[(key >> 8) << 1 | COND_EX[key & 0xFF]]
+    head = f"state={state} Op={op:02b} Funct={funct:06b} Cond={cond:04b} NZCV={flags:04b}"
+    if expected is None:
+        return f"{head}: CONTROLLER in unused state {state}"
+    actual = unpack(vector & CTRL_MASK)
+    diffs = [f"{name} rtl={actual[name]:#x} expected={value:#x}"
+             for name, value in unpack(expected).items() if actual[name] != value]
+    return f"{head}: " + ", ".join(diffs)
+
+
+class ControlChecker:
+    """Compare the ``CONTROLLER`` outputs with ``TABLE`` at every clock cycle."""
+
+    def __init__(self, dut):
+        self.dut = dut
+        self.enabled = not pipelined(dut)
+        self.errors = []
+
+    def attach(self, stepper, sampler=None):
+        """Check every cycle of ``sampler`` and report mismatches at the retirements of ``stepper``.
+
+        Without a ``sampler`` the checker samples on its own.
+        """
+        if self.enabled:
+            sampler = CycleSampler(self.dut) if sampler is None else sampler
+            sampler.add(self._sample)
+            stepper.monitors.append(lambda stepper: self.check())
+        return self
+
+    def check(self):
+        """Fail on the first mismatch sampled so far."""
+        assert not self.errors, f"control signals differ from the table at cycle {self.errors[0]}"
+
+    def _sample(self, cycle, vector):
+        if vector is None:
+            self.errors.append(f"{cycle}: X/Z in {self.dut.ctrl_vector.value.binstr}")
+            return
+        key = vector >> CTRL_BITS
+        if TABLE[(key >> 8) << 1 | COND_EX[key & 0xFF]] != vector & CTRL_MASK:
+            self.errors.append(f"{cycle}: {describe(vector)}")
@@ -0,0 +1,249 @@
+"""Functional coverage of the instruction set and the CONTROLLER states.
+
+Every coverpoint is a fixed grid of bins, and all of them together are one
+flat array of 64-bit hit counts. A test writes that array to a small binary
+file, so merging the files of a whole regression is an element-wise sum,
+O(bins) per file::
+
+    python -m testbench.coverage FILE ... [-o MERGED] [-a]
+
+Retired instructions are sampled from the ISS just before the checker steps
+it, so the instruction and the flags it sees are architectural, and the
+checker ensures the RTL agrees. ``state_op`` and ``imm_src`` are decoded
+from the ``main.ctrl_vector`` a ``CycleSampler`` reads at every falling
+clock edge. The tests collect coverage when
+``+COVERAGE_FILE=<path>`` is given; ``regress.py --coverage`` does that for
+every job and merges the results.
+"""
+
+import hashlib
+import itertools
+import math
+import struct
+import sys
+from array import array
+from collections import namedtuple
+
+import cocotb
+
+from testbench.asm import CONDITIONS, DP_OPCODES
+from testbench.checker import pipelined
+from testbench.control import VECTOR_SIGNALS
+from testbench.iss import cond_passed
+from testbench.sampler import CycleSampler
+
+# axes: one tuple of bin labels per dimension
+Coverpoint = namedtuple("Coverpoint", "name description axes")
+
+_OPS = ("DP", "MEM", "BRANCH", "Op11")
+_DP_NAMES = {code: name for name, code in DP_OPCODES.items()}
+_COND_NAMES = {}
+for _name, _code in CONDITIONS.items():
+    _COND_NAMES.setdefault(_code, _name)
+
+SHAMT_CLASSES = ("0", "1", "2-30", "31")
+
+COVERPOINTS = (
+    Coverpoint("op_funct", "Op x Funct[4:1] of retired instructions",
+               (_OPS, tuple(f"{code:04b}" + (f" {_DP_NAMES[code]}" if code in _DP_NAMES else "")
+                            for code in range(16)))),
+    Coverpoint("cond_taken", "branch condition x outcome",
+               (tuple(_COND_NAMES.get(code, f"{code:04b}") for code in range(16)), ("not taken", "taken"))),
+    Coverpoint("shift", "shift type x shamt class of data-processing instructions",
+               (("LSL", "LSR", "ASR", "ROR"), SHAMT_CLASSES)),
+    Coverpoint("mem", "memory instructions", (("STR", "LDR"),)),
+    Coverpoint("branch_kind", "INSTR[25:24] of branches", (("B", "01", "BL", "BX"),)),
+    Coverpoint("imm_src", "ImmSrc of every cycle", (("00", "01", "10", "11"),)),
+    Coverpoint("state_op", "(state, Op) pairs the CONTROLLER visits",
+               (tuple(str(state) for state in range(5)), _OPS)),
+)
+
+_OFFSETS = {}
+_offset = 0
+for _point in COVERPOINTS:
+    _OFFSETS[_point.name] = _offset
+    _offset += math.prod(len(axis) for axis in _point.axes)
+BINS = _offset
+
+# the per-cycle bins are decoded from these fields of main.ctrl_vector
+_STATE_SHIFT = VECTOR_SIGNALS["state_out"][0]
+_OP_SHIFT = VECTOR_SIGNALS["op_out"][0]
+_IMM_SRC_SHIFT = VECTOR_SIGNALS["ImmSrc_out"][0]
+
+# identifies the bin layout, files of another layout cannot be merged
+LAYOUT = hashlib.sha256(repr([(point.name, point.axes) for point in COVERPOINTS]).encode()).digest()[:8]
+_MAGIC = b"COV1"
+_HEADER = struct.Struct("<4s8sI")
+
+
+class CoverageError(Exception):
+    """A coverage file that is truncated or has another bin layout."""
+
+
+_AXES = {point.name: point.axes for point in COVERPOINTS}
+
+
+def bin_index(name, *indices):
+    """Flat index of a bin of coverpoint ``name``."""
+    index = 0
+    for axis, value in zip(_AXES[name], indices):
+        index = index * len(axis) + value
+    return _OFFSETS[name] + index
+
+
+def shamt_class(shamt):
+    return 0 if shamt == 0 else 1 if shamt == 1 else 3 if shamt == 31 else 2
+
+
+class Coverage:
+    """Hit counts of all bins, filled from a test of the processor.
+
+    Only a coverage with a ``path`` samples anything; ``from_plusargs`` gives
+    the one of the tests, disabled unless ``+COVERAGE_FILE`` is set.
+    """
+
+    def __init__(self, dut=None, path=None, counts=None):
+        self.dut = dut
+        self.path = path
+        self.counts = array("Q", bytes(8 * BINS)) if counts is None else counts
+
+    @classmethod
+    def from_plusargs(cls, dut):
+        return cls(dut, path=cocotb.plusargs.get("COVERAGE_FILE"))
+
+    @property
+    def enabled(self):
+        return self.path is not None
+
+    def hit(self, name, *indices):
+        self.counts[bin_index(name, *indices)] += 1
+
+    def attach(self, stepper, iss):
+        """Sample every retirement from ``iss`` before the checker steps it.
+
+        Call after ``LockstepChecker.attach``; the monitor goes first.
+        """
+        if self.enabled:
+            stepper.monitors.insert(0, lambda stepper: self.sample_instruction(iss.load_word(iss.pc), iss.flags))
+        return self
+
+    def sample_instruction(self, word, flags):
+        """Bins of the instruction ``word`` retiring with NZCV ``flags`` before it."""
+        counts = self.counts
+        op = (word >> 26) & 0b11
+        counts[_OFFSETS["op_funct"] + op * 16 + ((word >> 21) & 0xF)] += 1
+        if op == 0:
+            shift = _OFFSETS["shift"] + ((word >> 5) & 0b11) * 4 + shamt_class((word >> 7) & 0x1F)
+            counts[shift] += 1
+        elif op == 1:
+            counts[_OFFSETS["mem"] + ((word >> 20) & 1)] += 1
+        elif op == 2:
+            cond = word >> 28
+            counts[_OFFSETS["cond_taken"] + cond * 2 + int(cond_passed(cond, flags))] += 1
+            counts[_OFFSETS["branch_kind"] + ((word >> 24) & 0b11)] += 1
+
+    def start(self, sampler=None):
+        """Sample the per-cycle bins at every cycle of ``sampler``, or on its own without one.
+
+        The pipeline has no FSM, its ``state_out`` is constant, so only
+        ``imm_src`` is sampled there.
+        """
+        if self.enabled:
+            self._states = not pipelined(self.dut)
+            sampler = CycleSampler(self.dut) if sampler is None else sampler
+            sampler.add(self._sample_cycle)
+
+    def _sample_cycle(self, cycle, vector):
+        if vector is None:
+            return
+        counts = self.counts
+        if self._states:
+            state = vector >> _STATE_SHIFT
+            if state < 5:
+                counts[_OFFSETS["state_op"] + state * 4 + ((vector >> _OP_SHIFT) & 0b11)] += 1
+        counts[_OFFSETS["imm_src"] + ((vector >> _IMM_SRC_SHIFT) & 0b11)] += 1
+
+    def save(self, path=None):
+        """Write the counts to ``path``, by default the ``path`` of this coverage."""
+        path = path or self.path
+        if path is None:
+            return
+        with open(path, "wb") as f:
+            f.write(_HEADER.pack(_MAGIC, LAYOUT, BINS))
+            f.write(self.counts.tobytes())
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "rb") as f:
+            data = f.read()
+        if len(data) < _HEADER.size:
+            raise CoverageError(f"{path}: not a coverage file")
+        magic, layout, bins = _HEADER.unpack_from(data)
+        if magic != _MAGIC or layout != LAYOUT or bins != BINS:
+            raise CoverageError(f"{path}: coverage file of another bin layout")
+        counts = array("Q")
+        counts.frombytes(data[_HEADER.size:])
+        if len(counts) != BINS:
+            raise CoverageError(f"{path}: truncated coverage file")
+        return cls(counts=counts)
+
+    def merge(self, other):
+        """Add the hit counts of ``other``."""
+        counts = self.counts
+        for index, count in enumerate(other.counts):
+            counts[index] += count
+        return self
+
+    def points(self):
+        """``(coverpoint, [(labels, count), ...])`` for every coverpoint."""
+        for point in COVERPOINTS:
+            start = _OFFSETS[point.name]
+            bins = [(labels, self.counts[start + index])
+                    for index, labels in enumerate(itertools.product(*point.axes))]
+            yield point, bins
+
+    def report(self, bins="missed"):
+        """Hits per coverpoint, each followed by its ``"missed"``, ``"all"`` or ``"none"`` of its bins."""
+        lines = []
+        hit_total = 0
+        for point, counts in self.points():
+            hit = sum(1 for _, count in counts if count)
+            hit_total += hit
+            lines.append(f"{point.name:<12} {hit:>4}/{len(counts):<4} {100 * hit / len(counts):5.1f}%  {point.description}")
+            for labels, count in counts:
+                if bins == "all" or bins == "missed" and not count:
+                    lines.append(f"    {' / '.join(labels):<28} {count}")
+        lines.insert(0, f"coverage: {hit_total}/{BINS} bins ({100 * hit_total / BINS:.1f}%)")
+        return "\n".join(lines)
+
+
+def merge_files(paths):
+    """One ``Coverage`` with the sum of the files at ``paths``."""
+    total = Coverage()
+    for path in paths:
+        total.merge(Coverage.load(path))
+    return total
+
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Merge coverage files and report the bins.")
+    parser.add_argument("files", nargs="+")
+    parser.add_argument("-o", "--output", help="write the merged coverage here")
+    parser.add_argument("-a", "--all", action="store_true", help="list every bin, not only the missed ones")
+    args = parser.parse_args(argv)
+
+    try:
+        total = merge_files(args.files)
+    except (OSError, CoverageError) as error:
+        print(error, file=sys.stderr)
+        return 1
+    if args.output:
+        total.save(args.output)
+    print(total.report("all" if args.all else "missed"))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,74 @@
+"""Disassembler for INSTR values, in the syntax accepted by ``testbench.asm``.
+
+Fields are split the same way as in ``DATAPATH.v``: ``Cond = INSTR[31:28]``,
+``Op = INSTR[27:26]``, ``Funct = INSTR[25:20]`` and ``Rd = INSTR[15:12]``.
+Bits the datapath ignores (the I bit, register-specified shifts, P/U/B/W of
+LDR/STR) are not shown, so the text describes what the processor executes.
+"""
+
+from testbench.asm import BRANCH_KINDS, CONDITIONS, DP_OPCODES, SHIFTS
+
+_CONDITION_NAMES = {}
+for _name, _code in CONDITIONS.items():
+    _CONDITION_NAMES.setdefault(_code, _name)
+_CONDITION_NAMES[0xE] = ""
+
+_DP_NAMES = {code: name for name, code in DP_OPCODES.items()}
+_SHIFT_NAMES = {code: name for name, code in SHIFTS.items()}
+_BRANCH_NAMES = {code: name for name, code in BRANCH_KINDS.items()}
+
+# Decoded words; loops in long traces keep hitting the same few entries
+_cache = {}
+
+
+def disassemble(word):
+    """Mnemonic for the 32-bit instruction ``word``."""
+    text = _cache.get(word)
+    if text is None:
+        text = _cache[word] = _disassemble(word)
+    return text
+
+
+def _disassemble(word):
+    cond = _CONDITION_NAMES[word >> 28] if word >> 28 != 0xF else None
+    op = (word >> 26) & 0b11
+    funct = (word >> 20) & 0x3F
+    rn = (word >> 16) & 0xF
+    rd = (word >> 12) & 0xF
+    if cond is None:
+        return f".word 0x{word:08X}"
+
+    if op == 0b00:
+        name = _DP_NAMES.get(funct >> 1 & 0xF)
+        if name is None:
+            return f".word 0x{word:08X}"
+        operand = f"R{word & 0xF}"
+        shamt = (word >> 7) & 0x1F
+        kind = (word >> 5) & 0b11
+        if shamt or kind:
+            operand += f", {_SHIFT_NAMES[kind]} #{shamt}"
+        mnemonic = name + cond + ("S" if funct & 1 else "")
+        if name in ("MOV", "MVN"):
+            return f"{mnemonic} R{rd}, {operand}"
+        if name == "CMP":
+            if rd:
+                return f"{mnemonic} R{rd}, R{rn}, {operand}"
+            return f"{mnemonic} R{rn}, {operand}"
+        return f"{mnemonic} R{rd}, R{rn}, {operand}"
+
+    if op == 0b01:
+        name = "LDR" if funct & 1 else "STR"
+        offset = word & 0xFFF
+        address = f"[R{rn}, #{offset}]" if offset else f"[R{rn}]"
+        return f"{name}{cond} R{rd}, {address}"
+
+    if op == 0b10:
+        imm24 = word & 0xFFFFFF
+        if imm24 & 0x800000:
+            imm24 -= 0x1000000
+        name = _BRANCH_NAMES.get((word >> 24) & 0b11)
+        if name is None:
+            return f".word 0x{word:08X}"
+        return f"{name}{cond} {imm24 << 2}"
+
+    return f".word 0x{word:08X}"
@@ -0,0 +1,97 @@
+"""Equivalence of the ``FAST_SIM`` models with the structural RTL.
+
+Usage::
+
+    python -m testbench.equiv [-j JOBS] [-o DIR] [VAR=value ...]
+
+``FAST_SIM=1`` (see ``testbench/sim.mk``) swaps in the behavioural register
+file and memory read. On each core this runs ``ISA_TEST_COCO``,
+``SUBROUTINE_TEST``, the programs in ``programs/`` and the benchmark
+kernels twice, structural and with ``FAST_SIM=1``, each under its lockstep
+checker and recording its cycle trace (``TB_TRACE_FILE``). The two traces of
+every job must then retire the same instructions with the same signals
+(``testbench.tracediff --retired``) in the same number of cycles.
+``VAR=value`` arguments are passed to every ``make``, e.g. ``SIM=verilator``.
+"""
+
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from testbench import bench, regress
+from testbench.tracediff import diff, retired
+from testbench.tracefile import load
+
+OUT_DIR = os.path.join(regress.ROOT, "build", "equiv")
+# test directories whose toplevel is main, besides the programs
+TESTS = ("ISA_TEST_COCO", "SUBROUTINE_TEST")
+CORES = {"multicycle": "PIPELINED=0", "pipeline": "PIPELINED=1"}
+BUILDS = {"structural": "FAST_SIM=0", "fast": "FAST_SIM=1"}
+TRACE = "trace.npy"
+
+
+def jobs():
+    """The test, program and benchmark jobs, the kernels named ``benchmarks.<name>``."""
+    selected = [job for job in regress.discover() if job.name in TESTS or job.program is not None]
+    return selected + [job._replace(name="benchmarks." + job.name) for job in bench.discover()]
+
+
+def compare(structural, fast):
+    """Difference between the traces at ``structural`` and ``fast``, None if they agree."""
+    for path in (structural, fast):
+        if not os.path.exists(path):
+            return f"no trace at {path}"
+    old, new = load(structural), load(fast)
+    if len(old) != len(new):
+        return f"{len(old)} cycles structural, {len(new)} with FAST_SIM"
+    old, new = retired(old), retired(new)
+    result = diff(old, new)
+    if result.first is not None:
+        return (f"retirement {result.first} (cycle {int(old[result.first]['cycle'])}) differs in "
+                f"{', '.join(result.fields)}")
+    if len(old) != len(new):
+        return f"{len(old)} retirements structural, {len(new)} with FAST_SIM"
+    return None
+
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Check the FAST_SIM models against the structural RTL.")
+    parser.add_argument("make_vars", nargs="*", metavar="VAR=value")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count())
+    parser.add_argument("-o", "--output", default=OUT_DIR, help="work directory of the runs")
+    args = parser.parse_args(argv)
+
+    start = time.monotonic()
+    selected = jobs()
+    failures = []
+    for core, core_var in CORES.items():
+        work = {}
+        for name, build_var in BUILDS.items():
+            out_dir = os.path.join(args.output, core, name)
+            make_vars = [*args.make_vars, core_var, build_var, "TB_TRACE_FILE=" + TRACE]
+            regress.compile_images(selected, out_dir=out_dir, make_vars=make_vars)
+            with ThreadPoolExecutor(max_workers=max(1, args.jobs)) as pool:
+                results = list(pool.map(lambda job: regress.run_job(job, out_dir=out_dir, make_vars=make_vars),
+                                        selected))
+            failed = regress.merge(results, os.path.join(out_dir, "results.xml"))
+            failures += [f"{core} {name} {result.job.name}: see {result.log}" for result, _ in failed]
+            work[name] = out_dir
+
+        for job in selected:
+            traces = [os.path.join(work[name], job.name, TRACE) for name in BUILDS]
+            difference = compare(*traces)
+            print(f"{core:<11} {job.name:<32} {difference or 'same'}")
+            if difference:
+                failures.append(f"{core} {job.name}: {difference}")
+
+    for failure in failures:
+        print(f"FAIL {failure}")
+    print(f"{len(selected)} jobs on {len(CORES)} cores, {len(failures)} failures in {time.monotonic() - start:.1f}s")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,62 @@
+"""The monitors every processor test runs, started with one call.
+
+Create the harness at the clock edge that starts the first fetch, as the
+``InstructionStepper`` expects, and step the program inside it::
+
+    with harness.start(dut) as bench:
+        await check_instructions(dut, bench.stepper)
+
+``start`` attaches, sharing one ``CycleSampler`` wake-up per cycle:
+
+* the ``CycleTrace`` of the last cycles, printed only if a check fails,
+* the ``WaveWindow`` around a trigger, only when ``TB_WAVES`` is set,
+* the ``LockstepChecker`` comparing every retired instruction with the ISS,
+* the ``ControlChecker`` of every cycle of the multi-cycle ``CONTROLLER``,
+* the functional ``Coverage``, only when ``+COVERAGE_FILE`` is set.
+
+On failure the trace and the waves are dumped; on success the coverage is
+saved and the CPI printed.
+"""
+
+import contextlib
+
+from testbench.checker import LockstepChecker
+from testbench.control import ControlChecker
+from testbench.coverage import Coverage
+from testbench.sampler import CycleSampler
+from testbench.stepper import InstructionStepper
+from testbench.trace import CycleTrace
+from testbench.waves import WaveWindow
+
+
+class Harness:
+    """Stepper, checkers and recorders of one test; see the module doc."""
+
+    def __init__(self, dut):
+        self.dut = dut
+        self.sampler = CycleSampler(dut)
+        self.trace = CycleTrace(dut)
+        self.trace.start(self.sampler)
+        self.waves = WaveWindow.from_env(dut)
+        self.waves.start(self.sampler)
+        self.stepper = InstructionStepper(dut)
+        self.checker = LockstepChecker.from_image(dut).attach(self.stepper)
+        self.control = ControlChecker(dut).attach(self.stepper, self.sampler)
+        # the coverage monitor samples the ISS before the checker steps it
+        self.coverage = Coverage.from_plusargs(dut).attach(self.stepper, self.checker.iss)
+        self.coverage.start(self.sampler)
+
+    def report(self):
+        stepper = self.stepper
+        cpi = stepper.cycles / stepper.retired if stepper.retired else 0.0
+        print(f"{stepper.retired} instructions in {stepper.cycles} cycles, CPI {cpi:.2f}")
+
+
+@contextlib.contextmanager
+def start(dut):
+    """Start a ``Harness`` on ``dut`` and yield it; see the module doc."""
+    bench = Harness(dut)
+    with bench.trace.dump_on_failure(), bench.waves.dump_on_failure():
+        yield bench
+    bench.coverage.save()
+    bench.report()
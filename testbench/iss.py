@@ -0,0 +1,330 @@
+"""Instruction-set simulator for the ARM subset implemented by the RTL.
+
+The model follows what ``DATAPATH.v`` and ``CONTROLLER.v`` actually do rather
+than the ARM architecture manual, so it can serve as a golden reference for
+the RTL:
+
+* data-processing instructions always use a shifted register operand
+  (``Funct[5]``/I and ``Funct[0]``/S are ignored) and select the ALU
+  operation with ``Funct[4:1]``; CMP subtracts without writing back and the
+  codes the ALU does not implement produce 0,
+* ``Bit_Clear`` computes ``A ^ ~B``; ADC/SBC/RSC take the C flag as
+  carry-in,
+* LDR/STR always add the zero-extended imm12 to Rn,
+* B, BL and BX all jump to the absolute address ``SignExtend(imm24) << 2``;
+  BL does not write R14 and BX does not read it,
+* only branches are conditional, on any ARM condition code; 1111 passes
+  like AL,
+* data-processing instructions, CMP included, write all of NZCV whatever
+  the S bit; logical operations and MOV/MVN clear C and V, subtractions set
+  C to NOT borrow. Nothing else writes the flags,
+* R15 reads as the instruction address + 8 and writes to it are dropped.
+"""
+
+from collections import namedtuple
+
+MASK = 0xFFFFFFFF
+
+# Bytes of Data_memory, its DEPTH parameter
+MEM_SIZE = 65536
+
+# Instruction classes, the Op field INSTR[27:26]
+DP = 0
+MEM = 1
+BRANCH = 2
+UNDEFINED = 3
+
+# Cycles each class spends in the CONTROLLER FSM; LDR adds the Writeback cycle
+CYCLES = (4, 4, 3, 3)
+LOAD_CYCLES = 5
+
+# DATAPATH_PIPELINED: the first instruction retires once IF..MEM have filled,
+# then one per cycle, plus the two instructions a taken branch discards and
+# the bubble of an instruction that uses the register loaded just before it
+PIPELINE_FILL = 4
+BRANCH_PENALTY = 2
+LOAD_USE_PENALTY = 1
+
+# Bits of the flags, {N, Z, C, V} as in DATAPATH.RegFlags
+FLAG_N = 0b1000
+FLAG_Z = 0b0100
+FLAG_C = 0b0010
+FLAG_V = 0b0001
+
+
+def _add(a, b, carry):
+    """``(result, carry out, overflow)`` of ``a + b + carry``."""
+    total = a + b + carry
+    result = total & MASK
+    overflow = (~(a ^ b) & (a ^ result)) >> 31 & 1
+    return result, total >> 32, overflow
+
+
+def _sub(a, b, carry):
+    # subtractions add the inverted operand, the carry out is NOT borrow
+    return _add(a, ~b & MASK, carry)
+
+
+def _logic(result):
+    return result, 0, 0
+
+
+# ALUControl codes of ALU.v: (a, b, carry in) -> (result, carry out, overflow)
+ALU_OPS = {
+    0b0000: lambda a, b, c: _logic(a & b),
+    0b0001: lambda a, b, c: _logic(a ^ b),
+    0b0010: lambda a, b, c: _sub(a, b, 1),
+    0b0011: lambda a, b, c: _sub(b, a, 1),
+    0b0100: lambda a, b, c: _add(a, b, 0),
+    0b0101: lambda a, b, c: _add(a, b, c),
+    0b0110: lambda a, b, c: _sub(a, b, c),
+    0b0111: lambda a, b, c: _sub(b, a, c),
+    0b1100: lambda a, b, c: _logic(a | b),
+    0b1101: lambda a, b, c: _logic(b),
+    0b1110: lambda a, b, c: _logic(a ^ (~b & MASK)),
+    0b1111: lambda a, b, c: _logic(~b & MASK),
+}
+ALU_CMP = 0b1010
+ALU_SUB = 0b0010
+
+
+def _alu_zero(a, b, c):
+    return 0, 0, 0
+
+
+def flags_of(result, carry, overflow):
+    """NZCV of an ALU result."""
+    return (result >> 28 & FLAG_N) | (FLAG_Z if result == 0 else 0) | carry << 1 | overflow
+
+
+def _lsl(value, shamt):
+    return (value << shamt) & MASK
+
+
+def _lsr(value, shamt):
+    return value >> shamt
+
+
+def _asr(value, shamt):
+    if value & 0x80000000:
+        return ((value - 0x100000000) >> shamt) & MASK
+    return value >> shamt
+
+
+def _ror(value, shamt):
+    # WIDTH - shamt is 32 for shamt = 0, which shifts everything out
+    return ((value >> shamt) | (value << (32 - shamt))) & MASK
+
+
+# shifter.v control codes, INSTR[6:5]
+SHIFTS = (_lsl, _lsr, _asr, _ror)
+
+Retired = namedtuple("Retired", "pc word reg_write store")
+Retired.__doc__ = """One executed instruction.
+
+``reg_write`` is ``(register, value)`` and ``store`` is ``(address, value)``,
+or None when the instruction did not write a register or memory.
+"""
+
+
+class ISSError(Exception):
+    """The program did something the RTL cannot do, e.g. leave the memory."""
+
+
+def decode(word):
+    """Predecode ``word`` into a tuple whose first entry is its class."""
+    op = (word >> 26) & 0b11
+    rn = (word >> 16) & 0xF
+    rd = (word >> 12) & 0xF
+    rm = word & 0xF
+    shift = SHIFTS[(word >> 5) & 0b11]
+    shamt = (word >> 7) & 0x1F
+    if op == DP:
+        code = (word >> 21) & 0xF
+        if code == ALU_CMP:
+            return (DP, ALU_OPS[ALU_SUB], rn, rd, rm, shift, shamt, False)
+        return (DP, ALU_OPS.get(code, _alu_zero), rn, rd, rm, shift, shamt, rd != 15)
+    if op == MEM:
+        return (MEM, rn, rd, word & 0xFFF, bool(word & (1 << 20)))
+    if op == BRANCH:
+        imm24 = word & 0xFFFFFF
+        if imm24 & 0x800000:
+            imm24 -= 0x1000000
+        return (BRANCH, word >> 28, (imm24 << 2) & MASK)
+    # Op = 11 falls through to the default FSM states, which write nothing
+    return (UNDEFINED, rn, rm)
+
+
+def _condition(n, z, c, v):
+    return (z, not z, c, not c, n, not n, v, not v,
+            c and not z, not c or z, n == v, n != v, not z and n == v, z or n != v, True, True)
+
+
+# cond_passed results, indexed by {Cond, NZCV}
+_COND_PASSED = tuple(_condition(*(bool(flags & bit) for bit in (FLAG_N, FLAG_Z, FLAG_C, FLAG_V)))[cond]
+                     for cond in range(16) for flags in range(16))
+
+
+def cond_passed(cond, flags):
+    """Whether condition ``cond`` holds for the NZCV ``flags``."""
+    return _COND_PASSED[cond << 4 | flags]
+
+
+def read_image(path):
+    """Read a ``$readmemh`` byte-per-line image into a bytearray."""
+    image = bytearray()
+    address = 0
+    with open(path) as f:
+        for line in f:
+            line = line.split("//", 1)[0]
+            for token in line.split():
+                if token.startswith("@"):
+                    address = int(token[1:], 16)
+                    continue
+                if address >= len(image):
+                    image.extend(bytes(address + 1 - len(image)))
+                image[address] = int(token, 16) & 0xFF
+                address += 1
+    return image
+
+
+class ISS:
+    """Architectural state and execution of one program image."""
+
+    def __init__(self, image=b"", mem_size=MEM_SIZE, pipelined=False):
+        if len(image) > mem_size:
+            raise ISSError(f"image of {len(image)} bytes does not fit in {mem_size}")
+        self.mem = bytearray(mem_size)
+        self.mem[:len(image)] = image
+        # regs[15] is refreshed with PC + 8 before every instruction
+        self.regs = [0] * 16
+        self.pc = 0
+        # NZCV, FLAG_N ... FLAG_V
+        self.flags = 0
+        self.retired = 0
+        self.cycles = 0
+        self.halted = False
+        self.pipelined = pipelined
+        self._decoded = {}
+        # pipeline timing: penalty owed by the next instruction, register loaded by the last one
+        self._penalty = PIPELINE_FILL
+        self._loaded = None
+
+    @classmethod
+    def from_file(cls, path, mem_size=MEM_SIZE, pipelined=False):
+        return cls(read_image(path), mem_size, pipelined)
+
+    def reg(self, n):
+        """Value of register ``n`` as the next instruction would read it."""
+        return (self.pc + 8) & MASK if n == 15 else self.regs[n]
+
+    def load_word(self, address):
+        if address + 4 > len(self.mem):
+            raise ISSError(f"word access at {address:#x} is outside the memory")
+        return int.from_bytes(self.mem[address:address + 4], "little")
+
+    def step(self):
+        """Execute one instruction and return its ``Retired`` record."""
+        pc = self.pc
+        if pc + 4 > len(self.mem):
+            raise ISSError(f"fetch at {pc:#x} is outside the memory")
+        word = int.from_bytes(self.mem[pc:pc + 4], "little")
+        record = self._decoded.get(word)
+        if record is None:
+            record = self._decoded[word] = decode(word)
+        regs = self.regs
+        regs[15] = (pc + 8) & MASK
+        next_pc = pc + 4
+        reg_write = None
+        store = None
+        kind = record[0]
+        cycles = CYCLES[kind]
+        taken = False
+
+        if kind == DP:
+            _, alu, rn, rd, rm, shift, shamt, write = record
+            result, carry, overflow = alu(regs[rn], shift(regs[rm], shamt), self.flags >> 1 & 1)
+            self.flags = flags_of(result, carry, overflow)
+            if write:
+                regs[rd] = result
+                reg_write = (rd, result)
+        elif kind == MEM:
+            _, rn, rd, imm12, load = record
+            address = (regs[rn] + imm12) & MASK
+            if address + 4 > len(self.mem):
+                raise ISSError(f"word access at {address:#x} is outside the memory")
+            if load:
+                cycles = LOAD_CYCLES
+                value = int.from_bytes(self.mem[address:address + 4], "little")
+                if rd != 15:
+                    regs[rd] = value
+                    reg_write = (rd, value)
+            else:
+                value = regs[rd]
+                self.mem[address:address + 4] = value.to_bytes(4, "little")
+                store = (address, value)
+        else:
+            _, cond, target = record
+            taken = cond_passed(cond, self.flags)
+            if taken:
+                next_pc = target
+                self.halted = target == pc
+
+        if self.pipelined:
+            cycles = self._pipeline_cycles(record, taken)
+
+        self.pc = next_pc
+        self.retired += 1
+        self.cycles += cycles
+        return Retired(pc, word, reg_write, store)
+
+    def _pipeline_cycles(self, record, taken):
+        kind = record[0]
+        if kind == DP:
+            sources = (record[2], record[4])
+        elif kind == UNDEFINED:
+            sources = (record[1], record[2])
+        elif kind == MEM:
+            sources = (record[1],) if record[4] else (record[1], record[2])
+        else:
+            sources = ()
+        cycles = 1 + self._penalty
+        if self._loaded is not None and self._loaded in sources:
+            cycles += LOAD_USE_PENALTY
+        self._penalty = BRANCH_PENALTY if kind == BRANCH and taken else 0
+        self._loaded = record[2] if kind == MEM and record[4] and record[2] != 15 else None
+        return cycles
+
+    def run(self, max_instructions=1_000_000):
+        """Run until a branch to itself (halt) or ``max_instructions``.
+
+        Returns the number of instructions executed by this call.
+        """
+        step = self.step
+        for count in range(1, max_instructions + 1):
+            step()
+            if self.halted:
+                return count
+        return max_instructions
+
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Run a mem_data.txt image on the ISS.")
+    parser.add_argument("image", help="byte-per-line $readmemh image")
+    parser.add_argument("-n", "--max-instructions", type=int, default=1_000_000)
+    parser.add_argument("-p", "--pipelined", action="store_true", help="count cycles of the pipelined core")
+    args = parser.parse_args(argv)
+
+    iss = ISS.from_file(args.image, pipelined=args.pipelined)
+    iss.run(args.max_instructions)
+    state = "halted" if iss.halted else "stopped"
+    print(f"{state} at PC={iss.pc:#x} after {iss.retired} instructions, {iss.cycles} cycles")
+    for n in range(15):
+        print(f"R{n:<2} = {iss.regs[n]:08X}")
+    print(f"NZCV = {iss.flags:04b}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""Hardware performance counters of ``main``.
+
+``Perf_counters`` counts events on the clock edges that complete them, so a
+handful of reads gives CPI and the instruction mix of a whole run::
+
+    before = await perf.sample(dut)
+    ...                                 # run the code of interest
+    counters = await perf.sample(dut) - before
+    print(counters.report())
+"""
+
+from collections import namedtuple
+
+from cocotb.triggers import ReadOnly, RisingEdge
+
+# main.perf_<name>, in port order
+COUNTERS = ("cycles", "instret", "branch_taken", "branch_not_taken", "loads", "stores", "flag_writes")
+
+
+class PerfCounters(namedtuple("PerfCounters", COUNTERS)):
+    """One reading of all counters; subtract two readings for an interval."""
+
+    __slots__ = ()
+
+    def __sub__(self, other):
+        return PerfCounters(*(a - b for a, b in zip(self, other)))
+
+    @property
+    def branches(self):
+        return self.branch_taken + self.branch_not_taken
+
+    @property
+    def cpi(self):
+        return self.cycles / self.instret if self.instret else 0.0
+
+    def mix(self):
+        """Share of the retired instructions in each class."""
+        if not self.instret:
+            return {}
+        other = self.instret - self.loads - self.stores - self.branches
+        counts = {"load": self.loads, "store": self.stores, "branch": self.branches, "other": other}
+        return {name: count / self.instret for name, count in counts.items()}
+
+    def report(self):
+        mix = ", ".join(f"{name} {share:.0%}" for name, share in self.mix().items())
+        return (
+            f"{self.instret} instructions in {self.cycles} cycles, CPI {self.cpi:.2f}\n"
+            f"branches {self.branch_taken} taken / {self.branch_not_taken} not taken, "
+            f"{self.flag_writes} flag writes\n"
+            f"mix: {mix}"
+        )
+
+
+def read(dut):
+    """Counter values as they are now; see ``sample`` for a settled reading."""
+    return PerfCounters(*(int(getattr(dut, "perf_" + name).value) for name in COUNTERS))
+
+
+async def sample(dut):
+    """Read the counters after the next rising clock edge has updated them.
+
+    Called right after ``InstructionStepper.step``, the reading includes the
+    instruction that just retired.
+    """
+    await RisingEdge(dut.clk)
+    await ReadOnly()
+    return read(dut)
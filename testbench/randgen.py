@@ -0,0 +1,233 @@
+"""Constrained-random programs for the processor.
+
+``generate(seed)`` returns a complete memory image that is a pure function of
+the seed. The image covers the first IMAGE_SIZE bytes of ``Data_memory``,
+laid out as::
+
+    0   .. CODE_END         code, ending in ``halt: B halt``
+    POOL .. SCRATCH         random constants, loaded with LDR Rd, [R12, #imm]
+    SCRATCH .. IMAGE_SIZE   words the program stores to and loads back
+
+Half of the loads and stores go to a far window of FAR_WINDOW bytes instead,
+at a random address anywhere in the ``mem_size`` bytes of ``Data_memory``
+past the image (``iss.MEM_SIZE``, its ``DEPTH``, by default). Its bytes are
+0 until the program stores to them, so some stores are loaded back on
+purpose a few instructions later.
+
+Register use is fixed so that every program is legal and terminates:
+R0-R9 hold the random data, R10 counts loop iterations, R11 holds 1, R12 is
+never written, so it stays 0 and serves as the base of the image, and R13
+holds the base of the far window. Branches only go forward, on any
+condition, except the back edge of a counted loop::
+
+    LDR R10, [R12, #COUNT]
+    loop: <body>
+          SUB R10, R10, R11
+          BNE loop
+
+Words are encoded directly instead of going through the assembler, so a
+program takes well under a millisecond to generate. Usage::
+
+    python -m testbench.randgen SEED [-n COUNT] [-m MEM_SIZE] [-o DIR] [-l]
+"""
+
+import os
+import random
+
+from testbench.asm import BRANCH_KINDS, CONDITIONS, DP_OPCODES, MEM_FUNCT, format_image
+from testbench.iss import MEM_SIZE
+
+IMAGE_SIZE = 200
+CODE_END = 160
+POOL = 160
+SCRATCH = 184
+
+# constants every program needs at fixed pool addresses
+ONE = POOL
+COUNT = POOL + 4
+FAR = POOL + 8
+
+# bytes of the far window, reached with a 12-bit offset from its base in R13
+FAR_WINDOW = 64
+
+DATA_REGS = range(10)
+COUNTER, ONE_REG, BASE, FAR_BASE = 10, 11, 12, 13
+
+_AL = CONDITIONS["AL"] << 28
+# operations of the datapath, CMP only sets the flags
+_WRITING = [op for name, op in DP_OPCODES.items() if name != "CMP"]
+_CMP = DP_OPCODES["CMP"]
+_SUB = DP_OPCODES["SUB"]
+# one name per condition code, AL included
+_COND_NAMES = {}
+for _name, _code in CONDITIONS.items():
+    _COND_NAMES.setdefault(_code, _name)
+_CONDS = tuple(_COND_NAMES.values())
+
+
+def _dp(op, rd, rn, rm, shift=0, shamt=0):
+    return _AL | op << 21 | rn << 16 | rd << 12 | shamt << 7 | shift << 5 | rm
+
+
+def _mem(name, rd, rn, imm12):
+    return _AL | MEM_FUNCT[name] << 20 | rn << 16 | rd << 12 | imm12
+
+
+def _branch(target, cond="AL", kind="B"):
+    return CONDITIONS[cond] << 28 | 0b10 << 26 | BRANCH_KINDS[kind] << 24 | (target >> 2) & 0xFFFFFF
+
+
+class Generator:
+    """Random program builder; ``words`` grows from address 0."""
+
+    def __init__(self, seed, mem_size=MEM_SIZE):
+        if mem_size < IMAGE_SIZE:
+            raise ValueError(f"a memory of {mem_size} bytes cannot hold the {IMAGE_SIZE}-byte image")
+        self.rng = random.Random(seed)
+        self.words = []
+        self.window = min(FAR_WINDOW, mem_size - IMAGE_SIZE)
+        self.far = self.rng.randrange(IMAGE_SIZE, mem_size - self.window + 1, 4)
+
+    @property
+    def pc(self):
+        return 4 * len(self.words)
+
+    def _source(self):
+        # mostly data registers, sometimes the constant ones and PC + 8
+        roll = self.rng.random()
+        if roll < 0.9:
+            return self.rng.choice(DATA_REGS)
+        return self.rng.choice((ONE_REG, BASE, 15))
+
+    def constant(self):
+        rng = self.rng
+        kind = rng.randrange(4)
+        if kind == 0:
+            return 0
+        if kind == 1:
+            return rng.randrange(16)
+        if kind == 2:
+            return (-rng.randrange(1, 16)) & 0xFFFFFFFF
+        return rng.getrandbits(32)
+
+    def data_processing(self):
+        rng = self.rng
+        shift, shamt = rng.randrange(4), rng.randrange(32)
+        if rng.random() < 0.15:
+            return _dp(_CMP, 0, self._source(), self._source(), shift, shamt)
+        return _dp(rng.choice(_WRITING), rng.choice(DATA_REGS), self._source(), self._source(), shift, shamt)
+
+    def memory(self):
+        rng = self.rng
+        if self.window >= 4 and rng.random() < 0.5:
+            name = "STR" if rng.random() < 0.5 else "LDR"
+            return _mem(name, rng.choice(DATA_REGS), FAR_BASE, rng.randrange(0, self.window - 3, 4))
+        if rng.random() < 0.5:
+            return _mem("STR", rng.choice(DATA_REGS), BASE, rng.randrange(SCRATCH, IMAGE_SIZE, 4))
+        return _mem("LDR", rng.choice(DATA_REGS), BASE, rng.randrange(POOL + 8, IMAGE_SIZE, 4))
+
+    def straight(self):
+        return self.memory() if self.rng.random() < 0.2 else self.data_processing()
+
+    def emit(self, word):
+        self.words.append(word)
+
+    def forward_branch(self, room):
+        """Branch over 0..3 straight-line instructions.
+
+        Conditional branches often follow a CMP, sometimes of a register with
+        itself, so that equal, signed and unsigned outcomes all come up.
+        """
+        rng = self.rng
+        cond = rng.choice(_CONDS)
+        kind = rng.choice(tuple(BRANCH_KINDS)) if cond == "AL" else "B"
+        if cond != "AL" and room >= 3 and rng.random() < 0.5:
+            rn = self._source()
+            self.emit(_dp(_CMP, 0, rn, rn if rng.random() < 0.3 else self._source()))
+            room -= 1
+        skipped = rng.randrange(min(3, room - 1) + 1)
+        self.emit(_branch(self.pc + 4 * (skipped + 1), cond, kind))
+        for _ in range(skipped):
+            self.emit(self.straight())
+
+    def far_round_trip(self, room):
+        """Store to the far window and load the word back 0..2 instructions later."""
+        rng = self.rng
+        offset = rng.randrange(0, self.window - 3, 4)
+        self.emit(_mem("STR", rng.choice(DATA_REGS), FAR_BASE, offset))
+        for _ in range(rng.randrange(min(2, room - 2) + 1)):
+            self.emit(self.straight())
+        self.emit(_mem("LDR", rng.choice(DATA_REGS), FAR_BASE, offset))
+
+    def loop(self, room):
+        """Counted loop of 3 + body words."""
+        body = self.rng.randrange(1, min(6, room - 4) + 1)
+        self.emit(_mem("LDR", COUNTER, BASE, COUNT))
+        start = self.pc
+        for _ in range(body):
+            self.emit(self.straight())
+        self.emit(_dp(_SUB, COUNTER, COUNTER, ONE_REG))
+        self.emit(_branch(start, "NE"))
+
+    def program(self):
+        rng = self.rng
+        pool = [1, rng.randrange(1, 5), self.far] + [self.constant() for _ in range((IMAGE_SIZE - FAR - 4) // 4)]
+
+        self.emit(_mem("LDR", ONE_REG, BASE, ONE))
+        self.emit(_mem("LDR", FAR_BASE, BASE, FAR))
+        for reg in rng.sample(DATA_REGS, 6):
+            self.emit(_mem("LDR", reg, BASE, rng.randrange(POOL + 8, IMAGE_SIZE, 4)))
+
+        last = CODE_END // 4 - 1  # the halt loop
+        while len(self.words) < last:
+            room = last - len(self.words)
+            roll = rng.random()
+            if roll < 0.1 and room >= 5:
+                self.loop(room)
+            elif roll < 0.25 and room >= 2:
+                self.forward_branch(room)
+            elif roll < 0.35 and room >= 2 and self.window >= 4:
+                self.far_round_trip(room)
+            else:
+                self.emit(self.straight())
+        self.emit(_branch(self.pc))
+
+        image = bytearray()
+        for word in self.words + pool:
+            image += word.to_bytes(4, "little")
+        return bytes(image)
+
+
+def generate(seed, mem_size=MEM_SIZE):
+    """Memory image of the random program for ``seed`` in a ``mem_size``-byte memory."""
+    return Generator(seed, mem_size).program()
+
+
+def main(argv=None):
+    import argparse
+
+    from testbench.disasm import disassemble
+
+    parser = argparse.ArgumentParser(description="Write random program images.")
+    parser.add_argument("seed", type=int)
+    parser.add_argument("-n", "--count", type=int, default=1, help="programs for seeds SEED, SEED+1, ...")
+    parser.add_argument("-m", "--mem-size", type=lambda text: int(text, 0), default=MEM_SIZE,
+                        help="bytes of Data_memory, its DEPTH")
+    parser.add_argument("-o", "--output", default=".", help="directory for rand_<seed>.txt")
+    parser.add_argument("-l", "--list", action="store_true", help="print the code of each program")
+    args = parser.parse_args(argv)
+
+    os.makedirs(args.output, exist_ok=True)
+    for seed in range(args.seed, args.seed + args.count):
+        image = generate(seed, args.mem_size)
+        with open(os.path.join(args.output, f"rand_{seed}.txt"), "w") as f:
+            f.write(format_image(image))
+        if args.list:
+            print(f"; seed {seed}")
+            for address in range(0, CODE_END, 4):
+                word = int.from_bytes(image[address:address + 4], "little")
+                print(f"{address:3}: {word:08X}  {disassemble(word)}")
+
+
+if __name__ == "__main__":
+    main()
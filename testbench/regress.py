@@ -0,0 +1,250 @@
+"""Parallel regression over every cocotb test of the processor.
+
+Usage::
+
+    python -m testbench.regress [-j JOBS] [-o REPORT] [NAME ...] [VAR=value ...]
+
+Every directory holding a cocotb ``Makefile`` is a job, and so is every
+program in ``programs/``: those are assembled and run by ``PROGRAM_TEST``
+until their halt loop. The shared simulation image (see ``testbench/build.py``)
+is compiled once up front; then each job is its own ``make`` process running in a
+private work directory with its results file, ``build/regression/<job>/``,
+so the wall time approaches that of the slowest test. ``NAME`` arguments select jobs by name, ``VAR=value``
+arguments are passed to every ``make`` (e.g. ``SIM=verilator``).
+``--random N`` adds N programs from ``testbench/randgen.py``, for seeds
+``--seed``, ``--seed + 1``, ...
+
+``--coverage`` has every job record its functional coverage (see
+``testbench/coverage.py``) and merges the files into ``coverage.bin`` next
+to the report.
+
+The per-job ``results.xml`` files are merged into one JUnit report, one
+``testsuite`` per job, keeping cocotb's ``sim_time_ns`` and ``ratio_time``.
+"""
+
+import os
+import shutil
+import subprocess
+import sys
+import time
+import xml.etree.ElementTree as ET
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+from testbench import build, coverage
+from testbench.asm import assemble_file, write_image
+from testbench.randgen import generate
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# test directory that runs the programs in programs/, not a job by itself
+PROGRAM_TEST = "PROGRAM_TEST"
+OUT_DIR = os.path.join(ROOT, "build", "regression")
+
+# ``program`` is the assembly source or image for PROGRAM_TEST jobs, None for test directories
+Job = namedtuple("Job", "name directory program")
+JobResult = namedtuple("JobResult", "job returncode wall_time results log")
+
+
+def _is_cocotb_dir(path):
+    makefile = os.path.join(path, "Makefile")
+    if not os.path.isfile(makefile):
+        return False
+    with open(makefile) as f:
+        text = f.read()
+    # the unit tests reach cocotb through testbench/unit.mk
+    return "cocotb-config" in text or "unit.mk" in text
+
+
+def discover(root=ROOT):
+    """Return the test-directory jobs followed by the program jobs."""
+    jobs = []
+    for name in sorted(os.listdir(root)):
+        path = os.path.join(root, name)
+        if name != PROGRAM_TEST and _is_cocotb_dir(path):
+            jobs.append(Job(name, path, None))
+    programs = os.path.join(root, "programs")
+    if os.path.isdir(programs):
+        for name in sorted(os.listdir(programs)):
+            stem, ext = os.path.splitext(name)
+            if ext == ".s":
+                jobs.append(Job("programs." + stem, os.path.join(root, PROGRAM_TEST), os.path.join(programs, name)))
+    return jobs
+
+
+def _make_variables(job, names, make_vars=()):
+    """Values of ``names`` as the Makefile of ``job`` computes them."""
+    command = [
+        "make", "-s", "--no-print-directory", "-f", os.path.join(job.directory, "Makefile"),
+        "--eval", "print-%: ; @echo $($*)", *("print-" + name for name in names), *make_vars,
+    ]
+    lines = subprocess.run(command, cwd=job.directory, capture_output=True, text=True).stdout.splitlines()
+    # a Makefile that fails to parse leaves the values empty
+    return lines[-len(names):] if len(lines) >= len(names) else [""] * len(names)
+
+
+def compile_images(jobs, out_dir=OUT_DIR, make_vars=()):
+    """Build every distinct simulation image the jobs use, one at a time.
+
+    Jobs compiled the same way share a ``SIM_BUILD``; building it here keeps
+    the parallel jobs from elaborating the same image concurrently.
+    """
+    targets = {}
+    for job in {job.directory: job for job in jobs}.values():
+        sim, sim_build = _make_variables(job, ("SIM", "SIM_BUILD"), make_vars)
+        if sim in build.IMAGES:
+            targets.setdefault(build.image(sim_build, sim), job)
+    os.makedirs(out_dir, exist_ok=True)
+    with open(os.path.join(out_dir, "compile.log"), "w") as f:
+        for target, job in targets.items():
+            subprocess.call(["make", "-f", os.path.join(job.directory, "Makefile"), target, *make_vars],
+                            cwd=job.directory, stdout=f, stderr=subprocess.STDOUT)
+
+
+def random_jobs(count, seed, root=ROOT, out_dir=OUT_DIR):
+    """PROGRAM_TEST jobs for ``count`` random programs starting at ``seed``."""
+    directory = os.path.join(out_dir, "random")
+    os.makedirs(directory, exist_ok=True)
+    jobs = []
+    for seed in range(seed, seed + count):
+        image = os.path.join(directory, f"rand_{seed}.txt")
+        write_image(generate(seed), image)
+        jobs.append(Job(f"random.{seed}", os.path.join(root, PROGRAM_TEST), image))
+    return jobs
+
+
+def coverage_file(result):
+    """Coverage file a job run with ``coverage=True`` leaves in its work directory."""
+    return os.path.join(os.path.dirname(result.results), "coverage.bin")
+
+
+def run_job(job, out_dir=OUT_DIR, make_vars=(), coverage=False):
+    """Run one job to completion in its own work directory."""
+    work = os.path.join(out_dir, job.name)
+    shutil.rmtree(work, ignore_errors=True)
+    os.makedirs(work)
+    results = os.path.join(work, "results.xml")
+    log = os.path.join(work, "make.log")
+
+    # every job runs in its work directory, so files a test writes relative to
+    # its working directory (waves, traces) stay out of the source tree
+    plusargs = []
+    if job.program is None:
+        image = os.path.join(job.directory, "mem_data.txt")
+        if os.path.exists(image):
+            plusargs.append("+MEM_FILE=" + image)
+    else:
+        # the memories load the image named by +MEM_FILE, the shared build is reused as is;
+        # PROGRAM_TEST leaves the performance counters of the run in +PERF_FILE
+        image = assemble_file(job.program) if job.program.endswith(".s") else job.program
+        plusargs += ["+MEM_FILE=" + image, "+PERF_FILE=" + os.path.join(work, "perf.json")]
+    if coverage:
+        plusargs.append("+COVERAGE_FILE=" + os.path.join(work, "coverage.bin"))
+    if plusargs:
+        plusargs += [var.partition("=")[2] for var in make_vars if var.startswith("PLUSARGS=")]
+        make_vars = [var for var in make_vars if not var.startswith("PLUSARGS=")]
+        make_vars.append("PLUSARGS=" + " ".join(plusargs))
+
+    command = [
+        "make", "-f", os.path.join(job.directory, "Makefile"),
+        "COCOTB_RESULTS_FILE=" + results,
+        *make_vars,
+    ]
+    start = time.monotonic()
+    with open(log, "w") as f:
+        returncode = subprocess.call(command, cwd=work, stdout=f, stderr=subprocess.STDOUT)
+    return JobResult(job, returncode, time.monotonic() - start, results, log)
+
+
+def _testcases(result):
+    """Test cases of a job, with a synthetic failure if the job broke down."""
+    cases = []
+    properties = []
+    if os.path.exists(result.results):
+        for suite in ET.parse(result.results).getroot().iter("testsuite"):
+            properties.extend(suite.findall("property"))
+            cases.extend(suite.findall("testcase"))
+    if result.returncode != 0 or not cases:
+        case = ET.Element("testcase", name=result.job.name, classname="make",
+                          time=repr(result.wall_time))
+        ET.SubElement(case, "failure", message=f"make exited with {result.returncode}, see {result.log}")
+        cases.append(case)
+    return properties, cases
+
+
+def _failed(case):
+    return case.find("failure") is not None or case.find("error") is not None
+
+
+def merge(results, path):
+    """Write one JUnit report for all ``results``; return the failed test cases."""
+    root = ET.Element("testsuites", name="regression")
+    failed = []
+    for result in results:
+        properties, cases = _testcases(result)
+        failures = [case for case in cases if _failed(case)]
+        failed.extend((result, case) for case in failures)
+        suite = ET.SubElement(root, "testsuite", name=result.job.name, package=result.job.name,
+                              tests=str(len(cases)), failures=str(len(failures)),
+                              time=repr(result.wall_time))
+        suite.extend(properties)
+        suite.extend(cases)
+    ET.indent(root)
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    ET.ElementTree(root).write(path, encoding="UTF-8", xml_declaration=True)
+    return failed
+
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Run all cocotb tests in parallel.")
+    parser.add_argument("args", nargs="*", metavar="NAME|VAR=value")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count())
+    parser.add_argument("-o", "--output", default=os.path.join(OUT_DIR, "results.xml"))
+    parser.add_argument("-r", "--random", type=int, default=0, metavar="N", help="add N random programs")
+    parser.add_argument("-s", "--seed", type=int, default=0, help="seed of the first random program")
+    parser.add_argument("-l", "--list", action="store_true", help="list the jobs and exit")
+    parser.add_argument("-c", "--coverage", action="store_true",
+                        help="collect functional coverage and merge it into coverage.bin next to the report")
+    args = parser.parse_intermixed_args(argv)
+
+    make_vars = [arg for arg in args.args if "=" in arg]
+    names = [arg for arg in args.args if "=" not in arg]
+    jobs = discover()
+    if names:
+        unknown = set(names) - {job.name for job in jobs}
+        if unknown:
+            parser.error("unknown job(s): " + ", ".join(sorted(unknown)))
+        jobs = [job for job in jobs if job.name in names]
+    jobs += random_jobs(args.random, args.seed)
+    if args.list:
+        for job in jobs:
+            print(job.name)
+        return 0
+
+    start = time.monotonic()
+    compile_images(jobs, make_vars=make_vars)
+    # each job is a separate make/simulator process, threads only wait on them
+    with ThreadPoolExecutor(max_workers=max(1, args.jobs)) as pool:
+        results = []
+        for result in pool.map(lambda job: run_job(job, make_vars=make_vars, coverage=args.coverage), jobs):
+            status = "ok" if result.returncode == 0 else f"make exited with {result.returncode}"
+            print(f"{result.job.name:<32} {result.wall_time:7.1f}s  {status}")
+            results.append(result)
+
+    failed = merge(results, args.output)
+    for result, case in failed:
+        print(f"FAIL {result.job.name}: {case.get('name')} (log: {result.log})")
+    if args.coverage:
+        merged = os.path.join(os.path.dirname(os.path.abspath(args.output)), "coverage.bin")
+        files = [path for path in map(coverage_file, results) if os.path.exists(path)]
+        total = coverage.merge_files(files)
+        total.save(merged)
+        print(total.report("none"))
+        print(f"coverage of {len(files)} jobs: {merged}, missed bins: python -m testbench.coverage {merged}")
+    print(f"{len(jobs)} jobs, {len(failed)} failures in {time.monotonic() - start:.1f}s; report: {args.output}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,54 @@
+"""One per-cycle wake-up shared by everything the testbenches sample per cycle.
+
+Every coroutine waiting on its own ``FallingEdge`` costs a trip into Python
+per clock cycle, so the trace, the control table check, the coverage of the
+controller states and the wave window would each add one. They register a
+callback with a single ``CycleSampler`` instead::
+
+    sampler = CycleSampler(dut)
+    trace.start(sampler)
+    ControlChecker(dut).attach(stepper, sampler)
+
+The sampler wakes once per falling clock edge, where the signals of the
+current state are stable, reads ``main.ctrl_vector`` once and calls every
+callback with the cycle number and that value (None while a bit is X/Z).
+``control.VECTOR_SIGNALS`` locates the signals of ``main`` packed into it.
+"""
+
+import cocotb
+from cocotb.triggers import FallingEdge
+
+
+class CycleSampler:
+    """Call ``callback(cycle, ctrl_vector)`` at every falling clock edge."""
+
+    def __init__(self, dut):
+        self.dut = dut
+        self.cycles = 0
+        self._callbacks = ()
+        self._task = None
+
+    def add(self, callback):
+        """Call ``callback`` from the next cycle on; starts the sampling."""
+        self._callbacks += (callback,)
+        if self._task is None:
+            self._task = cocotb.start_soon(self._sample())
+        return callback
+
+    def remove(self, callback):
+        """Stop calling ``callback``; the sampling ends with the last one."""
+        self._callbacks = tuple(registered for registered in self._callbacks if registered != callback)
+
+    async def _sample(self):
+        edge = FallingEdge(self.dut.clk)
+        handle = self.dut.ctrl_vector
+        while self._callbacks:
+            await edge
+            self.cycles += 1
+            try:
+                vector = int(handle.value)
+            except ValueError:
+                vector = None
+            for callback in self._callbacks:
+                callback(self.cycles, vector)
+        self._task = None
@@ -0,0 +1,38 @@
+# Shared compiled simulation image. Include after SIM, VERILOG_SOURCES,
+# TOPLEVEL and the time unit are set and before cocotb's Makefile.sim.
+#
+# SIM_BUILD is keyed by the content of the sources and the compile settings,
+# so all tests compiled the same way reuse one image under build/sim/ and it
+# is only rebuilt when a source file actually changes.
+
+# SIM=icarus (the default of the test Makefiles) or SIM=verilator. The sources
+# are lint-clean under Verilator's -Wall, which keeps them that way.
+ifeq ($(SIM),verilator)
+COMPILE_ARGS += -Wall
+endif
+
+# FAST_SIM=1 swaps in the behavioural register file and memory read, same
+# cycle behaviour with fewer simulator events; python -m testbench.equiv
+# checks that. It only pays off outside cocotb: python -m testbench.bench
+# --native SIM=verilator runs about 15% faster on the multicycle core and 11%
+# on the pipeline. Under cocotb the Python clock sets the rate and it has no
+# measurable effect. Icarus has not been measured.
+ifeq ($(FAST_SIM),1)
+COMPILE_ARGS += -DFAST_SIM
+endif
+
+# PIPELINED=1 elaborates main with the five-stage pipeline; unit tests of
+# other toplevels are the same either way
+ifeq ($(PIPELINED)$(TOPLEVEL),1main)
+ifeq ($(SIM),verilator)
+COMPILE_ARGS += -GPIPELINED=1
+else
+COMPILE_ARGS += -Pmain.PIPELINED=1
+endif
+endif
+
+SIM_BUILD_KEY = $(TOPLEVEL) $(COCOTB_HDL_TIMEUNIT)/$(COCOTB_HDL_TIMEPRECISION) $(WAVES) $(COMPILE_ARGS) $(EXTRA_ARGS)
+
+ifndef SIM_BUILD
+SIM_BUILD := $(shell python3 $(dir $(lastword $(MAKEFILE_LIST)))build.py "$(SIM)" "$(SIM_BUILD_KEY)" $(VERILOG_SOURCES))
+endif
@@ -0,0 +1,44 @@
+"""Instruction-granular stepping for the processor testbenches."""
+
+import math
+
+from cocotb.triggers import RisingEdge
+from cocotb.utils import get_sim_time
+
+
+class InstructionStepper:
+    """Advance the simulation one retired instruction at a time.
+
+    ``main.retire`` rises at the falling clock edge of the last FSM state of
+    every instruction, so each step costs a single trigger no matter how many
+    cycles the instruction takes. When ``step`` returns, the signals of that
+    last state are stable: they are the values the retiring clock edge commits.
+
+    Callables in ``monitors`` are invoked with the stepper after every
+    retirement, sharing the same wake-up instead of adding their own triggers.
+
+    ``cycles`` counts the clock cycles up to the end of the last retired
+    instruction, taken from the simulation time so that no per-cycle trigger
+    is needed. Create the stepper at the clock edge that starts the first
+    fetch, with the ``period`` of the clock in ``units``.
+    """
+
+    def __init__(self, dut, period=10, units="us"):
+        self.dut = dut
+        self.retired = 0
+        self.cycles = 0
+        self.monitors = []
+        self._retire = RisingEdge(dut.retire)
+        self._period = period
+        self._units = units
+        self._start = get_sim_time(units)
+
+    async def step(self, count=1):
+        """Wait until ``count`` more instructions have retired."""
+        for _ in range(count):
+            await self._retire
+            self.retired += 1
+            # woken half way through the last cycle of the instruction
+            self.cycles = math.ceil((get_sim_time(self._units) - self._start) / self._period)
+            for monitor in self.monitors:
+                monitor(self)
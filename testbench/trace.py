@@ -0,0 +1,158 @@
+"""Bounded per-cycle signal history for the processor testbenches.
+
+Formatting ~25 signals on every cycle dominated the run time of the old
+``print_wires``/``print_ctrl_signals`` dumps. ``CycleTrace`` instead keeps the
+last ``depth`` cycles as raw integers and only formats them when a test fails
+or when ``dump`` is called explicitly. With ``TB_TRACE_FILE`` set, every cycle
+is also kept in a binary trace for NumPy (see ``testbench/tracefile.py``).
+"""
+
+import contextlib
+import os
+import sys
+from collections import deque
+
+from testbench.control import VECTOR_SIGNALS
+from testbench.disasm import disassemble
+from testbench.sampler import CycleSampler
+
+# Nothing is recorded or printed
+QUIET = 0
+# The last ``depth`` cycles are kept and written out on failure (default)
+TRACE = 1
+# Every cycle is also printed as it happens
+VERBOSE = 2
+
+# (label, signal in main, width in bits) in the order they are printed
+WIRES = (
+    ("PC", "PC", 32),
+    ("State", "state_out", 3),
+    ("INSTR", "INSTR", 32),
+    ("RA1", "RA1", 4),
+    ("RA2", "RA2", 4),
+    ("RD1", "RD1", 32),
+    ("RD2", "RD2", 32),
+    ("SrcA", "SrcA", 32),
+    ("SrcB", "SrcB", 32),
+    ("ExtImm", "ExtImm", 32),
+    ("ALU OUT", "ALU_OUT", 32),
+    ("RESULT", "RESULT", 32),
+)
+
+CTRL_SIGNALS = (
+    ("PCWrite", "PCWrite_out", 1),
+    ("AdrSrc", "AdrSrc_out", 1),
+    ("MemWrite", "MemWrite_out", 1),
+    ("IRWrite", "IRWrite_out", 1),
+    ("RegWrite", "RegWrite_out", 1),
+    ("ImmSrc", "ImmSrc_out", 2),
+    ("RegSrc", "RegSrc_out", 2),
+    ("ALUSrcA", "ALUSrcA_out", 1),
+    ("ALUSrcB", "ALUSrcB_out", 2),
+    ("ALUControl", "ALUControl_out", 4),
+    ("ResultSrc", "ResultSrc_out", 2),
+    ("NZCV", "flags_out", 4),
+    ("ENABLE NZCV", "Z_enable_out", 1),
+    ("Retire", "InstrDone_out", 1),
+)
+
+SIGNALS = WIRES + CTRL_SIGNALS
+
+# Stored in place of signals that are X or Z
+UNRESOLVED = -1
+
+
+def default_verbosity():
+    """Verbosity requested through the ``TB_VERBOSITY`` environment variable."""
+    return int(os.environ.get("TB_VERBOSITY", TRACE))
+
+
+def format_cycle(cycle, values):
+    """Render one recorded cycle as a single line."""
+    fields = []
+    for (label, _, width), value in zip(SIGNALS, values):
+        if value == UNRESOLVED:
+            text = "x"
+        elif width == 1:
+            text = str(value)
+        else:
+            text = f"{value:0{(width + 3) // 4}X}"
+            if label == "INSTR":
+                text += f" ({disassemble(value)})"
+        fields.append(f"{label}={text}")
+    return f"[Cycle {cycle}] " + " ".join(fields)
+
+
+class CycleTrace:
+    """Ring buffer of the last ``depth`` cycles of ``SIGNALS``.
+
+    Cycles are sampled by a ``CycleSampler`` at the falling clock edge, where
+    every signal of the current FSM state is stable; the signals packed into
+    ``main.ctrl_vector`` are taken from its single read. ``record`` names a
+    ``.npy``/``.npz`` file that receives every cycle, written when
+    ``dump_on_failure`` exits or by ``save``; it defaults to ``TB_TRACE_FILE``.
+    """
+
+    def __init__(self, dut, depth=64, verbosity=None, record=None):
+        self.dut = dut
+        self.verbosity = default_verbosity() if verbosity is None else verbosity
+        self.cycles = 0
+        self.history = deque(maxlen=depth)
+        self._handles = [getattr(dut, name) for _, name, _ in SIGNALS]
+        self._fields = [VECTOR_SIGNALS.get(name) for _, name, _ in SIGNALS]
+        self.record = os.environ.get("TB_TRACE_FILE") if record is None else record
+        self.recorder = None
+        if self.record:
+            # NumPy is only needed when recording
+            from testbench.tracefile import TraceRecorder
+            self.recorder = TraceRecorder()
+
+    def start(self, sampler=None):
+        """Sample every cycle of ``sampler``, or on its own without one.
+
+        A no-op when ``QUIET`` and not recording.
+        """
+        if self.verbosity > QUIET or self.recorder is not None:
+            sampler = CycleSampler(self.dut) if sampler is None else sampler
+            sampler.add(self._sample)
+
+    def _sample(self, cycle, vector):
+        self.cycles = cycle
+        values = []
+        for handle, field in zip(self._handles, self._fields):
+            if field is not None and vector is not None:
+                values.append((vector >> field[0]) & field[1])
+                continue
+            try:
+                values.append(int(handle.value))
+            except ValueError:
+                values.append(UNRESOLVED)
+        self.history.append((cycle, values))
+        if self.recorder is not None:
+            self.recorder.append(cycle, values)
+        if self.verbosity >= VERBOSE:
+            print(format_cycle(cycle, values))
+
+    def dump(self, file=None):
+        """Write the recorded cycles, oldest first."""
+        file = sys.stdout if file is None else file
+        print(f"--- last {len(self.history)} cycles ---", file=file)
+        for cycle, values in self.history:
+            print(format_cycle(cycle, values), file=file)
+
+    def save(self, path=None):
+        """Write the binary trace to ``path`` or ``record``; a no-op when not recording."""
+        if self.recorder is not None:
+            self.recorder.save(path or self.record)
+
+    @contextlib.contextmanager
+    def dump_on_failure(self):
+        """Dump the recorded cycles if the enclosed block raises; save the binary trace."""
+        try:
+            yield self
+        except Exception:
+            if self.history:
+                self.dump()
+            raise
+        finally:
+            self.save()
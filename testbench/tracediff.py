@@ -0,0 +1,100 @@
+"""Compare two binary cycle traces of the same program.
+
+Traces recorded by ``CycleTrace`` (``TB_TRACE_FILE``, see
+``testbench/tracefile.py``) under two RTL revisions are compared column by
+column, a chunk of rows at a time, so multi-million-cycle traces take
+seconds and bounded memory. The result is the first row where any signal
+differs and, per signal, the number of rows that differ::
+
+    python -m testbench.tracediff OLD.npy NEW.npy [-r] [-f FIELD ...] [-C ROWS]
+
+A signal that is X/Z in one trace and not in the other differs as well.
+``--retired`` compares the retirement trace instead, the rows where
+``InstrDone`` is 1, which stays aligned when a change only alters the
+number of cycles per instruction.
+"""
+
+import sys
+from collections import namedtuple
+
+import numpy as np
+
+from testbench.trace import format_cycle
+from testbench.tracefile import FIELDS, load, rows
+
+CHUNK = 1 << 20
+
+# first: row index of the first divergence or None; fields: signals differing there;
+# counts: {field: rows that differ} over the compared rows
+TraceDiff = namedtuple("TraceDiff", "compared first fields counts")
+
+
+def retired(trace):
+    """Rows of ``trace`` at which an instruction retires."""
+    return trace[trace["InstrDone"] == 1]
+
+
+def diff(a, b, fields=FIELDS, chunk=CHUNK):
+    """Compare ``fields`` of the common prefix of traces ``a`` and ``b``."""
+    compared = min(len(a), len(b))
+    bits = [FIELDS.index(field) for field in fields]
+    counts = dict.fromkeys(fields, 0)
+    first = None
+    first_fields = ()
+    for start in range(0, compared, chunk):
+        a_rows = a[start:start + chunk]
+        b_rows = b[start:start + chunk]
+        resolved = a_rows["unresolved"] ^ b_rows["unresolved"]
+        masks = {}
+        for field, bit in zip(fields, bits):
+            mask = (a_rows[field] != b_rows[field]) | (resolved >> np.uint32(bit) & np.uint32(1)).astype(bool)
+            counts[field] += int(np.count_nonzero(mask))
+            masks[field] = mask
+        if first is None:
+            hits = [int(np.argmax(mask)) for mask in masks.values() if mask.any()]
+            if hits:
+                row = min(hits)
+                first = start + row
+                first_fields = tuple(field for field, mask in masks.items() if mask[row])
+    return TraceDiff(compared, first, first_fields, counts)
+
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Find where two cycle traces diverge.")
+    parser.add_argument("old")
+    parser.add_argument("new")
+    parser.add_argument("-r", "--retired", action="store_true", help="compare retiring rows only")
+    parser.add_argument("-f", "--field", action="append", choices=FIELDS, help="compare only these signals")
+    parser.add_argument("-C", "--context", type=int, default=3, help="rows shown around the divergence")
+    args = parser.parse_args(argv)
+
+    old, new = load(args.old), load(args.new)
+    if args.retired:
+        old, new = retired(old), retired(new)
+    result = diff(old, new, args.field or FIELDS)
+    kind = "retirements" if args.retired else "cycles"
+    print(f"old: {len(old)} {kind}, new: {len(new)} {kind}, compared {result.compared}")
+
+    if result.first is None:
+        print("no divergence" + ("" if len(old) == len(new) else " in the common prefix"))
+        return 0 if len(old) == len(new) else 1
+
+    print(f"first divergence at row {result.first} (cycle {int(old[result.first]['cycle'])}): "
+          f"{', '.join(result.fields)}")
+    lo = max(0, result.first - args.context)
+    hi = result.first + args.context + 1
+    for name, trace in (("old", old), ("new", new)):
+        print(f"--- {name} ---")
+        for cycle, values in rows(trace[lo:hi]):
+            print(format_cycle(cycle, values))
+    print("signal        rows differing")
+    for field, count in sorted(result.counts.items(), key=lambda item: -item[1]):
+        if count:
+            print(f"{field:<12} {count:>14}")
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,135 @@
+"""Binary per-cycle traces as NumPy structured arrays.
+
+``CycleTrace`` fills a ``TraceRecorder`` when ``TB_TRACE_FILE`` names an
+output file (or ``record=`` is passed), one fixed-width row per cycle with
+every signal of ``trace.SIGNALS``. Fields are named after the signals of
+``main`` without their ``_out`` suffix: ``PC``, ``state``, ``INSTR``, ...,
+``MemWrite``, ``flags``, ``Z_enable``. ``cycle`` numbers the rows and bit ``i``
+of ``unresolved`` is set when ``SIGNALS[i]`` was X/Z (its field then holds
+0). A row is 61 bytes, so a million cycles take about 60 MB.
+
+``.npy`` files are memory-mapped by ``load``, so queries only touch the
+columns they use::
+
+    trace = tracefile.load("trace.npy")
+    stores = trace[trace["MemWrite"] == 1]       # every cycle with MemWrite=1
+    tracefile.where(trace, state=3, MemWrite=1)  # the same, by field values
+
+``.npz`` files are compressed and are read into memory instead. Usage::
+
+    python -m testbench.tracefile TRACE [FIELD=VALUE ...] [-n LINES]
+"""
+
+import numpy as np
+
+from testbench.trace import SIGNALS, UNRESOLVED, format_cycle
+
+
+def _field(name):
+    return name[:-len("_out")] if name.endswith("_out") else name
+
+
+def _dtype(width):
+    for dtype, bits in ((np.uint8, 8), (np.uint16, 16), (np.uint32, 32)):
+        if width <= bits:
+            return dtype
+    return np.uint64
+
+
+FIELDS = tuple(_field(name) for _, name, _ in SIGNALS)
+
+DTYPE = np.dtype(
+    [("cycle", np.uint32)]
+    + [(field, _dtype(width)) for field, (_, _, width) in zip(FIELDS, SIGNALS)]
+    + [("unresolved", np.uint32)]
+)
+
+
+class TraceRecorder:
+    """Preallocated structured array of cycles, doubled when it fills up."""
+
+    def __init__(self, capacity=1 << 16):
+        self.array = np.zeros(capacity, DTYPE)
+        self.size = 0
+
+    def append(self, cycle, values):
+        """Add one cycle of ``SIGNALS`` values as ``CycleTrace`` samples them."""
+        if self.size == len(self.array):
+            grown = np.zeros(2 * len(self.array), DTYPE)
+            grown[:self.size] = self.array
+            self.array = grown
+        unresolved = 0
+        row = [cycle]
+        for index, value in enumerate(values):
+            if value == UNRESOLVED:
+                unresolved |= 1 << index
+                value = 0
+            row.append(value)
+        row.append(unresolved)
+        self.array[self.size] = tuple(row)
+        self.size += 1
+
+    @property
+    def trace(self):
+        """The recorded rows, without the unused capacity."""
+        return self.array[:self.size]
+
+    def save(self, path):
+        """Write ``.npz`` compressed, anything else as a ``.npy`` file."""
+        if path.endswith(".npz"):
+            np.savez_compressed(path, trace=self.trace)
+        else:
+            with open(path, "wb") as f:
+                np.save(f, self.trace)
+
+
+def load(path, mmap=True):
+    """Trace saved by ``TraceRecorder.save``; ``.npy`` files are memory-mapped."""
+    if path.endswith(".npz"):
+        with np.load(path) as archive:
+            return archive["trace"]
+    return np.load(path, mmap_mode="r" if mmap else None)
+
+
+def where(trace, **values):
+    """Rows of ``trace`` whose fields equal ``values``."""
+    mask = np.ones(len(trace), dtype=bool)
+    for field, value in values.items():
+        mask &= trace[field] == value
+    return trace[mask]
+
+
+def rows(trace):
+    """``(cycle, values)`` of each row, with UNRESOLVED as ``CycleTrace`` records it."""
+    for row in trace:
+        unresolved = int(row["unresolved"])
+        values = [UNRESOLVED if unresolved >> index & 1 else int(row[field])
+                  for index, field in enumerate(FIELDS)]
+        yield int(row["cycle"]), values
+
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Query a binary cycle trace.")
+    parser.add_argument("trace")
+    parser.add_argument("conditions", nargs="*", metavar="FIELD=VALUE")
+    parser.add_argument("-n", "--lines", type=int, default=20, help="matching cycles to print")
+    args = parser.parse_args(argv)
+
+    values = {}
+    for condition in args.conditions:
+        field, _, value = condition.partition("=")
+        if field not in DTYPE.names:
+            parser.error(f"unknown field {field!r}, expected one of {', '.join(DTYPE.names)}")
+        values[field] = int(value, 0)
+
+    trace = load(args.trace)
+    matches = where(trace, **values)
+    print(f"{len(matches)} of {len(trace)} cycles match")
+    for cycle, row in rows(matches[:args.lines]):
+        print(format_cycle(cycle, row))
+
+
+if __name__ == "__main__":
+    main()
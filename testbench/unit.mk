@@ -0,0 +1,26 @@
+# Unit test of one combinational block, driven in batches by Vector_driver.v.
+# Include from the test Makefile after TB_DIR, UNIT (the module, in UNIT.v
+# one level up), TOPLEVEL (its wrapper, in TOPLEVEL.v next to the Makefile)
+# and MODULE are set. See testbench/vectors.py.
+
+SIM ?= icarus
+TOPLEVEL_LANG ?=verilog
+
+VERILOG_SOURCES = $(TB_DIR)/../$(UNIT).v $(TB_DIR)/$(TOPLEVEL).v $(TB_DIR)/../testbench/Vector_driver.v
+
+# the test module lives next to the test Makefile, the shared helpers one level up
+export PYTHONPATH := $(TB_DIR):$(TB_DIR)/..:$(PYTHONPATH)
+
+COCOTB_HDL_TIMEUNIT=1us
+COCOTB_HDL_TIMEPRECISION=1us
+
+# the driver steps the vectors with delays of its own
+ifeq ($(SIM),verilator)
+COMPILE_ARGS += --timing
+endif
+
+# compile once into build/sim/, shared with the other test directories
+include $(TB_DIR)/../testbench/sim.mk
+
+# include cocotb's make rules to take care of the simulator setup
+include $(shell cocotb-config --makefiles)/Makefile.sim
@@ -0,0 +1,180 @@
+"""Batched stimulus for the combinational blocks, checked in bulk.
+
+The unit tests compute every input vector and the expected outputs up front
+as NumPy arrays. Their toplevel is a small ``<UNIT>_BENCH.v`` wrapper that
+packs the inputs and outputs of the block into one stimulus and one response
+word of ``testbench/Vector_driver.v``. ``drive`` writes a whole batch of
+stimuli to a ``$readmemh`` file; the driver applies one per time unit inside
+the simulator and writes the responses back with ``$writememh``. A batch of
+up to ``BATCH`` vectors thus costs Python one file in each direction and a
+single wake-up, and ``compare`` checks all of it at once::
+
+    got = await drive(dut, {"DATA_A": a, "DATA_B": b}, ["OUT"])
+    compare(got, {"OUT": expected}, {"DATA_A": a, "DATA_B": b})
+
+``run_unit`` is the whole test of a block: a sweep over the corner values of
+its inputs, then random vectors over their full width, against a model.
+``TB_VECTORS`` sets the number of random vectors (``default_count``).
+"""
+
+import itertools
+import os
+
+import numpy as np
+from cocotb.triggers import Edge
+
+# random vectors per test
+DEFAULT_COUNT = 1 << 20
+# vectors per batch, the DEPTH of Vector_driver
+BATCH = 1 << 20
+
+_HEX_DIGITS = np.frombuffer(b"0123456789ABCDEF", dtype=np.uint8)
+# value of every hex digit character, 0xFF for x, z and anything else
+_HEX_VALUES = np.full(256, 0xFF, dtype=np.uint8)
+for _value, _digit in enumerate("0123456789abcdef"):
+    _HEX_VALUES[ord(_digit)] = _HEX_VALUES[ord(_digit.upper())] = _value
+
+# stored for the outputs of a vector that came back with X or Z
+UNRESOLVED = np.uint64(0xFFFFFFFFFFFFFFFF)
+
+
+def default_count():
+    """Random vectors per test, ``TB_VECTORS`` or ``DEFAULT_COUNT``."""
+    return int(os.environ.get("TB_VECTORS", str(DEFAULT_COUNT)), 0)
+
+
+def random_words(rng, count, bits=32):
+    """``count`` uniform ``bits``-wide values as uint64."""
+    return rng.integers(0, 1 << bits, size=count, dtype=np.uint64)
+
+
+def _offsets(widths):
+    """Bit offset of each field in a word packing ``widths`` most significant first."""
+    offsets = []
+    offset = sum(widths)
+    for width in widths:
+        offset -= width
+        offsets.append(offset)
+    return offsets
+
+
+def pack(columns, widths):
+    """``$readmemh`` text of the words packing ``columns`` of ``widths`` bits, first one on top."""
+    count = len(columns[0])
+    total = sum(widths)
+    words = [np.zeros(count, dtype=np.uint64) for _ in range((total + 63) // 64)]
+    for column, width, offset in zip(columns, widths, _offsets(widths)):
+        values = np.asarray(column, dtype=np.uint64) & np.uint64((1 << width) - 1)
+        word, shift = divmod(offset, 64)
+        words[word] |= values << np.uint64(shift)
+        if shift + width > 64:
+            words[word + 1] |= values >> np.uint64(64 - shift)
+    digits = (total + 3) // 4
+    text = np.empty((count, digits + 1), dtype=np.uint8)
+    for digit in range(digits):
+        word, shift = divmod(4 * digit, 64)
+        text[:, digits - 1 - digit] = _HEX_DIGITS[(words[word] >> np.uint64(shift)) & np.uint64(0xF)]
+    text[:, digits] = ord("\n")
+    return text.tobytes()
+
+
+def unpack(data, count, widths):
+    """Columns of the ``count`` words of ``widths`` bits in ``$writememh`` text ``data``."""
+    digits = (sum(widths) + 3) // 4
+    if len(data) == count * (digits + 1) and data[digits::digits + 1] == b"\n" * count:
+        # one zero-padded word per line, the usual layout of $writememh
+        text = np.frombuffer(data, dtype=np.uint8).reshape(count, digits + 1)[:, :digits]
+    else:
+        lines = [line.strip() for line in data.splitlines()]
+        lines = [line.rjust(digits, b"0") for line in lines if line and not line.startswith((b"//", b"@"))]
+        if len(lines) != count or any(len(line) != digits for line in lines):
+            raise ValueError(f"expected {count} responses of {digits} hex digits")
+        text = np.frombuffer(b"".join(lines), dtype=np.uint8).reshape(count, digits)
+    values = _HEX_VALUES[text]
+    unresolved = (values == 0xFF).any(axis=1)
+    words = [np.zeros(count, dtype=np.uint64) for _ in range((4 * digits + 63) // 64)]
+    for digit in range(digits):
+        word, shift = divmod(4 * digit, 64)
+        words[word] |= (values[:, digits - 1 - digit].astype(np.uint64) & np.uint64(0xF)) << np.uint64(shift)
+    columns = []
+    for width, offset in zip(widths, _offsets(widths)):
+        word, shift = divmod(offset, 64)
+        column = words[word] >> np.uint64(shift)
+        if shift + width > 64:
+            column |= words[word + 1] << np.uint64(64 - shift)
+        column &= np.uint64((1 << width) - 1)
+        column[unresolved] = UNRESOLVED
+        columns.append(column)
+    return columns
+
+
+async def drive(dut, inputs, outputs, batch=BATCH):
+    """Apply ``inputs`` ({name: array}) through ``dut.driver``, return ``outputs``.
+
+    The names are signals of the wrapper, in the order it packs them.
+    Returns ``{name: uint64 array}`` of every name in ``outputs``.
+    """
+    driver = dut.driver
+    in_widths = [len(getattr(dut, name)) for name in inputs]
+    out_widths = [len(getattr(dut, name)) for name in outputs]
+    columns = [np.asarray(values, dtype=np.uint64) for values in inputs.values()]
+    total = len(columns[0])
+    got = [[] for _ in outputs]
+    for start in range(0, total, batch):
+        count = min(batch, total - start)
+        with open("vectors_in.hex", "wb") as f:
+            f.write(pack([column[start:start + count] for column in columns], in_widths))
+        done = Edge(driver.done)
+        driver.count.value = count
+        driver.start.value = 1
+        await done
+        with open("vectors_out.hex", "rb") as f:
+            data = f.read()
+        for collected, column in zip(got, unpack(data, count, out_widths)):
+            collected.append(column)
+    for name in ("vectors_in.hex", "vectors_out.hex"):
+        os.remove(name)
+    return {name: np.concatenate(collected) for name, collected in zip(outputs, got)}
+
+
+def compare(got, expected, inputs, show=8):
+    """Fail with the first ``show`` vectors where ``got`` differs from ``expected``."""
+    bad = np.zeros(len(next(iter(inputs.values()))), dtype=bool)
+    for name, values in expected.items():
+        bad |= got[name] != np.asarray(values, dtype=np.uint64)
+    failures = np.flatnonzero(bad)
+    if not len(failures):
+        return
+    lines = [f"{len(failures)} of {len(bad)} vectors differ"]
+    for index in failures[:show]:
+        stimulus = " ".join(f"{name}={int(values[index]):#x}" for name, values in inputs.items())
+        diffs = " ".join(f"{name}={int(got[name][index]):#x} (expected {int(values[index]):#x})"
+                         for name, values in expected.items() if got[name][index] != values[index])
+        lines.append(f"  vector {index}: {stimulus}: {diffs}")
+    raise AssertionError("\n".join(lines))
+
+
+async def check(dut, inputs, outputs, model):
+    """Drive ``inputs`` and compare ``outputs`` with ``model(*inputs.values())``."""
+    got = await drive(dut, inputs, outputs)
+    compare(got, model(*inputs.values()), inputs)
+
+
+async def run_unit(dut, sweep, outputs, model, count=None, seed=0):
+    """Check ``model`` on every combination of ``sweep``, then on ``count`` random vectors.
+
+    ``sweep`` maps every input of the wrapper, in its packing order, to the
+    values to combine; the random vectors are uniform over each input's
+    width. ``model`` takes the input arrays in that order and returns
+    ``{output: array}``. ``count`` defaults to ``default_count()``.
+    """
+    rows = list(itertools.product(*sweep.values()))
+    columns = [np.array(column, dtype=np.uint64) for column in zip(*rows)]
+    await check(dut, dict(zip(sweep, columns)), outputs, model)
+    print(f"{len(rows)} swept vectors passed")
+
+    count = default_count() if count is None else count
+    rng = np.random.default_rng(seed)
+    inputs = {name: random_words(rng, count, len(getattr(dut, name))) for name in sweep}
+    await check(dut, inputs, outputs, model)
+    print(f"{count} random vectors passed")
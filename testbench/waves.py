@@ -0,0 +1,209 @@
+"""Windowed VCD waveforms of ``main`` and its ``DP``/``CTRL`` instances.
+
+A full dump of a long program is mostly cycles nobody looks at. ``WaveWindow``
+instead samples every signal of the three scopes into a ring buffer of the
+last ``before`` cycles and only opens a VCD file when it is triggered: by an
+exception leaving ``dump_on_failure``, by ``trigger_pc``/``trigger_cycle`` or
+by an explicit ``trigger``. The buffered cycles are written first, then
+``after`` more cycles are streamed, and the file is closed::
+
+    waves = WaveWindow(dut, before=200, after=20, trigger_pc=0x48)
+    waves.start(sampler)
+    with waves.dump_on_failure():
+        ...
+
+Sampling can be paused and resumed with ``stop``/``start``. Values are taken
+by a ``CycleSampler`` at the falling clock edge, where the design is settled,
+and written at the rising edge that produced them, so the file reads like a
+simulator dump of this single-clock design. The recorder works the same on every simulator and
+needs no recompilation; the VCD opens in GTKWave or Surfer.
+
+The environment selects it for the tests: ``TB_WAVES=N`` keeps N cycles
+before the trigger (unset or 0: off), ``TB_WAVES_AFTER``, ``TB_WAVES_PC`` and
+``TB_WAVES_CYCLE`` set the other arguments and ``TB_WAVES_FILE`` the output,
+``waves.vcd`` by default.
+"""
+
+import contextlib
+import os
+from collections import deque
+
+from cocotb.handle import ModifiableObject
+from cocotb.utils import get_sim_time
+
+from testbench.checker import CORES, pipelined
+from testbench.sampler import CycleSampler
+
+# VCD identifiers are printable ASCII from '!' to '~'
+_ID_CHARS = [chr(c) for c in range(33, 127)]
+
+
+def _identifier(index):
+    chars = []
+    while True:
+        index, digit = divmod(index, len(_ID_CHARS))
+        chars.append(_ID_CHARS[digit])
+        if not index:
+            return "".join(chars)
+
+
+def scopes(dut):
+    """``(name, handle)`` of ``main`` and the ``DP``/``CTRL`` of its core."""
+    core = getattr(dut, CORES[int(pipelined(dut))][0])
+    return (("main", dut), ("DP", core.DP), ("CTRL", core.CTRL))
+
+
+def signals(scope):
+    """Scalars and vectors of ``scope`` by name; memories and integers are left out."""
+    # the window draws its own clock, sampling clk at one edge would show it constant
+    found = [handle for handle in scope if type(handle) is ModifiableObject and handle._name != "clk"]
+    return sorted(found, key=lambda handle: handle._name)
+
+
+class WaveWindow:
+    """Ring buffer of every signal of ``scopes``, written as a VCD window."""
+
+    def __init__(self, dut, before=100, after=10, trigger_pc=None, trigger_cycle=None,
+                 path="waves.vcd", period=10, units="us"):
+        self.dut = dut
+        self.before = before
+        self.after = after
+        self.trigger_pc = trigger_pc
+        self.trigger_cycle = trigger_cycle
+        self.path = path
+        self.cycles = 0
+        self.triggered = None
+        self.history = deque(maxlen=max(1, before))
+        self._period = period
+        self._units = units
+        # the signals are looked up by the first start, disabled windows cost nothing
+        self._scopes = None
+        self._file = None
+        self._last = None
+        self._remaining = 0
+        self._sampler = None
+
+    @classmethod
+    def from_env(cls, dut):
+        """Window configured by the ``TB_WAVES*`` variables; see the module doc."""
+        env = os.environ
+        before = int(env.get("TB_WAVES", "0"))
+        pc = env.get("TB_WAVES_PC")
+        cycle = env.get("TB_WAVES_CYCLE")
+        return cls(dut, before=before, after=int(env.get("TB_WAVES_AFTER", "10")),
+                   trigger_pc=None if pc is None else int(pc, 0),
+                   trigger_cycle=None if cycle is None else int(cycle, 0),
+                   path=env.get("TB_WAVES_FILE", "waves.vcd"))
+
+    @property
+    def enabled(self):
+        return self.before > 0
+
+    def start(self, sampler=None):
+        """Start (or resume) sampling every cycle of ``sampler``; a no-op when not enabled.
+
+        Without a ``sampler`` the window samples on its own.
+        """
+        if self.enabled and self._sampler is None and self.triggered is None:
+            if self._scopes is None:
+                self._scopes = [(name, signals(scope)) for name, scope in scopes(self.dut)]
+                self._handles = [handle for _, handles in self._scopes for handle in handles]
+                self._ids = [_identifier(index) for index in range(len(self._handles) + 1)]
+                self._clk = self._ids.pop()
+            self._sampler = CycleSampler(self.dut) if sampler is None else sampler
+            self._sampler.add(self._sample)
+
+    def stop(self):
+        """Pause sampling; the buffered cycles are kept."""
+        if self._sampler is not None:
+            self._sampler.remove(self._sample)
+            self._sampler = None
+
+    def trigger(self, reason="trigger"):
+        """Write the buffered cycles and stream ``after`` more; only the first call counts."""
+        if not self.enabled or self.triggered is not None:
+            return
+        self.triggered = reason
+        self._open()
+        for sample in self.history:
+            self._write(*sample)
+        self.history.clear()
+        self._remaining = self.after
+        if not self._remaining:
+            self._finish()
+
+    def close(self):
+        """Finish the VCD file and stop sampling."""
+        self.stop()
+        self._finish()
+
+    def _finish(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    @contextlib.contextmanager
+    def dump_on_failure(self):
+        """Trigger if the enclosed block raises; close the file when it exits."""
+        try:
+            yield self
+        except Exception as error:
+            self.trigger(f"failure: {error}".splitlines()[0])
+            raise
+        finally:
+            self.close()
+
+    def _sample(self, cycle, vector):
+        self.cycles += 1
+        values = [handle.value.binstr for handle in self._handles]
+        sample = (round(get_sim_time(self._units)), values)
+        if self._file is not None:
+            self._write(*sample)
+            self._remaining -= 1
+            if self._remaining <= 0:
+                self.close()
+            return
+        self.history.append(sample)
+        if self.cycles == self.trigger_cycle:
+            self.trigger(f"cycle {self.cycles}")
+        elif self.trigger_pc is not None:
+            pc = self.dut.PC.value
+            if pc.is_resolvable and int(pc) == self.trigger_pc:
+                self.trigger(f"PC {self.trigger_pc:#x}")
+        if self.triggered is not None and self._file is None:
+            self.stop()
+
+    def _open(self):
+        f = self._file = open(self.path, "w")
+        f.write(f"$comment {self.triggered} $end\n")
+        f.write(f"$timescale 1{self._units} $end\n")
+        f.write("$scope module main $end\n")
+        f.write(f"$var wire 1 {self._clk} clk $end\n")
+        index = 0
+        for name, handles in self._scopes:
+            if name != "main":
+                f.write(f"$scope module {name} $end\n")
+            for handle in handles:
+                width = len(handle)
+                suffix = f" [{width - 1}:0]" if width > 1 else ""
+                f.write(f"$var wire {width} {self._ids[index]} {handle._name}{suffix} $end\n")
+                index += 1
+            if name != "main":
+                f.write("$upscope $end\n")
+        f.write("$upscope $end\n$enddefinitions $end\n")
+        self._last = [None] * len(self._handles)
+
+    def _write(self, time, values):
+        """Cycle sampled at the falling edge ``time``, changes dated at its rising edge."""
+        f = self._file
+        half = self._period // 2
+        lines = [f"#{time - half}", f"1{self._clk}"]
+        last = self._last
+        ids = self._ids
+        for index, value in enumerate(values):
+            if value != last[index]:
+                last[index] = value
+                lines.append(f"{value}{ids[index]}" if len(value) == 1 else f"b{value} {ids[index]}")
+        lines.append(f"#{time}")
+        lines.append(f"0{self._clk}")
+        f.write("\n".join(lines) + "\n")